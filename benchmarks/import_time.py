@@ -0,0 +1,88 @@
+"""
+Import time of the package, measured in fresh interpreters.
+
+    python benchmarks/import_time.py [--runs 20] [--budget-ms 40]
+
+Exits with an error if the best run is over the budget,
+or if optional subsystems are imported eagerly.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+"""
+Modules, which only optional subsystems need.
+"""
+LAZY_MODULES = (
+    'dataclasses',
+    'datetime',
+    'decimal',
+    'pickle',
+    'random',
+    'uuid',
+    'simple_schema_validator.analyzer',
+    'simple_schema_validator.coercions',
+    'simple_schema_validator.columnar',
+    'simple_schema_validator.diff',
+    'simple_schema_validator.inference',
+    'simple_schema_validator.json_schema',
+    'simple_schema_validator.parser',
+    'simple_schema_validator.stats',
+    'simple_schema_validator.streaming'
+)
+
+MEASURE = '''
+import sys, time
+before = set(sys.modules)
+start = time.perf_counter()
+import simple_schema_validator
+elapsed = time.perf_counter() - start
+print(elapsed)
+print(' '.join(sorted(set(sys.modules) - before)))
+'''
+
+
+def measure():
+    output = subprocess.run(
+        [sys.executable, '-c', MEASURE],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True
+    ).stdout.splitlines()
+
+    return float(output[0]), output[1].split()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--budget-ms', type=float, default=40)
+    args = parser.parse_args()
+
+    timings = []
+
+    for _ in range(args.runs):
+        elapsed, imported = measure()
+        timings.append(elapsed * 1000)
+
+    timings.sort()
+
+    print(f'best {timings[0]:.2f} ms, median {timings[len(timings) // 2]:.2f} ms over {args.runs} runs')
+    print(f'{len(imported)} modules imported')
+
+    eager = [module for module in LAZY_MODULES if module in imported]
+
+    if eager:
+        sys.exit(f'Imported eagerly: {", ".join(eager)}')
+
+    if timings[0] > args.budget_ms:
+        sys.exit(f'Over the budget of {args.budget_ms} ms')
+
+
+if __name__ == '__main__':
+    main()
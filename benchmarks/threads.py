@@ -0,0 +1,94 @@
+"""
+Validation throughput of one compiled schema, shared by a growing number of threads.
+
+    python benchmarks/threads.py [--threads 1 2 4 8] [--seconds 2]
+
+Threads only scale on free-threaded builds of Python (3.13t and later).
+With the GIL, the total throughput is expected to stay flat.
+"""
+import argparse
+import os
+import sys
+import time
+
+from threading import Barrier, Thread
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from simple_schema_validator import compile_schema, types  # noqa: E402
+
+
+SCHEMA = compile_schema({
+    'id': int,
+    'name': str,
+    'email': types.Optional[str],
+    'scores': [types.Int(min=0)],
+    'address': {'city': str, 'zip': str},
+    'orders': [{'id': int, 'total': float, 'status': types.Enum('new', 'paid')}]
+})
+
+DATA = {
+    'id': 1,
+    'name': 'Ivan',
+    'email': None,
+    'scores': list(range(20)),
+    'address': {'city': 'Sofia', 'zip': '1000'},
+    'orders': [{'id': index, 'total': 1.5, 'status': 'paid'} for index in range(20)]
+}
+
+
+def measure(threads, seconds):
+    barrier = Barrier(threads + 1)
+    counts = [0] * threads
+    deadline = []
+
+    def run(index):
+        validate = SCHEMA.validate
+        count = 0
+
+        barrier.wait()
+
+        while time.perf_counter() < deadline[0]:
+            for _ in range(100):
+                validate(DATA)
+
+            count += 100
+
+        counts[index] = count
+
+    workers = [Thread(target=run, args=(index,)) for index in range(threads)]
+
+    for worker in workers:
+        worker.start()
+
+    deadline.append(time.perf_counter() + seconds)
+    barrier.wait()
+
+    for worker in workers:
+        worker.join()
+
+    return sum(counts) / seconds
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--seconds', type=float, default=2)
+    args = parser.parse_args()
+
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+
+    print(f'Python {sys.version.split()[0]}, GIL {"enabled" if gil else "disabled"}, {os.cpu_count()} CPUs')
+    print(f'{"threads":>8} {"validations/s":>15} {"scaling":>8}')
+
+    baseline = None
+
+    for threads in args.threads:
+        throughput = measure(threads, args.seconds)
+        baseline = baseline or throughput
+
+        print(f'{threads:>8} {throughput:>15,.0f} {throughput / baseline:>7.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,284 @@
+"""
+Throughput and memory of validating the same payloads with this library and other validators.
+
+    python benchmarks/validators.py [--seconds 1] [--depth 100]
+
+jsonschema, fastjsonschema and pydantic are measured when they are installed.
+Their schemas are equivalent to ours - the JSON Schemas are exported with `to_json_schema`
+and the pydantic models are strict and forbid extra keys.
+
+Every validator returns whether the payload is valid, which is checked before measuring.
+Not every validator does the same work on invalid payloads:
+fastjsonschema stops at the first error, the others report all of them.
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+try:
+    from importlib.metadata import version
+except ImportError:
+    """
+    Python 3.7 - the package versions are read from the modules.
+    """
+    def version(distribution_name: str) -> str:
+        return getattr(__import__(distribution_name), '__version__', 'unknown')
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from simple_schema_validator import compile_schema, schema_validator, to_json_schema, types  # noqa: E402
+
+
+SCHEMA = {
+    'id': int,
+    'name': str,
+    'email': types.Optional[str],
+    'scores': [types.Int(min=0)],
+    'address': {'city': str, 'zip': str},
+    'orders': [{'id': int, 'total': float, 'status': types.Enum('new', 'paid')}]
+}
+
+VALID = {
+    'id': 1,
+    'name': 'Ivan',
+    'email': None,
+    'scores': list(range(20)),
+    'address': {'city': 'Sofia', 'zip': '1000'},
+    'orders': [{'id': index, 'total': 1.5, 'status': 'paid'} for index in range(20)]
+}
+
+INVALID = {
+    **VALID,
+    'id': '1',
+    'scores': [*range(19), -1],
+    'address': {'city': 'Sofia', 'country': 'BG'},
+    'orders': [{'id': index, 'total': '1.5', 'status': 'sent'} for index in range(20)]
+}
+
+DEEP_DEFINITIONS = {
+    'node': {'value': int, 'child': types.Optional[types.Ref('node')]}
+}
+
+DEEP_SCHEMA = types.Ref('node')
+
+
+def make_deep(depth):
+    payload = None
+
+    for value in range(depth):
+        payload = {'value': value, 'child': payload}
+
+    return payload
+
+
+def ours():
+    """
+    `schema_validator` compiles the schema on every call, `compile_schema` once.
+    """
+    compiled = compile_schema(SCHEMA)
+    compiled_deep = compile_schema(DEEP_SCHEMA, DEEP_DEFINITIONS)
+
+    yield 'schema_validator', (
+        lambda data: bool(schema_validator(SCHEMA, data)),
+        lambda data: bool(schema_validator(DEEP_SCHEMA, data, DEEP_DEFINITIONS))
+    )
+    yield 'compile_schema', (
+        lambda data: bool(compiled.validate(data)),
+        lambda data: bool(compiled_deep.validate(data))
+    )
+
+
+def json_schemas():
+    return to_json_schema(SCHEMA), to_json_schema(DEEP_SCHEMA, DEEP_DEFINITIONS)
+
+
+def jsonschema_validators():
+    import jsonschema
+
+    validators = [jsonschema.Draft202012Validator(schema) for schema in json_schemas()]
+
+    yield f'jsonschema {version("jsonschema")}', tuple(
+        lambda data, validator=validator: len(list(validator.iter_errors(data))) == 0
+        for validator in validators
+    )
+
+
+def fastjsonschema_validators():
+    import fastjsonschema
+
+    def make(schema):
+        validate = fastjsonschema.compile(schema)
+
+        def run(data):
+            try:
+                validate(data)
+            except fastjsonschema.JsonSchemaException:
+                return False
+
+            return True
+
+        return run
+
+    yield f'fastjsonschema {version("fastjsonschema")}', tuple(make(schema) for schema in json_schemas())
+
+
+def pydantic_validators():
+    from typing import Annotated, List, Literal, Optional
+
+    import pydantic
+
+    config = pydantic.ConfigDict(strict=True, extra='forbid')
+
+    class Address(pydantic.BaseModel):
+        model_config = config
+
+        city: str
+        zip: str
+
+    class Order(pydantic.BaseModel):
+        model_config = config
+
+        id: int
+        total: float
+        status: Literal['new', 'paid']
+
+    class User(pydantic.BaseModel):
+        model_config = config
+
+        id: int
+        name: str
+        email: Optional[str]
+        scores: List[Annotated[int, pydantic.Field(ge=0)]]
+        address: Address
+        orders: List[Order]
+
+    class Node(pydantic.BaseModel):
+        model_config = config
+
+        value: int
+        child: Optional['Node']
+
+    def make(model):
+        def run(data):
+            try:
+                model.model_validate(data)
+            except pydantic.ValidationError:
+                return False
+
+            return True
+
+        return run
+
+    yield f'pydantic {version("pydantic")}', (make(User), make(Node))
+
+
+ENGINES = (ours, jsonschema_validators, fastjsonschema_validators, pydantic_validators)
+
+
+def get_validators():
+    for engine in ENGINES:
+        try:
+            yield from engine()
+        except ImportError:
+            continue
+
+
+def measure_throughput(validate, data, seconds):
+    count = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+
+    while time.perf_counter() < deadline:
+        for _ in range(10):
+            validate(data)
+
+        count += 10
+
+    return count / (time.perf_counter() - start)
+
+
+def measure_memory(validate, data):
+    """
+    Peak memory allocated by one validation, after a warm-up call.
+    """
+    validate(data)
+
+    tracemalloc.start()
+
+    try:
+        validate(data)
+
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def print_table(title, columns, rows, format_value):
+    width = max(len(name) for name, _ in rows)
+
+    print()
+    print(f'{title:<{width}} | ' + ' | '.join(f'{column:>12}' for column in columns))
+    print(f'{"-" * width}-|-' + '-|-'.join('-' * 12 for _ in columns))
+
+    for name, values in rows:
+        print(f'{name:<{width}} | ' + ' | '.join(f'{format_value(value):>12}' for value in values))
+
+
+def format_error(value):
+    return value if isinstance(value, str) else None
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--seconds', type=float, default=1)
+    parser.add_argument('--depth', type=int, default=100)
+    args = parser.parse_args()
+
+    deep = make_deep(args.depth)
+
+    cases = (('valid', VALID, 0), ('invalid', INVALID, 0), (f'deep ({args.depth})', deep, 1))
+
+    throughput_rows = []
+    memory_rows = []
+
+    for name, validators in get_validators():
+        if not validators[0](VALID) or validators[0](INVALID):
+            sys.exit(f'{name} does not validate the payloads like the others')
+
+        throughputs = []
+        memory = []
+
+        for _, data, index in cases:
+            validate = validators[index]
+
+            try:
+                memory.append(measure_memory(validate, data))
+                throughputs.append(measure_throughput(validate, data, args.seconds))
+            except RecursionError:
+                memory.append('recursion')
+                throughputs.append('recursion')
+
+        throughput_rows.append((name, throughputs))
+        memory_rows.append((name, memory))
+
+    columns = [case for case, _, _ in cases]
+
+    print(f'Python {sys.version.split()[0]}')
+    print_table(
+        'validations/s',
+        columns,
+        throughput_rows,
+        lambda value: format_error(value) or f'{value:,.0f}'
+    )
+    print_table(
+        'peak KiB',
+        columns,
+        memory_rows,
+        lambda value: format_error(value) or f'{value / 1024:,.1f}'
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+from simple_schema_validator import compile_schema, types
+
+
+def validate(schema, data):
+    validation = schema.validate(data)
+
+    if not validation:
+        print(f'Keys in data, but not in schema: {validation.additional_keys}')
+        print(f'Keys in schema, but not in data: {validation.missing_keys}')
+        print(f'Keys with different type from schema {validation.type_errors}')
+    else:
+        print('Valid.')
+
+
+def main():
+    data_1 = {
+        'type': 'chat',
+        'message': {
+            'title': 'Graduation',
+            'content': 'Hello there!'
+        }
+    }
+
+    data_2 = {
+        'type': 'survey',
+        'answers': 'N people answered your survey'
+    }
+
+    data_3 = {
+        'type': 'unknown'
+    }
+
+    schema = compile_schema(types.Tagged('type', {
+        'chat': {
+            'message': {
+                'title': str,
+                'content': str
+            }
+        },
+        'survey': {
+            'answers': int
+        }
+    }))
+
+    print('Validating data_1 ...')
+    validate(schema, data_1)
+
+    print('Validating data_2 ...')
+    validate(schema, data_2)
+
+    print('Validating data_3 ...')
+    validate(schema, data_3)
+
+
+if __name__ == '__main__':
+    main()
@@ -11,7 +11,7 @@ DESCRIPTION = 'A dead-simple utility that validates if object has a certain stru
 URL = 'https://github.com/HackSoftware/simple_schema_validator'
 EMAIL = 'radorado@hacksoft.io'
 AUTHOR = 'Radoslav Georgiev'
-REQUIRES_PYTHON = '>=3.6.0'
+REQUIRES_PYTHON = '>=3.7.0'
 VERSION = None
 
 # What packages are required for this module to be executed?
@@ -19,7 +19,7 @@ REQUIRED = []
 
 # What packages are optional?
 EXTRAS = {
-    # 'fancy feature': ['django'],
+    'columnar': ['numpy', 'pyarrow'],
 }
 
 # The rest you shouldn't have to touch too much :)
@@ -111,7 +111,11 @@ setup(
         'License :: OSI Approved :: MIT License',
         'Programming Language :: Python',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.6',
+        'Programming Language :: Python :: 3.7',
+        'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.9',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
         'Programming Language :: Python :: Implementation :: CPython'
     ],
     # $ setup.py publish support.
@@ -1,2 +1,36 @@
 from .schema_validator import schema_validator # noqa
 from .schema_types import types # noqa
+from .compiler import compile_schema, CompiledSchema, SchemaError, Sampling, Validator # noqa
+
+
+"""
+Optional subsystems, imported on first use.
+"""
+LAZY_ATTRIBUTES = {
+    'parse': 'parser',
+    'to_json_schema': 'json_schema',
+    'from_json_schema': 'json_schema',
+    'analyze_schema': 'analyzer',
+    'validate_columns': 'columnar',
+    'validate_diff': 'diff',
+    'infer_schema': 'inference',
+    'iter_errors': 'streaming',
+    'ErrorStats': 'stats'
+}
+
+
+def __getattr__(name):
+    if name not in LAZY_ATTRIBUTES:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    from importlib import import_module
+
+    value = getattr(import_module(f'.{LAZY_ATTRIBUTES[name]}', __name__), name)
+
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return [*globals(), *LAZY_ATTRIBUTES]
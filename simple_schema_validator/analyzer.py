@@ -0,0 +1,201 @@
+from typing import Any, List, Optional, Tuple
+
+from collections.abc import Mapping
+
+from .compiler import Definitions
+from .schema_types import (
+    ListType,
+    is_optional,
+    get_optional_type,
+    is_any,
+    is_any_or_optional_any,
+    is_list,
+    get_list_type,
+    is_union,
+    get_union_types,
+    is_tuple,
+    get_tuple_types,
+    is_dict_type,
+    is_extra,
+    is_item_errors,
+    is_tagged
+)
+
+
+class SchemaIssue:
+    """
+    `definition` is the name of the definition the issue is in, or `None` for the schema itself.
+    """
+    def __init__(self, *, code: str, path: str, message: str, definition: Optional[str] = None):
+        self.code = code
+        self.path = path
+        self.message = message
+        self.definition = definition
+
+    def __repr__(self):
+        location = self.path if self.definition is None else f'{self.definition}:{self.path}'
+
+        return f'SchemaIssue({self.code!r}, {location!r}, {self.message!r})'
+
+
+class SchemaReport:
+    def __init__(self, *, issues: List[SchemaIssue], node_count: int, list_of_dict_depth: int, any_count: int):
+        self.__issues = issues
+        self.__node_count = node_count
+        self.__list_of_dict_depth = list_of_dict_depth
+        self.__any_count = any_count
+
+    @property
+    def issues(self):
+        return self.__issues
+
+    @property
+    def node_count(self):
+        """
+        Number of types in the schema and its definitions.
+        """
+        return self.__node_count
+
+    @property
+    def list_of_dict_depth(self):
+        """
+        The most lists of dictionaries nested in one another.
+        Every item of such lists is validated on its own.
+        """
+        return self.__list_of_dict_depth
+
+    @property
+    def any_count(self):
+        """
+        Number of `Any` subtrees, which are not validated.
+        """
+        return self.__any_count
+
+    def __bool__(self):
+        return len(self.__issues) == 0
+
+
+def is_dict_like(schema: Any) -> bool:
+    while is_optional(schema) or is_extra(schema):
+        schema = get_optional_type(schema) if is_optional(schema) else schema.schema
+
+    return isinstance(schema, Mapping) or is_tagged(schema)
+
+
+def analyze_schema(schema: Any, definitions: Optional[Definitions] = None) -> SchemaReport:
+    """
+    Reports issues with a schema, without compiling it:
+
+    - `multiple-list-types` - lists with more than one item type.
+    - `nested-optional` - `types.Optional[types.Optional[T]]`, which is `types.Optional[T]`.
+    - `optional-any` - `types.Optional[Any]`, which is `Any`.
+    - `union-with-any` - unions with an `Any` branch, which accept anything.
+
+    References are not followed - every definition is analyzed once, on its own.
+    """
+    issues = []
+    node_count = 0
+    list_of_dict_depth = 0
+    any_count = 0
+
+    roots: List[Tuple[Optional[str], Any]] = [(None, schema)]
+    roots.extend((definitions or {}).items())
+
+    for definition, root in roots:
+        stack = [(root, '', 0)]
+
+        while len(stack) > 0:
+            schema, path, depth = stack.pop()
+
+            node_count += 1
+            list_of_dict_depth = max(list_of_dict_depth, depth)
+
+            if is_any(schema):
+                any_count += 1
+                continue
+
+            if is_optional(schema):
+                optional_type = get_optional_type(schema)
+
+                if is_any(optional_type):
+                    any_count += 1
+                    issues.append(SchemaIssue(
+                        code='optional-any',
+                        path=path,
+                        message='types.Optional[Any] is the same as Any',
+                        definition=definition
+                    ))
+                    continue
+
+                if is_optional(optional_type):
+                    issues.append(SchemaIssue(
+                        code='nested-optional',
+                        path=path,
+                        message='types.Optional is nested in types.Optional',
+                        definition=definition
+                    ))
+
+                stack.append((optional_type, path, depth))
+                continue
+
+            if is_extra(schema) or is_item_errors(schema):
+                stack.append((schema.schema, path, depth))
+                continue
+
+            if is_union(schema):
+                for T in get_union_types(schema):
+                    if is_any_or_optional_any(T):
+                        issues.append(SchemaIssue(
+                            code='union-with-any',
+                            path=path,
+                            message=f'{schema!r} accepts anything, since it has an Any branch',
+                            definition=definition
+                        ))
+
+                    stack.append((T, path, depth))
+
+                continue
+
+            if is_tagged(schema):
+                for branch in schema.schemas.values():
+                    stack.append((branch, path, depth))
+
+                continue
+
+            if isinstance(schema, Mapping):
+                for key, value in schema.items():
+                    stack.append((value, f'{path}.{key}' if path else f'{key}', depth))
+
+                continue
+
+            if is_dict_type(schema):
+                stack.append((schema.V, f'{path}.*' if path else '*', depth))
+                continue
+
+            if is_tuple(schema):
+                for index, T in enumerate(get_tuple_types(schema)):
+                    stack.append((T, f'{path}[{index}]', depth))
+
+                continue
+
+            if is_list(schema) or type(schema) is ListType:
+                if is_list(schema) and len(schema) > 1:
+                    issues.append(SchemaIssue(
+                        code='multiple-list-types',
+                        path=path,
+                        message=f'Lists can have one item type, got {len(schema)}',
+                        definition=definition
+                    ))
+
+                item = get_list_type(schema)
+
+                stack.append((item, f'{path}[]', depth + 1 if is_dict_like(item) else depth))
+
+    issues.sort(key=lambda issue: (issue.definition or '', issue.path))
+
+    return SchemaReport(
+        issues=issues,
+        node_count=node_count,
+        list_of_dict_depth=list_of_dict_depth,
+        any_count=any_count
+    )
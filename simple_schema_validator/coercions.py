@@ -0,0 +1,49 @@
+from typing import Any, Callable, Dict, Tuple
+
+from datetime import date, datetime, time
+from decimal import Decimal
+from uuid import UUID
+
+
+Coercion = Tuple[Tuple[type, ...], Callable[[Any], Any]]
+
+
+def parse_bool(value: str) -> bool:
+    lowered = value.lower()
+
+    if lowered in ('true', '1', 'yes'):
+        return True
+
+    if lowered in ('false', '0', 'no'):
+        return False
+
+    raise ValueError(f'Invalid boolean: {value!r}')
+
+
+def parse_int(value: str) -> int:
+    """
+    `int` also accepts underscores and surrounding whitespace, which we do not want.
+    """
+    if not value.lstrip('-+').isdigit():
+        raise ValueError(f'Invalid integer: {value!r}')
+
+    return int(value)
+
+
+"""
+Conversions used by `parse`, by target type.
+
+Every target type has the types of values it is converted from and a function,
+which raises `ValueError`, `TypeError` or `ArithmeticError` when the value can not be converted.
+Values, which are already of the target type, are never converted.
+"""
+COERCIONS: Dict[type, Coercion] = {
+    int: ((str,), parse_int),
+    float: ((str, int), float),
+    bool: ((str,), parse_bool),
+    Decimal: ((str, int), Decimal),
+    datetime: ((str,), datetime.fromisoformat),
+    date: ((str,), date.fromisoformat),
+    time: ((str,), time.fromisoformat),
+    UUID: ((str,), UUID)
+}
@@ -0,0 +1,388 @@
+from typing import Any, List, Optional, Tuple
+
+from collections.abc import Mapping
+
+from .compiler import (
+    ANY,
+    CompiledSchema,
+    Definitions,
+    DictNode,
+    ErrorCollector,
+    OptionalNode,
+    RangeNode,
+    SchemaError,
+    TypeNode,
+    compile_schema,
+    deref,
+    get_homogeneous_item_type
+)
+from .result import SchemaValidationResult
+
+
+"""
+Python types of NumPy arrays, by dtype kind.
+Other kinds are checked item by item.
+"""
+NUMPY_KIND_TYPES = {
+    'i': int,
+    'u': int,
+    'f': float,
+    'b': bool,
+    'U': str
+}
+
+
+def get_columns(data: Any) -> Mapping:
+    """
+    A mapping of column names to columns, a pyarrow Table or a pandas DataFrame.
+    """
+    if isinstance(data, Mapping):
+        return data
+
+    if hasattr(data, 'column_names'):
+        return {name: data.column(name) for name in data.column_names}
+
+    if hasattr(data, 'columns'):
+        return {name: data[name] for name in data.columns}
+
+    raise TypeError(f'Expected a mapping of columns, a pyarrow Table or a pandas DataFrame, got {type(data)}')
+
+
+def is_arrow(column: Any) -> bool:
+    return type(column).__module__.startswith('pyarrow')
+
+
+def is_numpy(column: Any) -> bool:
+    return type(column).__module__ == 'numpy' and hasattr(column, 'dtype')
+
+
+def get_arrow_type(column: Any) -> Any:
+    import pyarrow.types as arrow_types
+
+    arrow_type = column.type
+
+    if arrow_types.is_integer(arrow_type):
+        return int
+
+    if arrow_types.is_floating(arrow_type):
+        return float
+
+    if arrow_types.is_boolean(arrow_type):
+        return bool
+
+    if arrow_types.is_string(arrow_type) or arrow_types.is_large_string(arrow_type):
+        return str
+
+    return None
+
+
+def get_null_rows(column: Any) -> list:
+    return [row for row, is_null in enumerate(column.is_null().to_pylist()) if is_null]
+
+
+def get_scalar_type(node: Any) -> Optional[tuple]:
+    """
+    `(T, optional, node)` for columns of plain types and ranges, which can be checked as a whole.
+    """
+    optional = type(node) is OptionalNode
+
+    if optional:
+        node = deref(node.node)
+
+    if type(node) is TypeNode and isinstance(node.schema, type):
+        return node.schema, optional, node
+
+    if type(node) is RangeNode:
+        return node.T, optional, node
+
+    return None
+
+
+class ColumnErrorCollector(ErrorCollector):
+    """
+    Errors inside lists of dictionaries keep the index of their row and item - `[1].orders[0].id`.
+    """
+    __slots__ = ()
+
+    absolute_paths = True
+
+
+def get_column_path(keys: tuple, path: Any = None) -> tuple:
+    for key in keys:
+        path = (path, key)
+
+    return path
+
+
+def get_row_path(row: int, keys: tuple) -> tuple:
+    return get_column_path(keys, (None, row, None))
+
+
+NO_ROWS: frozenset = frozenset()
+
+
+class ColumnChecker:
+    """
+    `skipped` are the rows of the current column, which are not checked - nulls of optional structs.
+    """
+    def __init__(self, sink: ColumnErrorCollector):
+        self.sink = sink
+        self.skipped = NO_ROWS
+
+    def check(self, column, keys, node, skipped=NO_ROWS):
+        if node is ANY:
+            return
+
+        self.skipped = skipped
+
+        if is_arrow(column):
+            self.check_arrow(column, keys, node)
+            return
+
+        if not is_numpy(column) and hasattr(column, 'to_numpy'):
+            """
+            pandas Series.
+            """
+            column = column.to_numpy()
+
+        if is_numpy(column):
+            self.check_numpy(column, keys, node)
+            return
+
+        scalar = get_scalar_type(node)
+
+        if scalar is not None and type(scalar[2]) is TypeNode and get_homogeneous_item_type(column) is scalar[0]:
+            return
+
+        self.check_items(column, keys, node)
+
+    def check_items(self, values, keys, node):
+        sink = self.sink
+        skipped = self.skipped
+        stack: list = []
+
+        if type(node) is TypeNode:
+            T = node.schema
+
+            for row, value in enumerate(values):
+                if type(value) is not T and row not in skipped:
+                    sink.type_error(get_row_path(row, keys), T, None if value is None else type(value))
+
+            return
+
+        for row, value in enumerate(values):
+            if row not in skipped:
+                node.visit(value, get_row_path(row, keys), stack, sink)
+
+        """
+        Dictionaries in columns are walked like anywhere else.
+        """
+        while len(stack) > 0:
+            walk, value, path, walk_sink = stack.pop()
+            walk(value, path, stack, walk_sink)
+
+    def report_rows(self, rows, keys, expected, actual):
+        for row in rows:
+            if row not in self.skipped:
+                self.sink.type_error(get_row_path(row, keys), expected, actual)
+
+    def check_numpy(self, column, keys, node):
+        scalar = get_scalar_type(node)
+        column_type = NUMPY_KIND_TYPES.get(column.dtype.kind)
+
+        if scalar is None or column_type is None:
+            self.check_items(column.tolist(), keys, node)
+            return
+
+        T, optional, scalar_node = scalar
+
+        if column_type is not T:
+            self.report_rows(range(len(column)), keys, scalar_node.schema, column_type)
+            return
+
+        if type(scalar_node) is RangeNode:
+            self.check_range(column, keys, scalar_node)
+
+    def check_range(self, column, keys, node):
+        out_of_range = None
+
+        if node.min is not None:
+            out_of_range = column < node.min
+
+        if node.max is not None:
+            above = column > node.max
+            out_of_range = above if out_of_range is None else out_of_range | above
+
+        if out_of_range is not None:
+            self.report_rows(out_of_range.nonzero()[0].tolist(), keys, node.schema, node.T)
+
+    def check_arrow(self, column, keys, node):
+        scalar = get_scalar_type(node)
+        column_type = get_arrow_type(column)
+
+        if scalar is None or column_type is None:
+            self.check_items(column.to_pylist(), keys, node)
+            return
+
+        T, optional, scalar_node = scalar
+
+        null_rows = []
+
+        if column.null_count > 0:
+            null_rows = get_null_rows(column)
+
+            if not optional:
+                self.report_rows(null_rows, keys, scalar_node.schema, None)
+
+        if column_type is not T:
+            null_rows = set(null_rows)
+            rows = (row for row in range(len(column)) if row not in null_rows)
+
+            self.report_rows(rows, keys, scalar_node.schema, column_type)
+            return
+
+        if type(scalar_node) is RangeNode and (scalar_node.min is not None or scalar_node.max is not None):
+            import pyarrow.compute as compute
+
+            out_of_range = None
+
+            if scalar_node.min is not None:
+                out_of_range = compute.less(column, scalar_node.min)
+
+            if scalar_node.max is not None:
+                above = compute.greater(column, scalar_node.max)
+                out_of_range = above if out_of_range is None else compute.or_(out_of_range, above)
+
+            rows = compute.indices_nonzero(compute.fill_null(out_of_range, False)).to_pylist()
+
+            self.report_rows(rows, keys, scalar_node.schema, T)
+
+
+def flatten_columns(root: DictNode) -> tuple:
+    """
+    Nested dictionaries are stored as columns with dotted names - `address.city`.
+
+    Returns the schemas of columns, by their keys, and dictionaries, by their dotted names.
+    """
+    leaves = []
+    dicts = {'': root}
+    stack: List[Tuple[DictNode, tuple]] = [(root, ())]
+
+    while len(stack) > 0:
+        node, keys = stack.pop()
+
+        for key, child in node.items:
+            child_keys = (*keys, key)
+            child = deref(child)
+
+            if type(child) is DictNode:
+                dicts['.'.join(map(str, child_keys))] = child
+                stack.append((child, child_keys))
+            else:
+                leaves.append((child_keys, child))
+
+    return leaves, dicts
+
+
+def flatten_struct_columns(columns: Mapping, dicts: dict) -> tuple:
+    """
+    pyarrow struct columns of nested dictionaries become a column per field, with dotted names.
+    Nulls of the struct are nulls of its fields, unless the dictionary is optional -
+    then its fields are not checked in those rows, like `None` is valid in rows.
+
+    Returns the columns, by their names, and the rows, which are skipped in them.
+    """
+    if not any(name in dicts and is_arrow(column) for name, column in columns.items()):
+        return columns, {}
+
+    import pyarrow.types as arrow_types
+
+    flattened = {}
+    skipped = {}
+    stack = [(name, column, NO_ROWS) for name, column in columns.items()]
+
+    while len(stack) > 0:
+        name, column, rows = stack.pop()
+
+        if name in dicts and is_arrow(column) and arrow_types.is_struct(column.type):
+            if dicts[name].optional and column.null_count > 0:
+                rows = rows.union(get_null_rows(column))
+
+            fields = [f'{name}.{field.name}' for field in column.type]
+
+            stack.extend((field, field_column, rows) for field, field_column in zip(fields, column.flatten()))
+        else:
+            flattened[name] = column
+
+            if len(rows) > 0:
+                skipped[name] = rows
+
+    return flattened, skipped
+
+
+def is_additional_column(name: str, dicts: dict) -> bool:
+    """
+    Unknown columns are allowed when the deepest dictionary they are in ignores extra keys.
+    """
+    prefix = name
+
+    while '.' in prefix:
+        prefix = prefix.rsplit('.', 1)[0]
+
+        if prefix in dicts:
+            return dicts[prefix].extra == 'forbid'
+
+    return dicts[''].extra == 'forbid'
+
+
+def validate_columns(
+    schema: Any,
+    data: Any,
+    definitions: Optional[Definitions] = None,
+    extra: str = 'forbid'
+) -> SchemaValidationResult:
+    """
+    Validates a batch of rows, stored as columns, against a dictionary schema.
+
+    NumPy and pyarrow columns of plain types are checked by their dtype, at once.
+    Other columns are checked item by item. Errors have the row index in their path - `[3].address.city`.
+    Nested dictionaries are columns with dotted names, or pyarrow struct columns.
+    """
+    if not isinstance(schema, CompiledSchema):
+        schema = compile_schema(schema, definitions, extra=extra)
+
+    root = deref(schema.root)
+
+    if type(root) is not DictNode:
+        raise SchemaError('Columnar validation needs a dictionary schema')
+
+    columns = get_columns(data)
+
+    lengths = {len(column) for column in columns.values()}
+
+    if len(lengths) > 1:
+        raise ValueError(f'All columns must have the same length, got {sorted(lengths)}')
+
+    leaves, dicts = flatten_columns(root)
+
+    columns, skipped = flatten_struct_columns(columns, dicts)
+
+    sink = ColumnErrorCollector()
+    checker = ColumnChecker(sink)
+    known = set()
+
+    for keys, node in leaves:
+        name = '.'.join(map(str, keys))
+        known.add(name)
+
+        if name not in columns:
+            sink.missing(get_column_path(keys))
+            continue
+
+        checker.check(columns[name], keys, node, skipped.get(name, NO_ROWS))
+
+    for name in columns:
+        if name not in known and name not in dicts and is_additional_column(name, dicts):
+            sink.additional((None, name))
+
+    return sink.get_result()
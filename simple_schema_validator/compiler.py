@@ -0,0 +1,1807 @@
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from array import array
+
+from collections.abc import Mapping, Sequence
+
+from operator import attrgetter, itemgetter
+
+from .result import SchemaValidationResult
+from .schema_types import (
+    ListType,
+    is_optional,
+    get_optional_type,
+    is_any_or_optional_any,
+    is_list,
+    get_list_type,
+    is_ref,
+    get_ref_name,
+    is_union,
+    get_union_types,
+    get_type_name,
+    is_tagged,
+    is_range,
+    is_str_constraint,
+    is_enum,
+    is_tuple,
+    get_tuple_types,
+    is_dict_type,
+    is_extra,
+    is_item_errors
+)
+
+if TYPE_CHECKING:
+    from random import Random
+
+
+Definitions = Dict[str, Any]
+
+MISSING = object()
+
+"""
+Bumped whenever compiled nodes change, so schemas dumped by another version are not loaded.
+"""
+DUMP_FORMAT = 4
+
+EXTRA_OPTIONS = ('forbid', 'ignore')
+
+
+class SchemaError(Exception):
+    pass
+
+
+"""
+Paths are built as parent pointers and rendered to dotted strings only when an error is reported:
+
+- `None` is the root.
+- `(parent, key)` is a key of a dictionary.
+- `(parent, index, None)` is an item of a list.
+- `(parent, key, KEY)` is a key of a dictionary itself, checked by `types.Dict` - rendered as `key[key]`.
+"""
+Path = Optional[tuple]
+
+KEY = 'key'
+
+
+"""
+Containers accepted as lists when validating with `strict=False`.
+"""
+SEQUENCE_TYPES = (Sequence, array, memoryview)
+NON_SEQUENCE_TYPES = (str, bytes, bytearray)
+
+"""
+Item types of arrays and memoryviews, by typecode / format.
+Such sequences are homogeneous, so their items are type checked once.
+"""
+HOMOGENEOUS_ITEM_TYPES = {
+    **{code: int for code in 'bBhHiIlLqQnN'},
+    **{code: float for code in 'efd'},
+    'u': str,
+    '?': bool
+}
+
+
+def is_sequence(value: Any) -> bool:
+    return isinstance(value, SEQUENCE_TYPES) and not isinstance(value, NON_SEQUENCE_TYPES)
+
+
+def get_homogeneous_item_type(value: Any) -> Any:
+    if type(value) is array:
+        return HOMOGENEOUS_ITEM_TYPES.get(value.typecode)
+
+    if type(value) is memoryview:
+        return HOMOGENEOUS_ITEM_TYPES.get(value.format)
+
+    return None
+
+
+def render_path(path: Path) -> str:
+    parts = []
+
+    while path is not None:
+        parts.append(path)
+        path = path[0]
+
+    rendered = []
+
+    for part in reversed(parts):
+        if len(part) == 3 and part[2] is None:
+            rendered.append(f'[{part[1]}]')
+        elif rendered:
+            rendered.append(f'.{part[1]}')
+        else:
+            rendered.append(f'{part[1]}')
+
+        if len(part) == 3 and part[2] is KEY:
+            rendered.append(f'[{KEY}]')
+
+    return ''.join(rendered)
+
+
+def rebase_path(path: Path, base: Path) -> Path:
+    """
+    `path`, built on `base` instead of the root.
+    """
+    parts = []
+
+    while path is not None:
+        parts.append(path)
+        path = path[0]
+
+    for part in reversed(parts):
+        base = (base, *part[1:])
+
+    return base
+
+
+def get_relative_path(path: Path, base: Path) -> tuple:
+    """
+    The keys and indexes of `path` below `base`, which `path` was built on.
+    With a `base`, which `path` was not built on, that is the whole of `path`.
+    """
+    parts = []
+
+    while path is not base and path is not None:
+        parts.append(path[1:])
+        path = path[0]
+
+    return tuple(parts)
+
+
+def report_additional_paths(value, path, stack, sink, strict=True):
+    """
+    Every path nested inside `value` is unknown to the schema.
+    Streaming sinks get them one walk at a time - see `walk_additional_paths`.
+    """
+    if sink.streaming:
+        stack.append((walk_additional_paths, (iter(value.items()), strict, NO_KEYS), path, sink))
+        return
+
+    pending = [(value, path)]
+
+    while len(pending) > 0:
+        value, path = pending.pop()
+
+        for key, nested_value in value.items():
+            nested_path = (path, key)
+
+            sink.additional(nested_path)
+
+            if type(nested_value) is dict or (not strict and isinstance(nested_value, Mapping)):
+                pending.append((nested_value, nested_path))
+
+
+NO_KEYS: frozenset = frozenset()
+
+
+def walk_additional_paths(value, path, stack, sink):
+    """
+    Reports the next additional key and pushes back the rest, so streaming sinks yield wide dictionaries
+    key by key. `value` is `(items, strict, known)` - an iterator of the keys and values left
+    and the keys, which the schema knows.
+    """
+    items, strict, known = value
+
+    for key, nested_value in items:
+        if key in known:
+            continue
+
+        nested_path = (path, key)
+
+        sink.additional(nested_path)
+
+        stack.append((walk_additional_paths, value, path, sink))
+
+        if type(nested_value) is dict or (not strict and isinstance(nested_value, Mapping)):
+            stack.append((walk_additional_paths, (iter(nested_value.items()), strict, NO_KEYS), nested_path, sink))
+
+        return
+
+
+"""
+Attribute names of dataclasses, attrs classes and classes with __slots__, by class.
+
+This is the only state shared between validations. Entries are written once and never changed,
+so threads read it without locks - two threads, which miss the same class, store equal names.
+"""
+ATTRIBUTE_NAMES: Dict[type, frozenset] = {}
+
+
+def is_object(value: Any) -> bool:
+    return hasattr(value, '__dict__') or hasattr(type(value), '__slots__')
+
+
+def get_slots(cls: type) -> tuple:
+    slots = cls.__dict__.get('__slots__', ())
+
+    if isinstance(slots, str):
+        return (slots,)
+
+    return tuple(slot for slot in slots if slot not in ('__dict__', '__weakref__'))
+
+
+def get_attribute_names(value: Any) -> frozenset:
+    cls = type(value)
+    names = ATTRIBUTE_NAMES.get(cls)
+
+    if names is not None:
+        return names
+
+    if hasattr(cls, '__dataclass_fields__'):
+        """
+        Names are cached by class, so this import runs once per dataclass.
+        """
+        from dataclasses import fields
+
+        names = frozenset(field.name for field in fields(cls))
+    elif hasattr(cls, '__attrs_attrs__'):
+        names = frozenset(attribute.name for attribute in cls.__attrs_attrs__)
+    elif not hasattr(value, '__dict__'):
+        names = frozenset(slot for base in cls.__mro__ for slot in get_slots(base))
+    else:
+        """
+        Plain objects can have different attributes per instance.
+        """
+        return frozenset(vars(value))
+
+    ATTRIBUTE_NAMES[cls] = names
+
+    return names
+
+
+class Sampling:
+    """
+    Lists longer than `head + tail + random` items are sampled -
+    only the first `head`, the last `tail` and `random` other items are checked.
+    """
+    def __init__(self, head: int = 100, tail: int = 100, random: int = 100, seed: Any = None):
+        from random import Random
+
+        for count in (head, tail, random):
+            if type(count) is not int or count < 0:
+                raise ValueError(f'Sampling counts must be non-negative integers, got {count!r}')
+
+        self.head = head
+        self.tail = tail
+        self.random = random
+        self.seed = seed
+        self.size = head + tail + random
+        self.random_type = Random
+
+    def get_indexes(self, length: int, rng: 'Random') -> list:
+        head = range(self.head)
+        tail = range(length - self.tail, length)
+        middle = rng.sample(range(self.head, length - self.tail), self.random)
+
+        return [*head, *sorted(middle), *tail]
+
+
+class ErrorCollector:
+    __slots__ = ('missing_keys', 'additional_keys', 'type_errors', 'sampled_paths', 'sampling', 'random')
+
+    converting = False
+
+    """
+    Streaming sinks are drained between walks, so lists give way after every item with errors.
+    """
+    streaming = False
+
+    """
+    Type errors of items of lists of dictionaries have paths relative to the item, unless this is set.
+    """
+    absolute_paths = False
+
+    def __init__(self, sampling: Optional[Sampling] = None):
+        self.missing_keys: List[str] = []
+        self.additional_keys: List[str] = []
+        self.type_errors: List[dict] = []
+        self.sampled_paths: List[str] = []
+        self.sampling = sampling
+        self.random: Optional['Random'] = sampling.random_type(sampling.seed) if sampling is not None else None
+
+    def reset(self, result: SchemaValidationResult):
+        """
+        Collects the errors of the next validation straight into the lists of `result`.
+        """
+        result.clear()
+
+        self.missing_keys = result.missing_keys
+        self.additional_keys = result.additional_keys
+        self.type_errors = result.type_errors
+        self.sampled_paths = result.sampled_paths
+
+        sampling = self.sampling
+        random = self.random
+
+        if sampling is not None and random is not None:
+            random.seed(sampling.seed)
+
+    def missing(self, path):
+        self.missing_keys.append(render_path(path))
+
+    def additional(self, path):
+        self.additional_keys.append(render_path(path))
+
+    def type_error(self, path, expected, actual):
+        self.type_errors.append({'path': render_path(path), 'expected': expected, 'actual': actual})
+
+    def sampled(self, path):
+        self.sampled_paths.append(render_path(path))
+
+    def converted(self, path, value):
+        pass
+
+    def get_result(self) -> SchemaValidationResult:
+        missing_keys = self.missing_keys
+        additional_keys = self.additional_keys
+        type_errors = self.type_errors
+
+        return SchemaValidationResult(
+            valid=not missing_keys and not additional_keys and not type_errors,
+            missing_keys=sorted(missing_keys),
+            additional_keys=sorted(additional_keys),
+            type_errors=sorted(type_errors, key=itemgetter('path')),
+            sampled_paths=sorted(self.sampled_paths)
+        )
+
+
+class TypeErrorsOnly:
+    """
+    Items of a list of schemas are validated on their own.
+    Only their type errors are reported, with paths relative to the item.
+
+    Converted values are reported with full paths, so `base` is the path of the item
+    when values are converted. So are type errors, when the sink asks for absolute paths.
+
+    Type errors are passed on to other item sinks with `key` - the path, as the node reported it -
+    so `per_path` finds the same paths, whether the sink asks for absolute paths or not.
+    """
+    __slots__ = ('sink', 'base', 'sampling', 'random', 'converting', 'streaming', 'absolute_paths')
+
+    def __init__(self, sink, base=None):
+        self.sink = sink
+        self.base = base
+        self.sampling = sink.sampling
+        self.random = sink.random
+        self.converting = sink.converting
+        self.streaming = sink.streaming
+        self.absolute_paths = sink.absolute_paths
+
+    def missing(self, path):
+        pass
+
+    def additional(self, path):
+        pass
+
+    def type_error(self, path, expected, actual):
+        self.item_type_error(path, path, expected, actual)
+
+    def item_type_error(self, path, key, expected, actual):
+        if self.absolute_paths and self.base is not None:
+            path = rebase_path(path, self.base)
+
+        if type(self.sink) is TypeErrorsOnly or type(self.sink) is ItemErrorLimit:
+            self.sink.item_type_error(path, key, expected, actual)
+        else:
+            self.sink.type_error(path, expected, actual)
+
+    def sampled(self, path):
+        if self.absolute_paths and self.base is not None:
+            path = rebase_path(path, self.base)
+
+        self.sink.sampled(path)
+
+    def converted(self, path, value):
+        self.sink.converted(rebase_path(path, self.base), value)
+
+
+class ItemErrorLimit:
+    """
+    Errors of the items of one list, checked one item at a time:
+
+    - with `limit`, items are no longer checked once `limit` of them have errors.
+    - with `per_path`, only the first error at every path inside the items is reported.
+
+    With neither, it only tells items with errors apart, for streaming sinks.
+
+    `base` is the path, which paths inside the current item are built on.
+    """
+    __slots__ = (
+        'sink', 'limit', 'paths', 'base', 'bad_items', 'bad', 'sampling', 'random', 'converting', 'streaming',
+        'absolute_paths'
+    )
+
+    def __init__(self, sink, limit, per_path):
+        self.sink = sink
+        self.limit = limit
+        self.paths = set() if per_path else None
+        self.base = None
+        self.bad_items = 0
+        self.bad = False
+        self.sampling = sink.sampling
+        self.random = sink.random
+        self.converting = sink.converting
+        self.streaming = sink.streaming
+        self.absolute_paths = sink.absolute_paths
+
+    def next_item(self, base):
+        self.base = base
+        self.bad = False
+
+    def is_done(self) -> bool:
+        return self.limit is not None and self.bad_items >= self.limit
+
+    def missing(self, path):
+        self.sink.missing(path)
+
+    def additional(self, path):
+        self.sink.additional(path)
+
+    def type_error(self, path, expected, actual):
+        self.item_type_error(path, path, expected, actual)
+
+    def item_type_error(self, path, key, expected, actual):
+        """
+        `key` is `path` before it was rebased - see `TypeErrorsOnly`.
+        """
+        if not self.bad:
+            self.bad = True
+            self.bad_items += 1
+
+        if self.paths is not None:
+            relative_path = get_relative_path(key, self.base)
+
+            if relative_path in self.paths:
+                return
+
+            self.paths.add(relative_path)
+
+        if type(self.sink) is TypeErrorsOnly or type(self.sink) is ItemErrorLimit:
+            self.sink.item_type_error(path, key, expected, actual)
+        else:
+            self.sink.type_error(path, expected, actual)
+
+    def sampled(self, path):
+        self.sink.sampled(path)
+
+    def converted(self, path, value):
+        self.sink.converted(path, value)
+
+
+"""
+Compiled schema nodes.
+
+Every node has a `visit(value, path, stack, sink)` method, which checks `value`
+and reports errors to `sink`. Nested dictionaries are not walked right away -
+they are pushed to `stack`, which keeps validation iterative and bounded by the
+depth of the data, even for self-referential schemas.
+"""
+
+
+class AnyNode:
+    __slots__ = ()
+
+    schema = Any
+
+    def visit(self, value, path, stack, sink):
+        pass
+
+    def __reduce__(self):
+        """
+        Nodes are compared to `ANY` by identity, so loading keeps it a singleton.
+        """
+        return 'ANY'
+
+
+ANY = AnyNode()
+
+
+class NoneNode:
+    """
+    There is one node per `extra` option - `NONE` and `NONE_IGNORING_EXTRA`.
+    """
+    __slots__ = ('extra',)
+
+    schema = None
+
+    def __init__(self, extra):
+        self.extra = extra
+
+    def __reduce__(self):
+        return 'NONE' if self.extra == 'forbid' else 'NONE_IGNORING_EXTRA'
+
+    def visit(self, value, path, stack, sink):
+        if value is None:
+            return
+
+        sink.type_error(path, None, type(value))
+
+        if type(value) is dict and self.extra == 'forbid':
+            report_additional_paths(value, path, stack, sink)
+
+
+NONE = NoneNode('forbid')
+NONE_IGNORING_EXTRA = NoneNode('ignore')
+
+
+class TypeNode:
+    __slots__ = ('schema', 'extra')
+
+    def __init__(self, T, extra='forbid'):
+        self.schema = T
+        self.extra = extra
+
+    def visit(self, value, path, stack, sink):
+        value_type = type(value)
+
+        if value_type is self.schema:
+            return
+
+        sink.type_error(path, self.schema, None if value is None else value_type)
+
+        if value_type is dict and self.extra == 'forbid':
+            report_additional_paths(value, path, stack, sink)
+
+
+class CoerceNode:
+    """
+    Converts values before checking them with `node`, when parsing.
+    """
+    __slots__ = ('node', 'source_types', 'convert', 'schema')
+
+    def __init__(self, node, source_types, convert):
+        self.node = node
+        self.source_types = source_types
+        self.convert = convert
+        self.schema = node.schema
+
+    def visit(self, value, path, stack, sink):
+        if type(value) in self.source_types:
+            try:
+                converted = self.convert(value)
+            except (ValueError, TypeError, ArithmeticError):
+                pass
+            else:
+                sink.converted(path, converted)
+                value = converted
+
+        self.node.visit(value, path, stack, sink)
+
+
+class RangeNode:
+    __slots__ = ('T', 'min', 'max', 'schema', 'extra')
+
+    def __init__(self, T, min, max, schema, extra='forbid'):
+        self.T = T
+        self.min = min
+        self.max = max
+        self.schema = schema
+        self.extra = extra
+
+    def visit(self, value, path, stack, sink):
+        value_type = type(value)
+
+        if value_type is not self.T:
+            sink.type_error(path, self.schema, None if value is None else value_type)
+
+            if value_type is dict and self.extra == 'forbid':
+                report_additional_paths(value, path, stack, sink)
+
+            return
+
+        if (self.min is not None and value < self.min) or (self.max is not None and value > self.max):
+            sink.type_error(path, self.schema, value_type)
+
+
+class StrNode:
+    __slots__ = ('min_len', 'max_len', 'pattern', 'schema', 'extra')
+
+    def __init__(self, min_len, max_len, pattern, schema, extra='forbid'):
+        self.min_len = min_len
+        self.max_len = max_len
+        self.pattern = pattern
+        self.schema = schema
+        self.extra = extra
+
+    def visit(self, value, path, stack, sink):
+        value_type = type(value)
+
+        if value_type is not str:
+            sink.type_error(path, self.schema, None if value is None else value_type)
+
+            if value_type is dict and self.extra == 'forbid':
+                report_additional_paths(value, path, stack, sink)
+
+            return
+
+        length = len(value)
+
+        if (
+            (self.min_len is not None and length < self.min_len)
+            or (self.max_len is not None and length > self.max_len)
+            or (self.pattern is not None and self.pattern.search(value) is None)
+        ):
+            sink.type_error(path, self.schema, str)
+
+
+class EnumNode:
+    """
+    `values` are `(type, value)` pairs, so `1`, `1.0` and `True` are different values.
+    """
+    __slots__ = ('values', 'value_types', 'schema')
+
+    def __init__(self, values, schema):
+        self.values = values
+        self.value_types = frozenset(T for T, value in values)
+        self.schema = schema
+
+    def visit(self, value, path, stack, sink):
+        """
+        Types are checked first, so unhashable values are never looked up.
+        """
+        value_type = type(value)
+
+        if value_type in self.value_types and (value_type, value) in self.values:
+            return
+
+        sink.type_error(path, self.schema, None if value is None else type(value))
+
+
+class OptionalNode:
+    __slots__ = ('node', 'allows_mappings', 'extra', 'schema')
+
+    def __init__(self, node, allows_mappings, extra, schema):
+        self.node = node
+        self.allows_mappings = allows_mappings
+        self.extra = extra
+        self.schema = schema
+
+    def visit(self, value, path, stack, sink):
+        if value is None:
+            return
+
+        """
+        `types.Optional[T]`, where T is a plain type, accepts nested dictionaries.
+        """
+        if self.allows_mappings and isinstance(value, Mapping):
+            if type(value) is dict and self.extra == 'forbid':
+                report_additional_paths(value, path, stack, sink)
+
+            return
+
+        self.node.visit(value, path, stack, sink)
+
+
+class ListNode:
+    """
+    `limit` and `per_path` come from `types.ItemErrors` - see `ItemErrorLimit`.
+    """
+    __slots__ = ('item', 'strict', 'min_len', 'max_len', 'schema', 'limit', 'per_path', 'extra')
+
+    def __init__(self, item, strict, min_len, max_len, schema, limit=None, per_path=False, extra='forbid'):
+        self.item = item
+        self.strict = strict
+        self.min_len = min_len
+        self.max_len = max_len
+        self.schema = schema
+        self.limit = limit
+        self.per_path = per_path
+        self.extra = extra
+
+    def visit(self, value, path, stack, sink):
+        value_type = type(value)
+
+        if value_type is not list and (self.strict or not is_sequence(value)):
+            sink.type_error(path, list, None if value is None else value_type)
+
+            if value_type is dict and self.extra == 'forbid':
+                report_additional_paths(value, path, stack, sink)
+
+            return
+
+        length = len(value)
+
+        if (self.min_len is not None and length < self.min_len) or (self.max_len is not None and length > self.max_len):
+            sink.type_error(path, self.schema, value_type)
+
+        item = deref(self.item)
+
+        if item is ANY:
+            return
+
+        sampling = sink.sampling
+
+        if sampling is not None and length > sampling.size:
+            sink.sampled(path)
+            elements = ((index, value[index]) for index in sampling.get_indexes(length, sink.random))
+        else:
+            elements = enumerate(value)
+
+        if self.limit is not None or self.per_path or sink.streaming:
+            item_sink = sink if type(sink) is TypeErrorsOnly else TypeErrorsOnly(sink)
+
+            self.walk_items(elements, path, stack, ItemErrorLimit(item_sink, self.limit, self.per_path))
+            return
+
+        if type(item) is TypeNode:
+            T = item.schema
+
+            if value_type is not list and get_homogeneous_item_type(value) is T:
+                return
+
+            for index, element in elements:
+                if type(element) is not T:
+                    sink.type_error((path, index, None), T, type(element))
+
+            return
+
+        item_sink = sink if type(sink) is TypeErrorsOnly else TypeErrorsOnly(sink)
+
+        if isinstance(item, (DictNode, TaggedNode)):
+            walks = []
+
+            item_bases = sink.converting or sink.absolute_paths
+
+            for index, element in elements:
+                walk = item.get_walk(element)
+
+                if walk is not None:
+                    if item_bases:
+                        walks.append((walk, element, None, TypeErrorsOnly(item_sink, (path, index, None))))
+                    else:
+                        walks.append((walk, element, None, item_sink))
+                elif element is not None or not item.optional:
+                    sink.type_error((path, index, None), item.schema, type(element))
+
+            walks.reverse()
+            stack.extend(walks)
+
+            return
+
+        for index, element in elements:
+            item.visit(element, (path, index, None), stack, item_sink)
+
+    def walk_items(self, elements, path, stack, sink):
+        """
+        Checks items until the policy of `sink` stops it.
+
+        Walks, which an item pushes, go on top of the rest of the list,
+        so the item is checked completely before the next one is started.
+        Streaming sinks get the rest of the list pushed after every item with errors, too.
+        """
+        item = deref(self.item)
+        walks_dicts = isinstance(item, (DictNode, TaggedNode))
+
+        for index, element in elements:
+            if sink.is_done():
+                sink.sampled(path)
+                return
+
+            item_path = (path, index, None)
+            depth = len(stack)
+
+            if type(item) is TypeNode:
+                sink.next_item(item_path)
+
+                if type(element) is not item.schema:
+                    sink.type_error(item_path, item.schema, type(element))
+            elif not walks_dicts:
+                sink.next_item(item_path)
+                item.visit(element, item_path, stack, sink)
+            else:
+                walk = item.get_walk(element)
+
+                if walk is not None and sink.absolute_paths:
+                    sink.next_item(item_path)
+                    walk(element, None, stack, TypeErrorsOnly(sink, item_path))
+                elif walk is not None:
+                    sink.next_item(None)
+                    walk(element, None, stack, TypeErrorsOnly(sink, item_path) if sink.converting else sink)
+                else:
+                    sink.next_item(item_path)
+
+                    if element is not None or not item.optional:
+                        sink.type_error(item_path, item.schema, type(element))
+
+            if len(stack) > depth or (sink.streaming and sink.bad):
+                stack.insert(depth, (self.walk_items, elements, path, sink))
+                return
+
+
+class TupleNode:
+    __slots__ = ('items', 'strict', 'schema', 'extra')
+
+    def __init__(self, items, strict, schema, extra='forbid'):
+        self.items = items
+        self.strict = strict
+        self.schema = schema
+        self.extra = extra
+
+    def visit(self, value, path, stack, sink):
+        value_type = type(value)
+
+        if value_type is not tuple and value_type is not list and (self.strict or not is_sequence(value)):
+            sink.type_error(path, self.schema, None if value is None else value_type)
+
+            if value_type is dict and self.extra == 'forbid':
+                report_additional_paths(value, path, stack, sink)
+
+            return
+
+        if len(value) != len(self.items):
+            sink.type_error(path, self.schema, value_type)
+            return
+
+        for index, item in enumerate(self.items):
+            item.visit(value[index], (path, index, None), stack, sink)
+
+
+class MappingNode:
+    """
+    A dictionary with dynamic keys.
+    Every key and value is checked against the same compiled schema.
+    Errors of keys have paths marked with `KEY`, so they are told apart from errors of their values.
+
+    Streaming sinks get the keys walked one at a time, like the items of lists - see `walk_items`.
+    """
+    __slots__ = ('key', 'value', 'strict', 'schema')
+
+    def __init__(self, key, value, strict, schema):
+        self.key = key
+        self.value = value
+        self.strict = strict
+        self.schema = schema
+
+    def visit(self, value, path, stack, sink):
+        if type(value) is not dict and (self.strict or not isinstance(value, Mapping)):
+            sink.type_error(path, self.schema, None if value is None else type(value))
+            return
+
+        key_node = self.key
+        value_node = deref(self.value)
+
+        if key_node is ANY and value_node is ANY:
+            return
+
+        if sink.streaming:
+            self.walk_items(iter(value.items()), path, stack, ItemErrorLimit(sink, None, False))
+            return
+
+        if key_node is not ANY:
+            for key in value:
+                key_node.visit(key, (path, key, KEY), stack, sink)
+
+        if value_node is ANY:
+            return
+
+        if type(value_node) is TypeNode:
+            T = value_node.schema
+
+            for key, item in value.items():
+                if type(item) is not T:
+                    item_type = type(item)
+
+                    sink.type_error((path, key), T, None if item is None else item_type)
+
+                    if item_type is dict and value_node.extra == 'forbid':
+                        report_additional_paths(item, (path, key), stack, sink)
+
+            return
+
+        for key, item in value.items():
+            value_node.visit(item, (path, key), stack, sink)
+
+    def walk_items(self, items, path, stack, sink):
+        """
+        Checks keys and values until one has errors, then pushes the rest of `items` back.
+        """
+        key_node = self.key
+        value_node = deref(self.value)
+
+        for key, item in items:
+            sink.next_item(None)
+            depth = len(stack)
+
+            if key_node is not ANY:
+                key_node.visit(key, (path, key, KEY), stack, sink)
+
+            if value_node is not ANY:
+                value_node.visit(item, (path, key), stack, sink)
+
+            if len(stack) > depth or sink.bad:
+                stack.insert(depth, (self.walk_items, items, path, sink))
+                return
+
+
+class DictNode:
+    __slots__ = ('nodes', 'items', 'keys', 'optional', 'strict', 'extra', 'schema', 'missing_paths')
+
+    def __init__(self, nodes, optional, strict, schema, extra='forbid'):
+        self.nodes = nodes
+        self.items = tuple(nodes.items())
+        self.keys = frozenset(nodes)
+        self.optional = optional
+        self.strict = strict
+        self.extra = extra
+        self.schema = schema
+
+        """
+        Paths reported as missing when the whole dictionary is missing.
+        Optional branches and references are not expanded.
+        """
+        missing_paths = []
+
+        for key, node in nodes.items():
+            missing_paths.append((key,))
+
+            if isinstance(node, DictNode) and not node.optional:
+                missing_paths.extend((key,) + keys for keys in node.missing_paths)
+
+        self.missing_paths = tuple(missing_paths)
+
+    def visit(self, value, path, stack, sink):
+        if type(value) is dict or (not self.strict and isinstance(value, Mapping)):
+            stack.append((self.walk, value, path, sink))
+            return
+
+        if value is None and self.optional:
+            return
+
+        if isinstance(value, Mapping):
+            sink.type_error(path, dict, type(value))
+        else:
+            sink.type_error(path, self.schema, None if value is None else type(value))
+
+        self.report_missing(path, sink)
+
+    def get_walk(self, value):
+        """
+        Items of lists are walked as long as they are mappings.
+        """
+        if isinstance(value, Mapping):
+            return self.walk
+
+        return None
+
+    def report_missing(self, path, sink):
+        for keys in self.missing_paths:
+            missing_path = path
+
+            for key in keys:
+                missing_path = (missing_path, key)
+
+            sink.missing(missing_path)
+
+    def walk(self, value, path, stack, sink):
+        """
+        The common case - data has exactly the keys of the schema.
+        One set comparison tells us there are no missing or additional keys.
+        """
+        if self.extra == 'ignore':
+            self.walk_known(value, path, stack, sink)
+            return
+
+        if value.keys() == self.keys:
+            for key, node in self.items:
+                node.visit(value[key], (path, key), stack, sink)
+
+            return
+
+        nodes = self.nodes
+
+        for key, node in self.items:
+            key_path = (path, key)
+
+            if key in value:
+                node.visit(value[key], key_path, stack, sink)
+                continue
+
+            sink.missing(key_path)
+
+            if isinstance(node, DictNode) and not node.optional:
+                node.report_missing(key_path, sink)
+
+        if sink.streaming:
+            stack.append((walk_additional_paths, (iter(value.items()), self.strict, nodes), path, sink))
+            return
+
+        for key in value:
+            if key in nodes:
+                continue
+
+            key_path = (path, key)
+
+            sink.additional(key_path)
+
+            nested_value = value[key]
+
+            if type(nested_value) is dict or (not self.strict and isinstance(nested_value, Mapping)):
+                report_additional_paths(nested_value, key_path, stack, sink, self.strict)
+
+    def walk_known(self, value, path, stack, sink):
+        """
+        Unknown keys are allowed, so we only look up the keys of the schema.
+        The rest of the value is never enumerated.
+        """
+        for key, node in self.items:
+            key_path = (path, key)
+            nested_value = value.get(key, MISSING)
+
+            if nested_value is not MISSING:
+                node.visit(nested_value, key_path, stack, sink)
+                continue
+
+            sink.missing(key_path)
+
+            if isinstance(node, DictNode) and not node.optional:
+                node.report_missing(key_path, sink)
+
+
+class ObjectNode(DictNode):
+    """
+    A dictionary schema, validated against the attributes of objects -
+    dataclasses, attrs classes, classes with __slots__ or plain objects.
+    Mappings are still validated as dictionaries.
+    """
+    __slots__ = ('getters',)
+
+    def __init__(self, nodes, optional, strict, schema, extra='forbid'):
+        super().__init__(nodes, optional, strict, schema, extra)
+
+        self.getters = tuple((key, attrgetter(key), node) for key, node in nodes.items())
+
+    def visit(self, value, path, stack, sink):
+        if not isinstance(value, Mapping) and value is not None and is_object(value):
+            stack.append((self.walk_object, value, path, sink))
+            return
+
+        super().visit(value, path, stack, sink)
+
+    def get_walk(self, value):
+        if isinstance(value, Mapping):
+            return self.walk
+
+        if value is not None and is_object(value):
+            return self.walk_object
+
+        return None
+
+    def walk_object(self, value, path, stack, sink):
+        """
+        Attribute names are only needed to report additional attributes.
+        Names come from the class, so attributes can still be missing -
+        unset slots and dataclass fields with `init=False`.
+        """
+        names = None if self.extra == 'ignore' else get_attribute_names(value)
+
+        for key, getter, node in self.getters:
+            key_path = (path, key)
+
+            try:
+                attribute = getter(value)
+            except AttributeError:
+                sink.missing(key_path)
+
+                if isinstance(node, DictNode) and not node.optional:
+                    node.report_missing(key_path, sink)
+
+                continue
+
+            node.visit(attribute, key_path, stack, sink)
+
+        if names is None or names == self.keys:
+            return
+
+        if sink.streaming:
+            attributes = ((name, getattr(value, name, None)) for name in names)
+
+            stack.append((walk_additional_paths, (attributes, self.strict, self.nodes), path, sink))
+            return
+
+        for name in names:
+            if name in self.nodes:
+                continue
+
+            name_path = (path, name)
+
+            sink.additional(name_path)
+
+            attribute = getattr(value, name, None)
+
+            if type(attribute) is dict or (not self.strict and isinstance(attribute, Mapping)):
+                report_additional_paths(attribute, name_path, stack, sink, self.strict)
+
+
+class TaggedNode:
+    """
+    Dictionaries, which are told apart by the value of a tag key.
+    Picking the schema for a value is one dict lookup.
+    """
+    __slots__ = ('tag', 'branches', 'strict', 'objects', 'schema')
+
+    optional = False
+
+    def __init__(self, tag, branches, strict, objects, schema):
+        self.tag = tag
+        self.branches = branches
+        self.strict = strict
+        self.objects = objects
+        self.schema = schema
+
+    def visit(self, value, path, stack, sink):
+        if type(value) is dict or (not self.strict and isinstance(value, Mapping)):
+            stack.append((self.walk, value, path, sink))
+            return
+
+        if self.objects and value is not None and not isinstance(value, Mapping) and is_object(value):
+            stack.append((self.walk, value, path, sink))
+            return
+
+        sink.type_error(path, self.schema, None if value is None else type(value))
+
+    def get_walk(self, value):
+        if isinstance(value, Mapping) or (self.objects and value is not None and is_object(value)):
+            return self.walk
+
+        return None
+
+    def walk(self, value, path, stack, sink):
+        if isinstance(value, Mapping):
+            tag = value.get(self.tag, MISSING)
+        else:
+            tag = getattr(value, self.tag, MISSING)
+
+        if tag is MISSING:
+            sink.missing((path, self.tag))
+            return
+
+        try:
+            branch = self.branches.get(tag)
+        except TypeError:
+            branch = None
+
+        if branch is None:
+            sink.type_error((path, self.tag), self.schema, type(tag))
+            return
+
+        branch.get_walk(value)(value, path, stack, sink)
+
+
+class RefNode:
+    """
+    A back-edge in the compiled schema graph.
+    `node` is filled in once the referenced definition is compiled.
+    """
+    __slots__ = ('name', 'node', 'schema')
+
+    def __init__(self, name, schema):
+        self.name = name
+        self.node = None
+        self.schema = schema
+
+    def visit(self, value, path, stack, sink):
+        self.node.visit(value, path, stack, sink)
+
+
+class UnionNode:
+    """
+    Branches are picked by the exact type of the value, with one dict lookup.
+    Dictionary branches are told apart by a key that only they have.
+
+    When parsing, a value that no branch takes is converted by the first branch, which can convert it.
+    """
+    __slots__ = ('branches', 'strict', 'schema', 'dispatch', 'dict_branches', 'accepts_any', 'coercions')
+
+    def __init__(self, branches, strict, schema):
+        self.branches = branches
+        self.strict = strict
+        self.schema = schema
+        self.dispatch = {}
+        self.dict_branches = ()
+        self.accepts_any = False
+        self.coercions = ()
+
+    def visit(self, value, path, stack, sink):
+        node = self.dispatch.get(type(value))
+
+        if node is None:
+            node = self.select(value)
+
+            if node is None:
+                if len(self.coercions) == 0 or not self.coerce(value, path, stack, sink):
+                    sink.type_error(path, self.schema, None if value is None else type(value))
+
+                return
+
+        node.visit(value, path, stack, sink)
+
+    def coerce(self, value, path, stack, sink) -> bool:
+        value_type = type(value)
+
+        for coercion in self.coercions:
+            if value_type not in coercion.source_types:
+                continue
+
+            try:
+                converted = coercion.convert(value)
+            except (ValueError, TypeError, ArithmeticError):
+                continue
+
+            sink.converted(path, converted)
+            coercion.node.visit(converted, path, stack, sink)
+
+            return True
+
+        return False
+
+    def select(self, value):
+        if self.accepts_any:
+            return ANY
+
+        if isinstance(value, Mapping) or (value is not None and is_object(value)):
+            for key, branch in self.dict_branches:
+                if key is None or has_key(branch, value, key):
+                    return branch
+
+            return None
+
+        if not self.strict and is_sequence(value):
+            return self.dispatch.get(list)
+
+        return None
+
+    def build(self):
+        """
+        Called once references are resolved.
+        """
+        dict_branches = []
+        nodes = list(flatten_union(self))
+
+        """
+        A reference to `Any` makes the whole union `Any`.
+        """
+        if ANY in nodes:
+            self.accepts_any = True
+            return
+
+        self.coercions = tuple(node for node in nodes if type(node) is CoerceNode)
+
+        for node in nodes:
+            if isinstance(node, DictNode):
+                dict_branches.append(node)
+                continue
+
+            for T in get_dispatch_types(node, self.schema):
+                existing = self.dispatch.get(T)
+
+                if existing is not None and existing is not node and not is_same_type_node(existing, node):
+                    raise SchemaError(f'{self.schema!r} has more than one branch for {get_type_name(T)}')
+
+                self.dispatch[T] = node
+
+        if len(dict_branches) > 0 and dict in self.dispatch:
+            raise SchemaError(f'{self.schema!r} has more than one branch for dict')
+
+        if len(dict_branches) == 1:
+            branch = dict_branches[0]
+
+            self.dict_branches = ((None, branch),)
+
+            if type(branch) is DictNode:
+                self.dispatch[dict] = branch
+
+            return
+
+        discriminators = []
+
+        for branch in dict_branches:
+            other_keys = set()
+
+            for other_branch in dict_branches:
+                if other_branch is not branch:
+                    other_keys.update(other_branch.keys)
+
+            unique_keys = [key for key, _ in branch.items if key not in other_keys]
+
+            if len(unique_keys) == 0:
+                raise SchemaError(f'Every dictionary in {self.schema!r} needs a key, which the others do not have')
+
+            discriminators.append((unique_keys[0], branch))
+
+        self.dict_branches = tuple(discriminators)
+
+
+def has_key(node, value, key):
+    if isinstance(value, Mapping):
+        return key in value
+
+    return type(node) is ObjectNode and hasattr(value, key)
+
+
+def flatten_union(node):
+    node = deref(node)
+
+    if type(node) is UnionNode:
+        for branch in node.branches:
+            yield from flatten_union(branch)
+    elif type(node) is OptionalNode:
+        yield NONE
+        yield from flatten_union(node.node)
+    else:
+        if isinstance(node, DictNode) and node.optional:
+            yield NONE
+
+        yield node
+
+
+def is_same_type_node(node, other):
+    return type(node) is TypeNode and type(other) is TypeNode and node.schema is other.schema
+
+
+def get_dispatch_types(node, schema):
+    if type(node) is CoerceNode:
+        return get_dispatch_types(node.node, schema)
+
+    if type(node) is TypeNode:
+        return (node.schema,)
+
+    if type(node) is NoneNode:
+        return (type(None),)
+
+    if type(node) is ListNode:
+        return (list,)
+
+    if type(node) is TupleNode:
+        return (list, tuple)
+
+    if type(node) is MappingNode:
+        return (dict,)
+
+    if type(node) is TaggedNode:
+        return (dict,)
+
+    if type(node) is RangeNode:
+        return (node.T,)
+
+    if type(node) is StrNode:
+        return (str,)
+
+    if type(node) is EnumNode:
+        return tuple(node.value_types)
+
+    raise SchemaError(f'{schema!r} can not have {node.schema!r} as a branch')
+
+
+def deref(node):
+    while type(node) is RefNode:
+        node = node.node
+
+    return node
+
+
+def check_extra(extra: str) -> str:
+    if extra not in EXTRA_OPTIONS:
+        raise SchemaError(f'extra must be one of {EXTRA_OPTIONS!r}, got {extra!r}')
+
+    return extra
+
+
+class SchemaCompiler:
+    def __init__(
+        self,
+        definitions: Optional[Definitions] = None,
+        strict: bool = True,
+        objects: bool = False,
+        extra: str = 'forbid',
+        coerce: bool = False
+    ):
+        self.definitions = definitions or {}
+        self.strict = strict
+        self.objects = objects
+        self.extra = check_extra(extra)
+        self.coerce = coerce
+        self.coercions: dict = {}
+
+        if coerce:
+            from .coercions import COERCIONS
+
+            self.coercions = COERCIONS
+
+        self.refs: Dict[str, RefNode] = {}
+        self.unions: list = []
+
+    def compile(self, schema: Any):
+        node = self.compile_node(schema)
+
+        if self.coerce and type(node) in (TypeNode, RangeNode):
+            T = node.T if type(node) is RangeNode else node.schema
+            coercion = self.coercions.get(T) if isinstance(T, type) else None
+
+            if coercion is not None:
+                return CoerceNode(node, *coercion)
+
+        return node
+
+    def compile_node(self, schema: Any):
+        if is_any_or_optional_any(schema):
+            return ANY
+
+        if schema is None:
+            return NONE if self.extra == 'forbid' else NONE_IGNORING_EXTRA
+
+        if is_ref(schema):
+            return self.compile_ref(schema)
+
+        if is_extra(schema):
+            return self.compile_extra(schema)
+
+        if is_item_errors(schema):
+            return self.compile_item_errors(schema)
+
+        if is_union(schema):
+            return self.compile_union(schema)
+
+        if is_tagged(schema):
+            return self.compile_tagged(schema)
+
+        if is_range(schema):
+            return self.compile_range(schema)
+
+        if is_str_constraint(schema):
+            return self.compile_str(schema)
+
+        if is_enum(schema):
+            return self.compile_enum(schema)
+
+        if is_optional(schema):
+            optional_type = get_optional_type(schema)
+
+            if isinstance(optional_type, Mapping):
+                return self.compile_dict(optional_type, optional=True)
+
+            return OptionalNode(
+                self.compile(optional_type),
+                allows_mappings=type(optional_type) is type,
+                extra=self.extra,
+                schema=schema
+            )
+
+        if isinstance(schema, Mapping):
+            return self.compile_dict(schema, optional=False)
+
+        if is_dict_type(schema):
+            return MappingNode(self.compile_key(schema.K), self.compile(schema.V), self.strict, schema)
+
+        if is_tuple(schema):
+            items = tuple(self.compile(T) for T in get_tuple_types(schema))
+
+            return TupleNode(items, self.strict, schema, self.extra)
+
+        if is_list(schema):
+            if len(schema) > 1:
+                raise SchemaError(f'{schema!r} has more than one item type. Use types.Tuple for fixed-shape lists')
+
+            return ListNode(self.compile(get_list_type(schema)), self.strict, None, None, schema, extra=self.extra)
+
+        if type(schema) is ListType:
+            self.check_lengths(schema)
+
+            return ListNode(
+                self.compile(get_list_type(schema)),
+                self.strict,
+                schema.min_len,
+                schema.max_len,
+                schema,
+                extra=self.extra
+            )
+
+        return TypeNode(schema, self.extra)
+
+    def compile_dict(self, schema, optional):
+        nodes = {key: self.compile(value) for key, value in schema.items()}
+
+        """
+        Optional branches are reported as plain dictionaries in type errors.
+        """
+        expected = {
+            key: node.schema if type(node) is DictNode else schema[key]
+            for key, node in nodes.items()
+        }
+
+        if not self.objects:
+            return DictNode(nodes, optional=optional, strict=self.strict, schema=expected, extra=self.extra)
+
+        for key in nodes:
+            if not isinstance(key, str):
+                raise SchemaError(f'Keys of object schemas must be attribute names, got {key!r}')
+
+        return ObjectNode(nodes, optional=optional, strict=self.strict, schema=expected, extra=self.extra)
+
+    def compile_key(self, schema):
+        """
+        Keys of dictionaries are never converted.
+        """
+        coerce = self.coerce
+        self.coerce = False
+
+        try:
+            return self.compile(schema)
+        finally:
+            self.coerce = coerce
+
+    def compile_extra(self, schema):
+        """
+        The option applies to the whole subtree, unless a nested schema sets its own.
+        """
+        extra = self.extra
+        self.extra = check_extra(schema.extra)
+
+        try:
+            return self.compile(schema.schema)
+        finally:
+            self.extra = extra
+
+    def compile_item_errors(self, schema):
+        node = self.compile(schema.schema)
+
+        if type(node) is not ListNode:
+            raise SchemaError(f'{schema!r} must wrap a list schema')
+
+        if schema.limit is not None and (type(schema.limit) is not int or schema.limit < 1):
+            raise SchemaError(f'{schema!r} must have a positive limit')
+
+        node.limit = schema.limit
+        node.per_path = schema.per_path
+
+        return node
+
+    def compile_union(self, schema):
+        branches = []
+
+        for T in get_union_types(schema):
+            node = self.compile(T)
+
+            if node is ANY:
+                return ANY
+
+            branches.append(node)
+
+        union = UnionNode(branches, self.strict, schema)
+
+        self.unions.append(union)
+
+        return union
+
+    def build_unions(self):
+        for union in self.unions:
+            union.build()
+
+    def compile_tagged(self, schema):
+        branches = {}
+
+        for tag_value, branch_schema in schema.schemas.items():
+            if not isinstance(branch_schema, Mapping):
+                raise SchemaError(f'Every schema in {schema!r} must be a dictionary, got {branch_schema!r}')
+
+            """
+            The tag is already checked when picking the branch.
+            """
+            if schema.tag not in branch_schema:
+                branch_schema = {schema.tag: Any, **branch_schema}
+
+            branches[tag_value] = self.compile_dict(branch_schema, optional=False)
+
+        return TaggedNode(schema.tag, branches, self.strict, self.objects, schema)
+
+    def compile_range(self, schema):
+        for bound in (schema.min, schema.max):
+            if bound is not None and (type(bound) is bool or not isinstance(bound, (int, float))):
+                raise SchemaError(f'Bounds of {schema!r} must be numbers')
+
+        return RangeNode(schema.T, schema.min, schema.max, schema, self.extra)
+
+    def check_lengths(self, schema):
+        for length in (schema.min_len, schema.max_len):
+            if length is not None and (type(length) is not int or length < 0):
+                raise SchemaError(f'Lengths of {schema!r} must be non-negative integers')
+
+    def compile_str(self, schema):
+        self.check_lengths(schema)
+
+        pattern = schema.pattern
+
+        if pattern is not None:
+            import re
+
+            try:
+                pattern = re.compile(pattern)
+            except re.error as e:
+                raise SchemaError(f'Invalid pattern in {schema!r}: {e}')
+
+        return StrNode(schema.min_len, schema.max_len, pattern, schema, self.extra)
+
+    def compile_enum(self, schema):
+        try:
+            values = frozenset((type(value), value) for value in schema.values)
+        except TypeError:
+            raise SchemaError(f'Values of {schema!r} must be hashable')
+
+        return EnumNode(values, schema)
+
+    def compile_ref(self, ref):
+        name = get_ref_name(ref)
+
+        if name not in self.refs:
+            self.refs[name] = RefNode(name, ref)
+
+        return self.refs[name]
+
+    def resolve_refs(self):
+        """
+        Compiling a definition can reference new definitions,
+        so we keep going until every reference has a target.
+        """
+        unresolved = [ref for ref in self.refs.values() if ref.node is None]
+
+        while len(unresolved) > 0:
+            for ref in unresolved:
+                if ref.name not in self.definitions:
+                    raise SchemaError(f'Undefined schema reference: {ref.name!r}')
+
+                ref.node = self.compile(self.definitions[ref.name])
+
+            unresolved = [ref for ref in self.refs.values() if ref.node is None]
+
+        for ref in self.refs.values():
+            seen = set()
+            node = ref
+
+            while type(node) is RefNode:
+                if node.name in seen:
+                    raise SchemaError(f'Schema reference {ref.name!r} does not resolve to a schema')
+
+                seen.add(node.name)
+                node = node.node
+
+
+def visit_root(root, value, stack, sink) -> None:
+    """
+    Dictionary schemas take any mapping at the top - or any object, when they validate objects -
+    even with `strict=True`.
+    """
+    root = deref(root)
+    walk = root.get_walk(value) if isinstance(root, (DictNode, TaggedNode)) else None
+
+    if walk is not None:
+        walk(value, None, stack, sink)
+    else:
+        root.visit(value, None, stack, sink)
+
+
+class CompiledSchema:
+    """
+    Compiled schemas are not changed after `compile_schema` returns.
+    Every validation keeps its state - the stack and the collected errors - to itself,
+    so one compiled schema can be shared by any number of threads, without locks.
+    """
+    def __init__(
+        self,
+        root,
+        definitions: Definitions,
+        strict: bool,
+        objects: bool,
+        extra: str = 'forbid',
+        coerce: bool = False
+    ):
+        self.root = root
+        self.definitions = definitions
+        self.strict = strict
+        self.objects = objects
+        self.extra = extra
+        self.coerce = coerce
+
+    def dumps(self) -> bytes:
+        """
+        The compiled node graph, with resolved references and union dispatch tables.
+        """
+        import pickle
+
+        return pickle.dumps((DUMP_FORMAT, self), protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def loads(dumped: bytes) -> 'CompiledSchema':
+        """
+        Loads a schema from `dumps`, without compiling it again.
+        Like any pickle, only load bytes you trust.
+        """
+        import pickle
+
+        version, compiled = pickle.loads(dumped)
+
+        if version != DUMP_FORMAT:
+            raise SchemaError(f'Can not load a schema dumped in format {version}, expected {DUMP_FORMAT}')
+
+        return compiled
+
+    def validate(self, data, sampling: Optional[Sampling] = None) -> SchemaValidationResult:
+        sink = ErrorCollector(sampling)
+
+        self.run(data, sink)
+
+        return sink.get_result()
+
+    def run(self, data, sink, stack: Optional[list] = None) -> None:
+        """
+        `stack` is an empty list to reuse, which is empty again when `run` returns.
+        """
+        if stack is None:
+            stack = []
+
+        visit_root(self.root, data, stack, sink)
+
+        while len(stack) > 0:
+            walk, value, path, walk_sink = stack.pop()
+            walk(value, path, stack, walk_sink)
+
+
+class Validator:
+    """
+    Validates data against one compiled schema, reusing its stack and error collector between calls.
+
+    `validate_into` refills an existing result, so validating valid data allocates no result objects.
+    Validators keep state between calls - use one per thread.
+    """
+    __slots__ = ('schema', 'sink', 'stack')
+
+    def __init__(self, schema: CompiledSchema, sampling: Optional[Sampling] = None):
+        self.schema = schema
+        self.sink = ErrorCollector(sampling)
+        self.stack: list = []
+
+    def validate(self, data) -> SchemaValidationResult:
+        return self.validate_into(data, SchemaValidationResult.empty())
+
+    def validate_into(self, data, result: SchemaValidationResult) -> SchemaValidationResult:
+        """
+        Clears `result` and fills it with the errors of `data`.
+        """
+        sink = self.sink
+        stack = self.stack
+
+        sink.reset(result)
+        stack.clear()
+
+        self.schema.run(data, sink, stack)
+
+        result.refresh()
+
+        return result
+
+
+def compile_schema(
+    schema: Any,
+    definitions: Optional[Definitions] = None,
+    strict: bool = True,
+    objects: bool = False,
+    extra: str = 'forbid',
+    coerce: bool = False
+) -> CompiledSchema:
+    """
+    With `strict=True`, nested dictionaries and lists must be exactly `dict` and `list`.
+    With `strict=False`, any `Mapping` and `Sequence` (except strings) is validated in place.
+
+    With `objects=True`, dictionary schemas also validate the attributes of objects.
+
+    With `extra='ignore'`, keys unknown to the schema are allowed and never enumerated.
+    `types.Extra(schema, extra)` sets the option for a single part of the schema.
+
+    With `coerce=True`, values are converted to the types of the schema where possible.
+    Such schemas are meant for `parse`.
+    """
+    compiler = SchemaCompiler(definitions, strict, objects, extra, coerce)
+
+    root = compiler.compile(schema)
+    compiler.resolve_refs()
+    compiler.build_unions()
+
+    return CompiledSchema(root, compiler.definitions, strict, objects, extra, coerce)
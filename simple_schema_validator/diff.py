@@ -0,0 +1,256 @@
+from typing import Any, Optional, Union
+
+from collections import Counter
+from collections.abc import Mapping
+from operator import itemgetter
+
+from .compiler import (
+    MISSING,
+    CompiledSchema,
+    Definitions,
+    DictNode,
+    ErrorCollector,
+    compile_schema,
+    deref,
+    report_additional_paths,
+    visit_root
+)
+from .result import SchemaValidationResult
+
+
+class ValidationDiff:
+    """
+    Errors of two versions of a payload, validated against the same schema.
+
+    - `new_errors` - errors of the new payload, which the old one does not have.
+    - `fixed_errors` - errors of the old payload, which the new one does not have.
+    - `unchanged_errors` - errors of both payloads.
+    """
+    def __init__(self, *, old, new, new_errors, fixed_errors, unchanged_errors):
+        self.__old = old
+        self.__new = new
+        self.__new_errors = new_errors
+        self.__fixed_errors = fixed_errors
+        self.__unchanged_errors = unchanged_errors
+
+    @property
+    def old(self) -> SchemaValidationResult:
+        return self.__old
+
+    @property
+    def new(self) -> SchemaValidationResult:
+        return self.__new
+
+    @property
+    def new_errors(self) -> SchemaValidationResult:
+        return self.__new_errors
+
+    @property
+    def fixed_errors(self) -> SchemaValidationResult:
+        return self.__fixed_errors
+
+    @property
+    def unchanged_errors(self) -> SchemaValidationResult:
+        return self.__unchanged_errors
+
+    def __bool__(self):
+        """
+        The new payload does not introduce errors.
+        """
+        return bool(self.__new_errors)
+
+
+def make_result(missing_keys, additional_keys, type_errors) -> SchemaValidationResult:
+    return SchemaValidationResult(
+        valid=not missing_keys and not additional_keys and not type_errors,
+        missing_keys=sorted(missing_keys),
+        additional_keys=sorted(additional_keys),
+        type_errors=sorted(type_errors, key=itemgetter('path'))
+    )
+
+
+def get_error_key(error: dict) -> tuple:
+    """
+    Both payloads are validated against the same compiled nodes, so `expected` is the same object.
+    """
+    return error['path'], id(error['expected']), error['actual']
+
+
+def subtract(errors: list, other: list, key=None) -> list:
+    """
+    Errors, which are not in `other`, counting repeated errors.
+    """
+    remaining = Counter(map(key, other) if key else other)
+    difference = []
+
+    for error in errors:
+        error_key = key(error) if key else error
+
+        if remaining[error_key] > 0:
+            remaining[error_key] -= 1
+        else:
+            difference.append(error)
+
+    return difference
+
+
+"""
+Values of these types are compared with `==`, which takes constant time or is bounded by their length.
+"""
+SCALAR_TYPES = frozenset((str, int, float, bool, bytes, type(None)))
+
+
+def is_same(old: Any, new: Any) -> bool:
+    """
+    Subtrees are the same when they are one object, or equal scalars of the same type.
+    `==` alone is not enough - `1 == 1.0 == True`, but they are different types.
+
+    Containers are never compared as a whole. Dictionaries are walked together, and other containers
+    are validated once per payload - errors, which both of them have, are still unchanged errors.
+    """
+    if old is new:
+        return True
+
+    value_type = type(old)
+
+    return value_type is type(new) and value_type in SCALAR_TYPES and old == new
+
+
+class DiffWalker:
+    def __init__(self, strict: bool):
+        self.strict = strict
+        self.old_sink = ErrorCollector()
+        self.new_sink = ErrorCollector()
+        self.both_sink = ErrorCollector()
+        self.stack: list = []
+        self.pairs: list = []
+
+    def visit(self, node, value, path, sink, is_root):
+        """
+        The data at the top can be any mapping.
+        """
+        if is_root:
+            visit_root(node, value, self.stack, sink)
+        else:
+            node.visit(value, path, self.stack, sink)
+
+    def is_walked_together(self, node, value, is_root):
+        if type(node) is not DictNode:
+            return False
+
+        return type(value) is dict or (isinstance(value, Mapping) and (is_root or not self.strict))
+
+    def run(self, root, old, new):
+        self.pairs.append((root, old, new, None, True))
+
+        while len(self.pairs) > 0:
+            node, old, new, path, is_root = self.pairs.pop()
+            node = deref(node)
+
+            if is_same(old, new):
+                self.visit(node, old, path, self.both_sink, is_root)
+            elif self.is_walked_together(node, old, is_root) and self.is_walked_together(node, new, is_root):
+                self.walk_together(node, old, new, path)
+            else:
+                self.visit(node, old, path, self.old_sink, is_root)
+                self.visit(node, new, path, self.new_sink, is_root)
+
+        stack = self.stack
+
+        while len(stack) > 0:
+            walk, value, path, walk_sink = stack.pop()
+            walk(value, path, stack, walk_sink)
+
+    def walk_together(self, node, old, new, path):
+        for key, child in node.items:
+            key_path = (path, key)
+            old_value = old.get(key, MISSING)
+            new_value = new.get(key, MISSING)
+
+            if old_value is not MISSING and new_value is not MISSING:
+                self.pairs.append((child, old_value, new_value, key_path, False))
+                continue
+
+            for value, sink in ((old_value, self.old_sink), (new_value, self.new_sink)):
+                if value is not MISSING:
+                    child.visit(value, key_path, self.stack, sink)
+                    continue
+
+                sink.missing(key_path)
+
+                if isinstance(child, DictNode) and not child.optional:
+                    child.report_missing(key_path, sink)
+
+        if node.extra == 'ignore':
+            return
+
+        for value, sink in ((old, self.old_sink), (new, self.new_sink)):
+            for key in value:
+                if key in node.nodes:
+                    continue
+
+                key_path = (path, key)
+
+                sink.additional(key_path)
+
+                nested_value = value[key]
+
+                if type(nested_value) is dict or (not self.strict and isinstance(nested_value, Mapping)):
+                    report_additional_paths(nested_value, key_path, self.stack, sink, self.strict)
+
+
+def validate_diff(
+    schema: Union[Any, CompiledSchema],
+    old: Any,
+    new: Any,
+    definitions: Optional[Definitions] = None,
+    strict: bool = True,
+    extra: str = 'forbid'
+) -> ValidationDiff:
+    """
+    Validates two versions of a payload in one traversal.
+
+    Dictionaries are walked together, key by key. Subtrees, which are the same object in both payloads,
+    are validated once and their errors are unchanged.
+    """
+    if not isinstance(schema, CompiledSchema):
+        schema = compile_schema(schema, definitions, strict, extra=extra)
+
+    walker = DiffWalker(schema.strict)
+    walker.run(schema.root, old, new)
+
+    old_sink = walker.old_sink
+    new_sink = walker.new_sink
+    both_sink = walker.both_sink
+
+    errors = {}
+
+    for name, key in (('missing_keys', None), ('additional_keys', None), ('type_errors', get_error_key)):
+        old_errors = getattr(old_sink, name)
+        new_errors = getattr(new_sink, name)
+        both_errors = getattr(both_sink, name)
+
+        new_only = subtract(new_errors, old_errors, key)
+
+        errors[name] = {
+            'old': [*old_errors, *both_errors],
+            'new': [*new_errors, *both_errors],
+            'new_errors': new_only,
+            'fixed_errors': subtract(old_errors, new_errors, key),
+            'unchanged_errors': [*both_errors, *subtract(new_errors, new_only, key)]
+        }
+
+    def get_result(category):
+        return make_result(
+            errors['missing_keys'][category],
+            errors['additional_keys'][category],
+            errors['type_errors'][category]
+        )
+
+    return ValidationDiff(
+        old=get_result('old'),
+        new=get_result('new'),
+        new_errors=get_result('new_errors'),
+        fixed_errors=get_result('fixed_errors'),
+        unchanged_errors=get_result('unchanged_errors')
+    )
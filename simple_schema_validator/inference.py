@@ -0,0 +1,282 @@
+from typing import Any, Iterable, Optional
+
+from itertools import islice
+
+from .schema_types import types
+
+
+"""
+Dictionaries with more distinct keys are inferred as `types.Dict[K, V]`.
+"""
+MAX_KEYS = 64
+
+NONE_TYPE = type(None)
+
+
+class Shape:
+    """
+    Types seen at one place in the samples.
+
+    A shape grows with the number of distinct keys, not with the number of samples,
+    and two shapes can be merged - they are built in parallel and merged at the end.
+    """
+    __slots__ = ('count', 'scalars', 'lists', 'items', 'dicts', 'fields', 'key_types', 'values')
+
+    def __init__(self):
+        self.count = 0
+        self.scalars: set = set()
+        self.lists = 0
+        self.items: Optional[Shape] = None
+        self.dicts = 0
+        """
+        Shapes of values by key, or `None`, once there are too many keys.
+        Then, the values of all keys are merged in `values`.
+        """
+        self.fields: Optional[dict] = {}
+        self.key_types: set = set()
+        self.values: Optional[Shape] = None
+
+    def add(self, value: Any, max_keys: int = MAX_KEYS):
+        stack = [(self, value)]
+
+        while len(stack) > 0:
+            shape, value = stack.pop()
+            shape.count += 1
+
+            T = type(value)
+
+            if T is dict:
+                shape.dicts += 1
+
+                """
+                The shape collapses before values are pushed, so they are never added to fields it dropped.
+                """
+                if shape.fields is not None:
+                    shape.add_fields(value, max_keys)
+
+                fields = shape.fields
+
+                if fields is None:
+                    values = shape.get_values()
+
+                    shape.key_types.update(map(type, value))
+                    stack.extend((values, nested) for nested in value.values())
+                    continue
+
+                stack.extend((fields[key], nested) for key, nested in value.items())
+                continue
+
+            if T is list:
+                shape.lists += 1
+
+                if shape.items is None:
+                    shape.items = Shape()
+
+                stack.extend((shape.items, item) for item in value)
+                continue
+
+            shape.scalars.add(T)
+
+    def add_fields(self, keys: Iterable, max_keys: int):
+        fields = self.fields
+
+        if fields is None:
+            return
+
+        for key in keys:
+            if key not in fields:
+                fields[key] = Shape()
+
+        if len(fields) > max_keys:
+            self.collapse()
+
+    def collapse(self):
+        """
+        Merges the values of all keys, when the keys look like data, rather than names.
+        """
+        fields = self.fields
+
+        if fields is None:
+            return
+
+        values = Shape()
+
+        for key, field in fields.items():
+            self.key_types.add(type(key))
+            values.merge(field)
+
+        if self.values is not None:
+            values.merge(self.values)
+
+        self.fields = None
+        self.values = values
+
+    def get_values(self) -> 'Shape':
+        """
+        The merged shape of the values of all keys, once the shape collapsed.
+        """
+        if self.values is None:
+            self.values = Shape()
+
+        return self.values
+
+    def merge(self, other: 'Shape', max_keys: int = MAX_KEYS):
+        stack = [(self, other)]
+
+        while len(stack) > 0:
+            shape, other = stack.pop()
+
+            shape.count += other.count
+            shape.scalars.update(other.scalars)
+            shape.lists += other.lists
+            shape.dicts += other.dicts
+
+            if other.items is not None:
+                if shape.items is None:
+                    shape.items = Shape()
+
+                stack.append((shape.items, other.items))
+
+            other_fields = other.fields
+
+            if other_fields is None and shape.fields is not None:
+                shape.collapse()
+
+            if shape.fields is not None and other_fields is not None:
+                shape.add_fields(other_fields, max_keys)
+
+            fields = shape.fields
+
+            if fields is not None and other_fields is not None:
+                stack.extend((fields[key], field) for key, field in other_fields.items())
+                continue
+
+            values = shape.get_values()
+
+            shape.key_types.update(other.key_types)
+
+            if other_fields is not None:
+                shape.key_types.update(map(type, other_fields))
+                stack.extend((values, field) for field in other_fields.values())
+            elif other.values is not None:
+                stack.append((values, other.values))
+
+    def to_schema(self, extra: str = 'forbid') -> Any:
+        """
+        `extra` is the option of the enclosing dictionary, which nested dictionaries inherit.
+        """
+        branches: list = sorted(self.scalars - {NONE_TYPE}, key=lambda T: (T.__module__, T.__qualname__))
+
+        if self.lists > 0:
+            items = self.items
+
+            branches.append([Any if items is None or items.count == 0 else items.to_schema(extra)])
+
+        if self.dicts > 0:
+            branches.append(self.dict_schema(extra))
+
+        if len(branches) == 0:
+            return None if NONE_TYPE in self.scalars else Any
+
+        schema = branches[0] if len(branches) == 1 else types.Union[tuple(branches)]
+
+        if NONE_TYPE in self.scalars:
+            return types.Optional[schema]
+
+        return schema
+
+    def dict_schema(self, extra: str) -> Any:
+        if self.fields is None:
+            K = sorted(self.key_types, key=lambda T: (T.__module__, T.__qualname__))
+
+            return types.Dict[K[0] if len(K) == 1 else types.Union[tuple(K)], self.get_values().to_schema(extra)]
+
+        """
+        Keys are always required, so keys, which some dictionaries do not have, are left out
+        and the dictionary ignores extra keys.
+        """
+        dict_extra = 'forbid'
+
+        if any(field.count < self.dicts for field in self.fields.values()):
+            dict_extra = 'ignore'
+
+        schema = {
+            key: field.to_schema(dict_extra)
+            for key, field in self.fields.items()
+            if field.count == self.dicts
+        }
+
+        if dict_extra == extra:
+            return schema
+
+        return types.Extra(schema, dict_extra)
+
+
+def infer_shape(samples: Iterable, max_keys: int = MAX_KEYS) -> Shape:
+    shape = Shape()
+
+    for sample in samples:
+        shape.add(sample, max_keys)
+
+    return shape
+
+
+def get_chunks(samples: Iterable, chunk_size: int):
+    iterator = iter(samples)
+
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+
+        if len(chunk) == 0:
+            return
+
+        yield chunk
+
+
+def infer_shape_parallel(samples: Iterable, max_keys: int, workers: int, chunk_size: int) -> Shape:
+    """
+    Chunks of samples are inferred in worker processes and their shapes are merged.
+    At most two chunks per worker are in flight, so samples are never all in memory.
+    """
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    shape = Shape()
+    pending: set = set()
+
+    with ProcessPoolExecutor(workers) as executor:
+        for chunk in get_chunks(samples, chunk_size):
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    shape.merge(future.result(), max_keys)
+
+            pending.add(executor.submit(infer_shape, chunk, max_keys))
+
+        for future in pending:
+            shape.merge(future.result(), max_keys)
+
+    return shape
+
+
+def infer_schema(
+    samples: Iterable,
+    max_keys: int = MAX_KEYS,
+    workers: Optional[int] = None,
+    chunk_size: int = 1000
+) -> Any:
+    """
+    Infers a schema, which all samples are valid against.
+
+    Samples are consumed one by one, so `samples` can be a generator. Memory grows with the number
+    of distinct keys, not with the number of samples - dictionaries with more than `max_keys` keys
+    are inferred as `types.Dict[K, V]`.
+
+    With `workers`, chunks of `chunk_size` samples are inferred in that many processes.
+    """
+    if workers is not None and workers > 1:
+        shape = infer_shape_parallel(samples, max_keys, workers, chunk_size)
+    else:
+        shape = infer_shape(samples, max_keys)
+
+    return shape.to_schema()
@@ -0,0 +1,281 @@
+from typing import Any, Dict, Optional, Tuple
+
+from collections.abc import Mapping
+
+from .compiler import Definitions, SchemaError
+from .schema_types import (
+    types,
+    ListType,
+    is_optional,
+    get_optional_type,
+    is_any,
+    is_list,
+    get_list_type,
+    is_ref,
+    get_ref_name,
+    is_union,
+    get_union_types,
+    is_dict_type,
+    is_extra,
+    is_item_errors,
+    is_range,
+    is_str_constraint,
+    is_enum
+)
+
+
+JSONSchema = Dict[str, Any]
+
+DIALECT = 'https://json-schema.org/draft/2020-12/schema'
+
+"""
+Python types, which have a JSON Schema type.
+"""
+JSON_TYPES = {
+    int: 'integer',
+    float: 'number',
+    str: 'string',
+    bool: 'boolean',
+    type(None): 'null'
+}
+
+PYTHON_TYPES = {json_type: T for T, json_type in JSON_TYPES.items()}
+
+REF_PREFIXES = ('#/$defs/', '#/definitions/')
+
+
+def to_json_schema(schema: Any, definitions: Optional[Definitions] = None, extra: str = 'forbid') -> JSONSchema:
+    """
+    Exports a schema as JSON Schema (draft 2020-12).
+
+    Dictionaries, `types.Optional`, lists, `types.List`, `types.Dict`, `types.Union`,
+    `types.Ref`, value constraints and plain JSON types are supported.
+    Anything else raises `SchemaError`.
+    """
+    document = {'$schema': DIALECT, **export_schema(schema, extra)}
+
+    if definitions:
+        document['$defs'] = {name: export_schema(value, extra) for name, value in definitions.items()}
+
+    return document
+
+
+def export_schema(schema: Any, extra: str) -> JSONSchema:
+    if is_any(schema):
+        return {}
+
+    if schema is None:
+        return {'type': 'null'}
+
+    if is_extra(schema):
+        return export_schema(schema.schema, schema.extra)
+
+    if is_item_errors(schema):
+        """
+        How many errors are reported is not part of the schema.
+        """
+        return export_schema(schema.schema, extra)
+
+    if is_optional(schema):
+        T = get_optional_type(schema)
+
+        if is_any(T):
+            return {}
+
+        return {'anyOf': [export_schema(T, extra), {'type': 'null'}]}
+
+    if is_union(schema):
+        return {'anyOf': [export_schema(T, extra) for T in get_union_types(schema)]}
+
+    if is_ref(schema):
+        return {'$ref': f'{REF_PREFIXES[0]}{get_ref_name(schema)}'}
+
+    if isinstance(schema, Mapping):
+        for key in schema:
+            if not isinstance(key, str):
+                raise SchemaError(f'JSON Schema properties must be strings, got {key!r}')
+
+        return {
+            'type': 'object',
+            'properties': {key: export_schema(value, extra) for key, value in schema.items()},
+            'required': list(schema),
+            'additionalProperties': extra == 'ignore'
+        }
+
+    if is_dict_type(schema):
+        if schema.K is not str and not is_any(schema.K):
+            raise SchemaError(f'JSON Schema objects can only have string keys, got {schema!r}')
+
+        return {'type': 'object', 'additionalProperties': export_schema(schema.V, extra)}
+
+    if is_list(schema) or type(schema) is ListType:
+        exported: JSONSchema = {'type': 'array'}
+
+        T = get_list_type(schema)
+
+        if not is_any(T):
+            exported['items'] = export_schema(T, extra)
+
+        if type(schema) is ListType:
+            if schema.min_len is not None:
+                exported['minItems'] = schema.min_len
+
+            if schema.max_len is not None:
+                exported['maxItems'] = schema.max_len
+
+        return exported
+
+    if is_range(schema):
+        exported = {'type': JSON_TYPES[schema.T]}
+
+        if schema.min is not None:
+            exported['minimum'] = schema.min
+
+        if schema.max is not None:
+            exported['maximum'] = schema.max
+
+        return exported
+
+    if is_str_constraint(schema):
+        exported = {'type': 'string'}
+
+        if schema.min_len is not None:
+            exported['minLength'] = schema.min_len
+
+        if schema.max_len is not None:
+            exported['maxLength'] = schema.max_len
+
+        if schema.pattern is not None:
+            exported['pattern'] = schema.pattern
+
+        return exported
+
+    if is_enum(schema):
+        return {'enum': list(schema.values)}
+
+    if isinstance(schema, type) and schema in JSON_TYPES:
+        return {'type': JSON_TYPES[schema]}
+
+    raise SchemaError(f'{schema!r} can not be exported to JSON Schema')
+
+
+def from_json_schema(document: JSONSchema) -> Tuple[Any, Definitions]:
+    """
+    Imports the subset of JSON Schema, which `to_json_schema` exports.
+
+    Returns the schema and its definitions, from `$defs` (or `definitions`).
+    Every property of an object must be required, since keys of schemas always are.
+    """
+    definitions = {
+        name: import_schema(value, 'forbid')
+        for name, value in {**document.get('definitions', {}), **document.get('$defs', {})}.items()
+    }
+
+    return import_schema(document, 'forbid'), definitions
+
+
+def import_schema(document: Any, extra: str) -> Any:
+    """
+    `extra` is the option of the enclosing object, which nested objects inherit.
+    """
+    if document is True or document == {}:
+        return Any
+
+    if not isinstance(document, Mapping):
+        raise SchemaError(f'Can not import {document!r} from JSON Schema')
+
+    if '$ref' in document:
+        return import_ref(document['$ref'])
+
+    if 'anyOf' in document:
+        return import_union([import_schema(nested, extra) for nested in document['anyOf']])
+
+    if 'enum' in document:
+        return types.Enum(*document['enum'])
+
+    json_type = document.get('type')
+
+    if type(json_type) is list:
+        return import_union([import_schema({**document, 'type': T}, extra) for T in json_type])
+
+    if json_type == 'object':
+        return import_object(document, extra)
+
+    if json_type == 'array':
+        return import_array(document, extra)
+
+    if json_type in ('integer', 'number') and ('minimum' in document or 'maximum' in document):
+        constraint = types.Int if json_type == 'integer' else types.Float
+
+        return constraint(min=document.get('minimum'), max=document.get('maximum'))
+
+    if json_type == 'string' and any(key in document for key in ('minLength', 'maxLength', 'pattern')):
+        return types.Str(
+            min_len=document.get('minLength'),
+            max_len=document.get('maxLength'),
+            pattern=document.get('pattern')
+        )
+
+    if json_type == 'null':
+        return None
+
+    if json_type in PYTHON_TYPES:
+        return PYTHON_TYPES[json_type]
+
+    raise SchemaError(f'Can not import {document!r} from JSON Schema')
+
+
+def import_ref(ref: str) -> Any:
+    for prefix in REF_PREFIXES:
+        if ref.startswith(prefix):
+            return types.Ref(ref[len(prefix):])
+
+    raise SchemaError(f'Only references to definitions can be imported, got {ref!r}')
+
+
+def import_union(Ts: list) -> Any:
+    if len(Ts) == 2 and None in Ts:
+        Ts.remove(None)
+
+        return types.Optional[Ts[0]]
+
+    return types.Union[tuple(Ts)]
+
+
+def import_object(document: Mapping, extra: str) -> Any:
+    additional = document.get('additionalProperties', True)
+
+    if 'properties' not in document:
+        if isinstance(additional, Mapping):
+            return types.Dict[str, import_schema(additional, extra)]
+
+        return types.Dict[str, Any]
+
+    if additional is not True and additional is not False:
+        raise SchemaError('Objects with both properties and an additionalProperties schema can not be imported')
+
+    properties = document['properties']
+    required = set(document.get('required', []))
+
+    not_required = [key for key in properties if key not in required]
+
+    if len(not_required) > 0:
+        raise SchemaError(f'Every property must be required, got {not_required!r}')
+
+    object_extra = 'ignore' if additional else 'forbid'
+
+    schema = {key: import_schema(value, object_extra) for key, value in properties.items()}
+
+    if object_extra == extra:
+        return schema
+
+    return types.Extra(schema, object_extra)
+
+
+def import_array(document: Mapping, extra: str) -> Any:
+    T = import_schema(document.get('items', True), extra)
+
+    if 'minItems' in document or 'maxItems' in document:
+        return types.List[T, document.get('minItems'), document.get('maxItems')]
+
+    return [T]
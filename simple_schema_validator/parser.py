@@ -0,0 +1,135 @@
+from typing import Any, List, Optional, Tuple, Union
+
+from collections.abc import Mapping
+
+from .compiler import CompiledSchema, Definitions, ErrorCollector, SchemaError, compile_schema
+from .result import SchemaValidationResult
+
+
+class ConversionCollector(ErrorCollector):
+    """
+    Collects errors and the values converted while validating.
+    """
+    __slots__ = ('conversions',)
+
+    converting = True
+
+    def __init__(self):
+        super().__init__()
+
+        self.conversions: List[tuple] = []
+
+    def converted(self, path, value):
+        self.conversions.append((path, value))
+
+
+def get_keys(path) -> list:
+    keys = []
+
+    while path is not None:
+        keys.append(path[1])
+        path = path[0]
+
+    keys.reverse()
+
+    return keys
+
+
+def copy_container(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return dict(value)
+
+    return list(value)
+
+
+def build_output(data: Any, conversions: List[tuple]) -> Any:
+    """
+    Only the containers on the way to a converted value are copied.
+    Everything else in the output is the same object as in `data`.
+    """
+    if len(conversions) == 0:
+        return data
+
+    """
+    Converted values, arranged as nested dictionaries of keys.
+    Converted values are kept as `(value,)`, to tell them apart from nested keys.
+    """
+    changes: dict = {}
+
+    for path, value in conversions:
+        keys = get_keys(path)
+
+        if len(keys) == 0:
+            return value
+
+        node = changes
+
+        for key in keys[:-1]:
+            node = node.setdefault(key, {})
+
+        node[keys[-1]] = (value,)
+
+    output = copy_container(data)
+    stack = [(data, changes, output)]
+
+    """
+    Tuples are copied as lists and turned back into tuples once their items are set.
+    Nested tuples come after their parents, so we go through them in reverse.
+    """
+    tuples = []
+
+    if type(data) is tuple:
+        tuples.append((None, None, output))
+
+    while len(stack) > 0:
+        value, node, copy = stack.pop()
+
+        for key, change in node.items():
+            if type(change) is tuple:
+                copy[key] = change[0]
+                continue
+
+            nested_value = value[key]
+            nested_copy = copy_container(nested_value)
+
+            copy[key] = nested_copy
+
+            if type(nested_value) is tuple:
+                tuples.append((copy, key, nested_copy))
+
+            stack.append((nested_value, change, nested_copy))
+
+    for parent, key, copy in reversed(tuples):
+        if parent is None:
+            output = tuple(copy)
+        else:
+            parent[key] = tuple(copy)
+
+    return output
+
+
+def parse(
+    schema: Union[Any, CompiledSchema],
+    data: Any,
+    definitions: Optional[Definitions] = None,
+    strict: bool = True,
+    extra: str = 'forbid'
+) -> Tuple[Any, SchemaValidationResult]:
+    """
+    Validates `data` and converts values to the types of the schema in the same traversal -
+    strings to numbers, ISO strings to datetimes and so on (see `COERCIONS`).
+
+    Returns the converted output and the validation result.
+    Parts of `data` without converted values are reused in the output, not copied.
+    """
+    if not isinstance(schema, CompiledSchema):
+        schema = compile_schema(schema, definitions, strict, extra=extra, coerce=True)
+
+    if schema.objects:
+        raise SchemaError('Schemas compiled with objects=True can not be used for parsing')
+
+    sink = ConversionCollector()
+
+    schema.run(data, sink)
+
+    return build_output(data, sink.conversions), sink.get_result()
@@ -0,0 +1,60 @@
+from operator import itemgetter
+
+
+class SchemaValidationResult:
+    def __init__(self, *, valid, missing_keys, additional_keys, type_errors, sampled_paths=None):
+        self.__valid = valid
+        self.__missing_keys = missing_keys
+        self.__additional_keys = additional_keys
+        self.__type_errors = type_errors
+        self.__sampled_paths = sampled_paths if sampled_paths is not None else []
+
+    @property
+    def missing_keys(self):
+        return self.__missing_keys
+
+    @property
+    def additional_keys(self):
+        return self.__additional_keys
+
+    @property
+    def type_errors(self):
+        return self.__type_errors
+
+    @property
+    def sampled_paths(self):
+        """
+        Paths of lists, which were only partially checked.
+        """
+        return self.__sampled_paths
+
+    @property
+    def sampled(self):
+        return len(self.__sampled_paths) > 0
+
+    def __bool__(self):
+        return self.__valid
+
+    def clear(self) -> None:
+        """
+        Empties the result in place, keeping its lists, so it can be refilled.
+        """
+        self.__valid = True
+        self.__missing_keys.clear()
+        self.__additional_keys.clear()
+        self.__type_errors.clear()
+        self.__sampled_paths.clear()
+
+    def refresh(self) -> None:
+        """
+        Sorts errors, which were appended to the lists of the result, and updates its validity.
+        """
+        self.__missing_keys.sort()
+        self.__additional_keys.sort()
+        self.__type_errors.sort(key=itemgetter('path'))
+        self.__sampled_paths.sort()
+        self.__valid = not self.__missing_keys and not self.__additional_keys and not self.__type_errors
+
+    @classmethod
+    def empty(cls) -> 'SchemaValidationResult':
+        return cls(valid=True, missing_keys=[], additional_keys=[], type_errors=[], sampled_paths=[])
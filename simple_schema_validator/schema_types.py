@@ -1,4 +1,4 @@
-from typing import Any, List
+from typing import Any
 
 from collections.abc import Mapping
 
@@ -7,6 +7,9 @@ class OptionalType:
     def __init__(self, T: Any):
         self.T = T
 
+    def __repr__(self):
+        return f'types.Optional[{get_type_name(self.T)}]'
+
 
 class OptionalTypeFactory:
     def __getitem__(self, T):
@@ -14,183 +17,280 @@ class OptionalTypeFactory:
 
 
 class ListType:
-    def __init__(self, T: Any):
+    def __init__(self, T: Any, min_len: Any = None, max_len: Any = None):
         self.T = T
+        self.min_len = min_len
+        self.max_len = max_len
+
+    def __repr__(self):
+        arguments = [get_type_name(self.T)]
+
+        if self.min_len is not None or self.max_len is not None:
+            arguments.extend([repr(self.min_len), repr(self.max_len)])
+
+        return f'types.List[{", ".join(arguments)}]'
 
 
 class ListTypeFactory:
-    def __getitem__(self, T):
-        return ListType(T)
+    """
+    types.List[T] or types.List[T, min_len, max_len]
+    """
+    def __getitem__(self, args):
+        if type(args) is not tuple:
+            args = (args,)
 
+        return ListType(*args)
 
-def is_optional(t: Any) -> bool:
-    return type(t) is OptionalType
 
+def get_type_name(T: Any) -> str:
+    if isinstance(T, type):
+        return T.__name__
 
-def get_optional_type(t: OptionalType) -> Any:
-    """
-    If t is Optional[T], this function returns T
+    return repr(T)
 
-    Solution idea taken from this SO thread:
-    https://stackoverflow.com/questions/46198178/unpack-optional-type-annotation-in-python-3-5-2
 
-    """
-    return t.T
+class UnionType:
+    def __init__(self, Ts: tuple):
+        self.Ts = Ts
 
+    def __repr__(self):
+        return f'types.Union[{", ".join(map(get_type_name, self.Ts))}]'
 
-def get_listType_type(t: ListType) -> Any:
-    return t.T
 
+class UnionTypeFactory:
+    def __getitem__(self, Ts):
+        if type(Ts) is not tuple:
+            Ts = (Ts,)
 
-def is_optional_schema(v: Any) -> bool:
-    return is_optional(v) and isinstance(get_optional_type(v), Mapping)
+        return UnionType(Ts)
 
 
-def is_any(v: Any) -> bool:
-    return v is Any
+class TupleType:
+    def __init__(self, Ts: tuple):
+        self.Ts = Ts
 
+    def __repr__(self):
+        return f'types.Tuple[{", ".join(map(get_type_name, self.Ts))}]'
 
-def is_any_or_optional_any(v: Any) -> bool:
-    return is_any(v) or (is_optional(v) and is_any(get_optional_type(v)))
 
+class TupleTypeFactory:
+    def __getitem__(self, Ts):
+        if type(Ts) is not tuple:
+            Ts = (Ts,)
 
-def is_list(v: Any) -> bool:
-    return type(v) is list
+        return TupleType(Ts)
 
 
-def is_dict(v: Any) -> bool:
-    return type(v) is dict
+class DictType:
+    def __init__(self, K: Any, V: Any):
+        self.K = K
+        self.V = V
 
+    def __repr__(self):
+        return f'types.Dict[{get_type_name(self.K)}, {get_type_name(self.V)}]'
 
-def get_list_type(v: Any) -> Any:
-    try:
-        if len(v) > 0:
-            return v[0]
-    except TypeError:
-        return get_listType_type(v)
 
-    return Any
+class DictTypeFactory:
+    """
+    types.Dict[K, V] - a dictionary with any keys of type K and values of type V.
+    """
+    def __getitem__(self, args):
+        K, V = args
 
+        return DictType(K, V)
 
-def get_expected_type(v: Any) -> type:
-    if is_list(v):
-        return list
 
-    return v
+class TaggedType:
+    def __init__(self, tag: Any, schemas: Mapping):
+        self.tag = tag
+        self.schemas = schemas
 
+    def __repr__(self):
+        return f'types.Tagged({self.tag!r}, {list(self.schemas)!r})'
 
-class types:
-    Optional = OptionalTypeFactory()
-    List = ListTypeFactory()
 
+class ExtraType:
+    """
+    types.Extra(schema, 'ignore') - unknown keys in `schema` and its nested dictionaries are allowed.
+    """
+    def __init__(self, schema: Any, extra: str):
+        self.schema = schema
+        self.extra = extra
 
-def type_check_lists(_type, value, path):
-    errors = []
+    def __repr__(self):
+        return f'types.Extra({self.schema!r}, {self.extra!r})'
 
-    list_type = get_list_type(_type)
 
-    for index, item in enumerate(value):
-        if is_any(list_type):
-            continue
+class ItemErrorsType:
+    """
+    types.ItemErrors([schema], limit=10) - items are no longer checked once 10 of them have errors.
+    types.ItemErrors([schema], per_path=True) - only the first error at every path inside the items is reported.
+    """
+    def __init__(self, schema: Any, limit: Any = None, per_path: bool = False):
+        self.schema = schema
+        self.limit = limit
+        self.per_path = per_path
 
-        if is_dict(list_type):
-            from .schema_validator import schema_validator
-            validate = schema_validator(list_type, item)
+    def __repr__(self):
+        return f'types.ItemErrors({format_arguments(self.schema, limit=self.limit, per_path=self.per_path or None)})'
 
-            if not bool(validate):
-                for error in validate.type_errors:
-                    errors.append(error)
 
-            continue
+def format_arguments(*args: Any, **kwargs: Any) -> str:
+    arguments = [repr(arg) for arg in args]
+    arguments.extend(f'{key}={value!r}' for key, value in kwargs.items() if value is not None)
 
-        if type(item) is not list_type:
-            errors.append({
-                'path': f'{path}[{index}]',
-                'expected': list_type,
-                'actual': type(item)
-            })
+    return ', '.join(arguments)
 
-    if errors:
-        return False, errors
 
-    return True, None
+class IntType:
+    T: type = int
 
+    def __init__(self, min: Any = None, max: Any = None):
+        self.min = min
+        self.max = max
 
-def type_check(schema_paths_mapping, data_paths_mapping, path, optional_paths):
-    _type = schema_paths_mapping.get(path)
-    value = data_paths_mapping.get(path)
+    def __repr__(self):
+        return f'types.{self.T.__name__.capitalize()}({format_arguments(min=self.min, max=self.max)})'
 
-    """
-    If the given value is another dictionary, don't type check.
-    Consider this a valid type.
-    """
-    if isinstance(value, Mapping):
-        if type(_type) is not type(value):
-            if not is_optional(_type) and not is_any_or_optional_any(_type):
-                return False, [{'path': path, 'expected': type(_type), 'actual': type(value)}]
 
-            if is_optional(_type):
-                optional_type = get_optional_type(_type)
+class FloatType(IntType):
+    T = float
 
-                if type(optional_type) is not type and not is_any_or_optional_any(optional_type):
-                    return False, [{'path': path, 'expected': type(optional_type), 'actual': type(value)}]
 
-        return True, None
+class StrType:
+    def __init__(self, min_len: Any = None, max_len: Any = None, pattern: Any = None):
+        self.min_len = min_len
+        self.max_len = max_len
+        self.pattern = pattern
 
-    """
-    If type is any, we consider this a valid type.
-    """
-    if is_any(_type):
-        return True, None
+    def __repr__(self):
+        return f'types.Str({format_arguments(min_len=self.min_len, max_len=self.max_len, pattern=self.pattern)})'
 
-    """
-    If type is None, we check if the value is also None.
-    """
-    if _type is None:
-        if value is None:
-            return True, None
 
-        return False, [{'path': path, 'expected': None, 'actual': type(value)}]
+class EnumType:
+    def __init__(self, *values: Any):
+        self.values = values
 
-    """
-    If type is types.Optional[T], we do the following:
+    def __repr__(self):
+        return f'types.Enum({format_arguments(*self.values)})'
 
-    1) If value is None => valid.
-    2) Otherwise, we say current type is T and continue.
-    """
-    if is_optional(_type):
-        if value is None:
-            return True, None
 
-        _type = get_optional_type(_type)
+class RefType:
+    def __init__(self, name: str):
+        self.name = name
 
-    if is_list(value):
-        type_check_lists_result = type_check_lists(_type, value, path)
+    def __repr__(self):
+        return f'types.Ref({self.name!r})'
 
-        if type_check_lists_result is not None:
-            return type_check_lists_result
 
-    """
-    Straight-forward case.
-    We take the type of the value and compare.
-    """
-    value_type = type(value)
+def is_optional(t: Any) -> bool:
+    return type(t) is OptionalType
 
-    if value_type is _type:
-        return True, None
 
+def get_optional_type(t: OptionalType) -> Any:
     """
-    If value is None but the path is in the optional paths,
-    we consider this valid.
+    If t is Optional[T], this function returns T
+
+    Solution idea taken from this SO thread:
+    https://stackoverflow.com/questions/46198178/unpack-optional-type-annotation-in-python-3-5-2
 
-    Otherwise we fail with the actual type of the value.
     """
-    actual = value_type
+    return t.T
+
+
+def get_listType_type(t: ListType) -> Any:
+    return t.T
+
+
+def is_union(t: Any) -> bool:
+    return type(t) is UnionType
+
+
+def get_union_types(t: UnionType) -> tuple:
+    return t.Ts
+
+
+def is_tuple(t: Any) -> bool:
+    return type(t) is TupleType
+
+
+def get_tuple_types(t: TupleType) -> tuple:
+    return t.Ts
+
+
+def is_dict_type(t: Any) -> bool:
+    return type(t) is DictType
+
+
+def is_extra(t: Any) -> bool:
+    return type(t) is ExtraType
+
+
+def is_item_errors(t: Any) -> bool:
+    return type(t) is ItemErrorsType
+
+
+def is_tagged(t: Any) -> bool:
+    return type(t) is TaggedType
+
+
+def is_range(t: Any) -> bool:
+    return type(t) is IntType or type(t) is FloatType
+
+
+def is_str_constraint(t: Any) -> bool:
+    return type(t) is StrType
+
+
+def is_enum(t: Any) -> bool:
+    return type(t) is EnumType
+
+
+def is_ref(t: Any) -> bool:
+    return type(t) is RefType
+
 
-    if value is None:
-        if path in optional_paths:
-            return True, None
+def get_ref_name(t: RefType) -> str:
+    return t.name
 
-        actual = None
 
-    return False, [{'path': path, 'expected': get_expected_type(_type), 'actual': actual}]
+def is_optional_schema(v: Any) -> bool:
+    return is_optional(v) and isinstance(get_optional_type(v), Mapping)
+
+
+def is_any(v: Any) -> bool:
+    return v is Any
+
+
+def is_any_or_optional_any(v: Any) -> bool:
+    return is_any(v) or (is_optional(v) and is_any(get_optional_type(v)))
+
+
+def is_list(v: Any) -> bool:
+    return type(v) is list
+
+
+def get_list_type(v: Any) -> Any:
+    try:
+        if len(v) > 0:
+            return v[0]
+    except TypeError:
+        return get_listType_type(v)
+
+    return Any
+
+
+class types:
+    Optional = OptionalTypeFactory()
+    List = ListTypeFactory()
+    Ref = RefType
+    Union = UnionTypeFactory()
+    Tagged = TaggedType
+    Tuple = TupleTypeFactory()
+    Dict = DictTypeFactory()
+    Extra = ExtraType
+    ItemErrors = ItemErrorsType
+    Int = IntType
+    Float = FloatType
+    Str = StrType
+    Enum = EnumType
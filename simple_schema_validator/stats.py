@@ -0,0 +1,227 @@
+from typing import Any, Dict, Optional
+
+import re
+
+from collections import Counter
+from collections.abc import Mapping
+
+from .compiler import KEY, CompiledSchema, Path, Sampling
+from .result import SchemaValidationResult
+
+
+INDEX = re.compile(r'\[\d+\]')
+
+
+def render_schema_path(path: Path) -> str:
+    """
+    Like `render_path`, with list indexes left out - `a[].b`.
+    """
+    parts = []
+
+    while path is not None:
+        parts.append(path)
+        path = path[0]
+
+    rendered = []
+
+    for part in reversed(parts):
+        if len(part) == 3 and part[2] is None:
+            rendered.append('[]')
+        elif rendered:
+            rendered.append(f'.{part[1]}')
+        else:
+            rendered.append(f'{part[1]}')
+
+        if len(part) == 3 and part[2] is KEY:
+            rendered.append(f'[{KEY}]')
+
+    return ''.join(rendered)
+
+
+def get_type_label(T: Any) -> str:
+    """
+    Schemas of dictionaries and lists are counted as `dict` and `list`, not by their whole repr.
+    """
+    if T is None:
+        return 'None'
+
+    if isinstance(T, type):
+        return T.__name__
+
+    if isinstance(T, Mapping):
+        return 'dict'
+
+    if type(T) is list:
+        return 'list'
+
+    return repr(T)
+
+
+class ErrorStats:
+    """
+    Counts the errors of many validations by path, without keeping the errors.
+
+    Paths are absolute and have list indexes left out - errors of `a[0].b` and `a[1].b` are counted for `a[].b`,
+    even when `a` is a list of dictionaries.
+    For every path with type errors, the expected and actual types are counted, too.
+
+    Stats from other threads and processes are merged with `merge` - they can be pickled, or sent as `to_dict()`.
+    """
+    __slots__ = (
+        'validations', 'invalid', 'errors', 'missing_keys', 'additional_keys', 'type_errors',
+        'expected_types', 'actual_types', 'sampled_paths', 'sampling', 'random'
+    )
+
+    converting = False
+    streaming = False
+    absolute_paths = True
+
+    def __init__(self):
+        self.validations = 0
+        self.invalid = 0
+        self.errors = 0
+        self.missing_keys: Counter = Counter()
+        self.additional_keys: Counter = Counter()
+        self.type_errors: Counter = Counter()
+        self.expected_types: Dict[str, Counter] = {}
+        self.actual_types: Dict[str, Counter] = {}
+        self.sampled_paths: Counter = Counter()
+        self.sampling: Optional[Sampling] = None
+        self.random = None
+
+    def validate(self, schema: CompiledSchema, data: Any, sampling: Optional[Sampling] = None) -> bool:
+        """
+        Validates `data` and counts its errors. Returns whether `data` is valid.
+        `schema` is compiled once with `compile_schema`, since stats are kept across many validations.
+        """
+        if not isinstance(schema, CompiledSchema):
+            raise TypeError(f'Expected a schema from compile_schema, got {type(schema)}')
+
+        self.sampling = sampling
+        self.random = sampling.random_type(sampling.seed) if sampling is not None else None
+
+        errors = self.errors
+
+        schema.run(data, self)
+
+        valid = self.errors == errors
+
+        self.validations += 1
+        self.invalid += not valid
+
+        return valid
+
+    def add(self, result: SchemaValidationResult):
+        """
+        Counts the errors of a result, which was already validated.
+        Type errors in lists of dictionaries have paths relative to the item in results, so they are counted so.
+        """
+        for path in result.missing_keys:
+            self.count_missing(INDEX.sub('[]', path))
+
+        for path in result.additional_keys:
+            self.count_additional(INDEX.sub('[]', path))
+
+        for error in result.type_errors:
+            self.count_type_error(INDEX.sub('[]', error['path']), error['expected'], error['actual'])
+
+        for path in result.sampled_paths:
+            self.sampled_paths[INDEX.sub('[]', path)] += 1
+
+        self.validations += 1
+        self.invalid += not result
+
+    def count_missing(self, path: str):
+        self.errors += 1
+        self.missing_keys[path] += 1
+
+    def count_additional(self, path: str):
+        self.errors += 1
+        self.additional_keys[path] += 1
+
+    def count_type_error(self, path: str, expected: Any, actual: Any):
+        self.errors += 1
+        self.type_errors[path] += 1
+
+        expected_types = self.expected_types.get(path)
+
+        if expected_types is None:
+            expected_types = self.expected_types[path] = Counter()
+            self.actual_types[path] = Counter()
+
+        expected_types[get_type_label(expected)] += 1
+        self.actual_types[path][get_type_label(actual)] += 1
+
+    def missing(self, path):
+        self.count_missing(render_schema_path(path))
+
+    def additional(self, path):
+        self.count_additional(render_schema_path(path))
+
+    def type_error(self, path, expected, actual):
+        self.count_type_error(render_schema_path(path), expected, actual)
+
+    def sampled(self, path):
+        self.sampled_paths[render_schema_path(path)] += 1
+
+    def converted(self, path, value):
+        pass
+
+    def merge(self, other: 'ErrorStats'):
+        self.validations += other.validations
+        self.invalid += other.invalid
+        self.errors += other.errors
+        self.missing_keys.update(other.missing_keys)
+        self.additional_keys.update(other.additional_keys)
+        self.type_errors.update(other.type_errors)
+        self.sampled_paths.update(other.sampled_paths)
+
+        for histograms, other_histograms in (
+            (self.expected_types, other.expected_types),
+            (self.actual_types, other.actual_types)
+        ):
+            for path, counts in other_histograms.items():
+                histograms.setdefault(path, Counter()).update(counts)
+
+    def to_dict(self) -> dict:
+        """
+        Plain dictionaries, lists and numbers, which can be dumped to JSON.
+        """
+        return {
+            'validations': self.validations,
+            'invalid': self.invalid,
+            'errors': self.errors,
+            'missing_keys': dict(self.missing_keys),
+            'additional_keys': dict(self.additional_keys),
+            'type_errors': dict(self.type_errors),
+            'expected_types': {path: dict(counts) for path, counts in self.expected_types.items()},
+            'actual_types': {path: dict(counts) for path, counts in self.actual_types.items()},
+            'sampled_paths': dict(self.sampled_paths)
+        }
+
+    @staticmethod
+    def from_dict(data: dict) -> 'ErrorStats':
+        stats = ErrorStats()
+
+        stats.validations = data['validations']
+        stats.invalid = data['invalid']
+        stats.errors = data['errors']
+        stats.missing_keys.update(data['missing_keys'])
+        stats.additional_keys.update(data['additional_keys'])
+        stats.type_errors.update(data['type_errors'])
+        stats.sampled_paths.update(data['sampled_paths'])
+
+        for path, counts in data['expected_types'].items():
+            stats.expected_types[path] = Counter(counts)
+
+        for path, counts in data['actual_types'].items():
+            stats.actual_types[path] = Counter(counts)
+
+        return stats
+
+    def __getstate__(self):
+        return self.to_dict()
+
+    def __setstate__(self, state):
+        self.__init__()
+        self.merge(ErrorStats.from_dict(state))
@@ -0,0 +1,106 @@
+from typing import Any, Iterator, Optional, Union
+
+from .compiler import CompiledSchema, Definitions, Sampling, compile_schema, render_path, visit_root
+
+
+class ErrorEvent:
+    """
+    One error, as it is found:
+
+    - `missing` and `additional` - a key, at `path`.
+    - `type_error` - a value at `path`, which is `actual` instead of `expected`.
+    - `sampled` - a list at `path`, of which only some items were checked.
+    """
+    __slots__ = ('kind', 'path', 'expected', 'actual')
+
+    def __init__(self, kind: str, path: str, expected: Any = None, actual: Any = None):
+        self.kind = kind
+        self.path = path
+        self.expected = expected
+        self.actual = actual
+
+    def __eq__(self, other):
+        if type(other) is not ErrorEvent:
+            return NotImplemented
+
+        return (
+            (self.kind, self.path, self.expected, self.actual) ==
+            (other.kind, other.path, other.expected, other.actual)
+        )
+
+    def __hash__(self):
+        return hash((self.kind, self.path))
+
+    def __repr__(self):
+        if self.kind == 'type_error':
+            return f'ErrorEvent({self.kind!r}, {self.path!r}, expected={self.expected!r}, actual={self.actual!r})'
+
+        return f'ErrorEvent({self.kind!r}, {self.path!r})'
+
+
+class ErrorStream:
+    """
+    Keeps the errors of one walk, until they are yielded.
+    """
+    __slots__ = ('events', 'sampling', 'random')
+
+    converting = False
+    streaming = True
+    absolute_paths = False
+
+    def __init__(self, sampling: Optional[Sampling] = None):
+        self.events: list = []
+        self.sampling = sampling
+        self.random = sampling.random_type(sampling.seed) if sampling is not None else None
+
+    def missing(self, path):
+        self.events.append(ErrorEvent('missing', render_path(path)))
+
+    def additional(self, path):
+        self.events.append(ErrorEvent('additional', render_path(path)))
+
+    def type_error(self, path, expected, actual):
+        self.events.append(ErrorEvent('type_error', render_path(path), expected, actual))
+
+    def sampled(self, path):
+        self.events.append(ErrorEvent('sampled', render_path(path)))
+
+    def converted(self, path, value):
+        pass
+
+
+def iter_errors(
+    schema: Union[Any, CompiledSchema],
+    data: Any,
+    definitions: Optional[Definitions] = None,
+    strict: bool = True,
+    objects: bool = False,
+    extra: str = 'forbid',
+    sampling: Optional[Sampling] = None
+) -> Iterator[ErrorEvent]:
+    """
+    Yields errors in the order they are found, while validation goes on.
+
+    Errors are yielded after every step of the traversal - a dictionary, a list item or a `types.Dict` key
+    with errors, or an additional key - so only the errors of one step are kept at a time.
+    Stop iterating to stop validating.
+    """
+    if not isinstance(schema, CompiledSchema):
+        schema = compile_schema(schema, definitions, strict, objects, extra)
+
+    sink = ErrorStream(sampling)
+    events = sink.events
+    stack: list = []
+
+    visit_root(schema.root, data, stack, sink)
+
+    while True:
+        if len(events) > 0:
+            yield from events
+            events.clear()
+
+        if len(stack) == 0:
+            return
+
+        walk, value, path, walk_sink = stack.pop()
+        walk(value, path, stack, walk_sink)
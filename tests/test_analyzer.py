@@ -0,0 +1,52 @@
+from typing import Any
+
+from unittest import TestCase
+
+from simple_schema_validator import analyze_schema, types
+
+
+class AnalyzeSchemaTests(TestCase):
+    def test_schema_without_issues(self):
+        report = analyze_schema({'a': int, 'b': [{'c': str}]})
+
+        self.assertTrue(bool(report))
+        self.assertEqual([], report.issues)
+        self.assertEqual(5, report.node_count)
+        self.assertEqual(1, report.list_of_dict_depth)
+        self.assertEqual(0, report.any_count)
+
+    def test_issues(self):
+        schema = {
+            'a': [int, str],
+            'b': types.Optional[types.Optional[int]],
+            'c': {'d': types.Optional[Any]},
+            'e': types.Union[int, Any],
+            'f': types.Ref('F')
+        }
+
+        report = analyze_schema(schema, definitions={'F': {'g': types.Optional[Any]}})
+
+        self.assertFalse(bool(report))
+        self.assertEqual(
+            [
+                ('multiple-list-types', 'a', None),
+                ('nested-optional', 'b', None),
+                ('optional-any', 'c.d', None),
+                ('union-with-any', 'e', None),
+                ('optional-any', 'g', 'F')
+            ],
+            [(issue.code, issue.path, issue.definition) for issue in report.issues]
+        )
+        self.assertEqual(3, report.any_count)
+
+    def test_list_of_dict_depth(self):
+        schema = {
+            'a': [{'b': types.List[types.Optional[{'c': [{'d': int}]}], 1, 2]}],
+            'e': [[int]],
+            'f': types.Tuple[int, {'g': int}]
+        }
+
+        report = analyze_schema(schema)
+
+        self.assertEqual(3, report.list_of_dict_depth)
+        self.assertEqual(16, report.node_count)
@@ -0,0 +1,176 @@
+from array import array
+
+from unittest import TestCase, skipIf
+
+from simple_schema_validator import schema_validator, types, validate_columns
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+class ValidateColumnsTests(TestCase):
+    schema = {
+        'id': int,
+        'score': types.Int(min=0),
+        'name': types.Optional[str],
+        'address': {'city': str}
+    }
+
+    def test_valid_columns(self):
+        columns = {
+            'id': array('q', [1, 2, 3]),
+            'score': [1, 2, 3],
+            'name': ['a', None, 'c'],
+            'address.city': ['Sofia', 'Plovdiv', 'Varna']
+        }
+
+        validation = validate_columns(self.schema, columns)
+
+        self.assertTrue(bool(validation))
+
+    def test_errors_have_row_indexes(self):
+        columns = {
+            'id': array('d', [1.0, 2.0]),
+            'score': [1, -1],
+            'name': ['a', 1],
+            'other': [1, 2]
+        }
+
+        validation = validate_columns(self.schema, columns)
+
+        self.assertFalse(bool(validation))
+        self.assertEqual(['address.city'], validation.missing_keys)
+        self.assertEqual(['other'], validation.additional_keys)
+        self.assertEqual(
+            [
+                {'path': '[0].id', 'expected': int, 'actual': float},
+                {'path': '[1].id', 'expected': int, 'actual': float},
+                {'path': '[1].name', 'expected': str, 'actual': int},
+                {'path': '[1].score', 'expected': self.schema['score'], 'actual': int}
+            ],
+            validation.type_errors
+        )
+
+    def test_extra_columns_can_be_ignored(self):
+        columns = {'id': [1], 'score': [1], 'name': [None], 'address.city': ['Sofia'], 'address.zip': ['1000']}
+
+        with self.subTest('globally'):
+            self.assertTrue(bool(validate_columns(self.schema, columns, extra='ignore')))
+
+        with self.subTest('for a nested dictionary'):
+            schema = {**self.schema, 'address': types.Extra({'city': str}, 'ignore')}
+
+            self.assertTrue(bool(validate_columns(schema, columns)))
+
+    def test_lists_of_dictionaries(self):
+        schema = {'id': int, 'a': {'b': [{'c': int}]}}
+        columns = {'id': [1, 2], 'a.b': [[{'c': 1}], [{'c': '1'}, {'c': 2}]]}
+
+        validation = validate_columns(schema, columns)
+
+        self.assertEqual([{'path': '[1].a.b[0].c', 'expected': int, 'actual': str}], validation.type_errors)
+
+    def test_columns_of_different_lengths(self):
+        with self.assertRaises(ValueError):
+            validate_columns({'a': int, 'b': int}, {'a': [1], 'b': [1, 2]})
+
+    @skipIf(numpy is None, 'NumPy is not installed')
+    def test_numpy_columns(self):
+        columns = {
+            'id': numpy.array([1, 2, 3]),
+            'score': numpy.array([1, -2, 3]),
+            'name': numpy.array(['a', None, 'c'], dtype=object),
+            'address.city': numpy.array(['Sofia', 'Plovdiv', 'Varna'])
+        }
+
+        validation = validate_columns(self.schema, columns)
+
+        self.assertEqual(
+            [{'path': '[1].score', 'expected': self.schema['score'], 'actual': int}],
+            validation.type_errors
+        )
+
+        columns['id'] = numpy.array([1.0, 2.0, 3.0])
+
+        validation = validate_columns(self.schema, columns)
+
+        self.assertEqual(
+            ['[0].id', '[1].id', '[1].score', '[2].id'],
+            [error['path'] for error in validation.type_errors]
+        )
+
+    @skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_arrow_tables(self):
+        table = pyarrow.table({
+            'id': pyarrow.array([1.5, None, 3.0]),
+            'score': [1, -2, 3],
+            'name': ['a', None, 'c'],
+            'address.city': ['Sofia', 'Plovdiv', None]
+        })
+
+        validation = validate_columns(self.schema, table)
+
+        self.assertEqual(
+            [
+                {'path': '[0].id', 'expected': int, 'actual': float},
+                {'path': '[1].id', 'expected': int, 'actual': None},
+                {'path': '[1].score', 'expected': self.schema['score'], 'actual': int},
+                {'path': '[2].address.city', 'expected': str, 'actual': None},
+                {'path': '[2].id', 'expected': int, 'actual': float}
+            ],
+            validation.type_errors
+        )
+
+    @skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_arrow_struct_columns(self):
+        schema = {'id': int, 'b': {'c': int, 'd': {'e': str}}}
+        table = pyarrow.table({
+            'id': [1, 2, 3],
+            'b': pyarrow.array([{'c': 1, 'd': {'e': 'x'}}, {'c': 2, 'd': None}, {'c': None, 'd': {'e': 'y'}}])
+        })
+
+        validation = validate_columns(schema, table)
+
+        self.assertEqual([], validation.missing_keys)
+        self.assertEqual([], validation.additional_keys)
+        self.assertEqual(
+            [
+                {'path': '[1].b.d.e', 'expected': str, 'actual': None},
+                {'path': '[2].b.c', 'expected': int, 'actual': None}
+            ],
+            validation.type_errors
+        )
+
+    @skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_arrow_struct_columns_with_null_rows(self):
+        schema = {'id': int, 'address': types.Optional[{'city': str, 'geo': {'lat': float}}], 'b': {'c': int}}
+        rows = [
+            {'id': 1, 'address': {'city': 'a', 'geo': {'lat': 1.0}}, 'b': {'c': 1}},
+            {'id': 2, 'address': None, 'b': None},
+            {'id': 3, 'address': {'city': None, 'geo': None}, 'b': {'c': 3}}
+        ]
+        table = pyarrow.table({
+            'id': [row['id'] for row in rows],
+            'address': pyarrow.array([row['address'] for row in rows]),
+            'b': pyarrow.array([row['b'] for row in rows])
+        })
+
+        validation = validate_columns(schema, table)
+
+        self.assertEqual(
+            [
+                {'path': '[1].b.c', 'expected': int, 'actual': None},
+                {'path': '[2].address.city', 'expected': str, 'actual': None},
+                {'path': '[2].address.geo.lat', 'expected': float, 'actual': None}
+            ],
+            validation.type_errors
+        )
+        self.assertTrue(schema_validator(schema, rows[0]))
+        self.assertTrue(schema_validator(schema, {**rows[1], 'b': {'c': 2}}))
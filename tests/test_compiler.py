@@ -0,0 +1,144 @@
+from types import MappingProxyType
+
+from typing import Any
+
+from unittest import TestCase
+
+from simple_schema_validator import Sampling, compile_schema, schema_validator, types, SchemaError
+from simple_schema_validator.compiler import get_relative_path, rebase_path, render_path
+
+
+class CompileSchemaTests(TestCase):
+    def test_compiled_schema_can_be_reused(self):
+        compiled = compile_schema({'a': int})
+
+        self.assertTrue(bool(compiled.validate({'a': 1})))
+        self.assertFalse(bool(compiled.validate({'a': 'some_string'})))
+        self.assertTrue(bool(schema_validator(compiled, {'a': 1})))
+
+    def test_top_level_mapping_with_exact_keys(self):
+        compiled = compile_schema({'a': int, 'b': {'c': str}})
+
+        with self.subTest('same keys'):
+            validation = compiled.validate(MappingProxyType({'a': 1, 'b': {'c': 'd'}}))
+
+            self.assertTrue(bool(validation))
+
+        with self.subTest('same keys, invalid types'):
+            validation = compiled.validate(MappingProxyType({'a': 1, 'b': {'c': 1}}))
+
+            self.assertEqual([{'path': 'b.c', 'expected': str, 'actual': int}], validation.type_errors)
+
+        with self.subTest('different keys'):
+            validation = compiled.validate(MappingProxyType({'a': 1, 'd': 1}))
+
+            self.assertEqual(['b', 'b.c'], validation.missing_keys)
+            self.assertEqual(['d'], validation.additional_keys)
+
+    def test_render_path(self):
+        self.assertEqual('', render_path(None))
+        self.assertEqual('a', render_path((None, 'a')))
+        self.assertEqual('a.b[0].c', render_path(((((None, 'a'), 'b'), 0, None), 'c')))
+        self.assertEqual('[1][2]', render_path(((None, 1, None), 2, None)))
+
+    def test_relative_paths(self):
+        base = ((None, 'a'), 0, None)
+        path = ((base, 'b'), 1, None)
+
+        self.assertEqual(((1, None), ('b',)), get_relative_path(path, base))
+        self.assertEqual((), get_relative_path(base, base))
+        self.assertEqual(((1, None), ('b',), (0, None), ('a',)), get_relative_path(path, (None, 'c')))
+
+        self.assertEqual('c.b[1]', render_path(rebase_path(((None, 'b'), 1, None), (None, 'c'))))
+
+    def test_ambiguous_unions_are_schema_errors(self):
+        with self.subTest('Two branches for the same type'):
+            with self.assertRaises(SchemaError):
+                compile_schema({'a': types.Union[[int], [str]]})
+
+        with self.subTest('Dictionaries without a distinct key'):
+            with self.assertRaises(SchemaError):
+                compile_schema({'a': types.Union[{'b': int}, {'b': str}]})
+
+        with self.subTest('Duplicate plain types are fine'):
+            compile_schema({'a': types.Union[int, int, types.Optional[int]]})
+
+    def test_union_with_any_is_any(self):
+        compiled = compile_schema({'a': types.Union[int, types.Ref('A')]}, definitions={'A': Any})
+
+        self.assertTrue(bool(compiled.validate({'a': 'some_string'})))
+
+    def test_tagged_schemas_must_be_dictionaries(self):
+        with self.assertRaises(SchemaError):
+            compile_schema(types.Tagged('type', {'a': int}))
+
+    def test_invalid_constraints_are_schema_errors(self):
+        with self.subTest('Invalid pattern'):
+            with self.assertRaises(SchemaError):
+                compile_schema({'a': types.Str(pattern='[')})
+
+        with self.subTest('Unhashable enum values'):
+            with self.assertRaises(SchemaError):
+                compile_schema({'a': types.Enum([1])})
+
+        for schema in (types.Int(min='0'), types.Float(max=[1.5]), types.Int(min=False)):
+            with self.subTest('Bounds that are not numbers', schema=schema):
+                with self.assertRaises(SchemaError):
+                    compile_schema({'a': schema})
+
+        for schema in (
+            types.Str(min_len='1'),
+            types.Str(max_len=1.5),
+            types.Str(min_len=-1),
+            types.List[int, 'x', None],
+            types.List[int, 0, -1]
+        ):
+            with self.subTest('Lengths that are not non-negative integers', schema=schema):
+                with self.assertRaises(SchemaError):
+                    compile_schema({'a': schema})
+
+    def test_negative_sampling_counts_are_errors(self):
+        for counts in ({'head': -5}, {'tail': 1.5}, {'random': None}):
+            with self.subTest(**counts):
+                with self.assertRaises(ValueError):
+                    Sampling(**counts)
+
+    def test_list_with_more_than_one_type_is_a_schema_error(self):
+        with self.assertRaises(SchemaError):
+            compile_schema({'a': [int, str]})
+
+    def test_undefined_reference_is_a_schema_error(self):
+        with self.assertRaises(SchemaError):
+            compile_schema({'a': types.Ref('Missing')})
+
+        with self.assertRaises(SchemaError):
+            compile_schema({'a': types.Ref('A')}, definitions={'A': {'b': types.Ref('B')}})
+
+    def test_reference_to_itself_is_a_schema_error(self):
+        with self.assertRaises(SchemaError):
+            compile_schema({'a': types.Ref('A')}, definitions={'A': types.Ref('A')})
+
+        with self.assertRaises(SchemaError):
+            compile_schema({'a': types.Ref('A')}, definitions={'A': types.Ref('B'), 'B': types.Ref('A')})
+
+    def test_unused_definitions_are_not_compiled(self):
+        compiled = compile_schema({'a': int}, definitions={'Broken': types.Ref('Missing')})
+
+        self.assertTrue(bool(compiled.validate({'a': 1})))
+
+    def test_invalid_extra_option_is_a_schema_error(self):
+        with self.assertRaises(SchemaError):
+            compile_schema({'a': int}, extra='allow')
+
+        with self.assertRaises(SchemaError):
+            compile_schema({'a': types.Extra({'b': int}, 'allow')})
+
+    def test_item_errors_must_wrap_a_list(self):
+        for schema in (
+            types.ItemErrors({'a': int}, limit=1),
+            types.ItemErrors(types.Optional[[int]], limit=1),
+            types.ItemErrors([int], limit=0)
+        ):
+            with self.subTest(schema=schema):
+                with self.assertRaises(SchemaError):
+                    compile_schema({'a': schema})
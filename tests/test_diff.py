@@ -0,0 +1,165 @@
+from collections.abc import Mapping
+
+from types import MappingProxyType
+
+from unittest import TestCase
+
+from simple_schema_validator import compile_schema, types, validate_diff
+
+
+class Record(Mapping):
+    """
+    Every record has the same repr, whatever its values.
+    """
+    def __init__(self, values):
+        self.values = values
+
+    def __getitem__(self, key):
+        return self.values[key]
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __repr__(self):
+        return 'Record(...)'
+
+
+def make_chain(depth, value):
+    chain = {'next': None, 'value': value}
+
+    for _ in range(depth):
+        chain = {'next': chain, 'value': 1}
+
+    return chain
+
+
+class ValidateDiffTests(TestCase):
+    schema = {
+        'id': int,
+        'name': str,
+        'address': {'city': str, 'zip': str},
+        'tags': [str],
+        'orders': [{'id': int}]
+    }
+
+    def test_new_fixed_and_unchanged_errors(self):
+        old = {
+            'id': '1',
+            'name': 1,
+            'address': {'city': 'Sofia'},
+            'tags': ['a', 1],
+            'orders': [{'id': 1}]
+        }
+        new = {
+            'id': 1.0,
+            'name': 1,
+            'address': {'city': 1, 'zip': '1000', 'country': 'BG'},
+            'tags': ['a', 1],
+            'orders': [{'id': 1}]
+        }
+
+        diff = validate_diff(self.schema, old, new)
+
+        self.assertFalse(bool(diff))
+
+        self.assertEqual([], diff.new_errors.missing_keys)
+        self.assertEqual(['address.country'], diff.new_errors.additional_keys)
+        self.assertEqual(
+            [
+                {'path': 'address.city', 'expected': str, 'actual': int},
+                {'path': 'id', 'expected': int, 'actual': float}
+            ],
+            diff.new_errors.type_errors
+        )
+
+        self.assertEqual(['address.zip'], diff.fixed_errors.missing_keys)
+        self.assertEqual(
+            [{'path': 'id', 'expected': int, 'actual': str}],
+            diff.fixed_errors.type_errors
+        )
+
+        self.assertEqual(
+            [
+                {'path': 'name', 'expected': str, 'actual': int},
+                {'path': 'tags[1]', 'expected': str, 'actual': int}
+            ],
+            diff.unchanged_errors.type_errors
+        )
+
+        with self.subTest('results of each payload'):
+            compiled = compile_schema(self.schema)
+
+            for payload, result in ((old, diff.old), (new, diff.new)):
+                validation = compiled.validate(payload)
+
+                self.assertEqual(validation.missing_keys, result.missing_keys)
+                self.assertEqual(validation.additional_keys, result.additional_keys)
+                self.assertEqual(validation.type_errors, result.type_errors)
+
+    def test_same_payloads(self):
+        payload = {'id': 1, 'name': 'a', 'address': {'city': 'Sofia'}, 'tags': [], 'orders': [{'id': '1'}]}
+
+        for new in (payload, {**payload}, MappingProxyType(payload)):
+            with self.subTest(new=type(new)):
+                diff = validate_diff(self.schema, payload, new)
+
+                self.assertTrue(bool(diff))
+                self.assertFalse(bool(diff.unchanged_errors))
+                self.assertEqual(['address.zip'], diff.unchanged_errors.missing_keys)
+                self.assertEqual(['id'], [error['path'] for error in diff.unchanged_errors.type_errors])
+                self.assertTrue(bool(diff.fixed_errors))
+
+    def test_values_of_equal_but_different_types_are_not_the_same(self):
+        diff = validate_diff({'a': {'b': int}}, {'a': {'b': 1}}, {'a': {'b': True}})
+
+        self.assertEqual(
+            [{'path': 'a.b', 'expected': int, 'actual': bool}],
+            diff.new_errors.type_errors
+        )
+
+    def test_repeated_errors_are_counted(self):
+        schema = {'items': [{'id': int}]}
+
+        diff = validate_diff(schema, {'items': [{'id': 'a'}]}, {'items': [{'id': 'a'}, {'id': 'b'}]})
+
+        self.assertEqual(['id'], [error['path'] for error in diff.new_errors.type_errors])
+        self.assertEqual(['id'], [error['path'] for error in diff.unchanged_errors.type_errors])
+
+    def test_extra_keys_ignored(self):
+        schema = types.Extra({'a': int}, 'ignore')
+
+        diff = validate_diff(schema, {'a': 1, 'b': 1}, {'a': 1, 'c': 1})
+
+        self.assertTrue(bool(diff))
+        self.assertTrue(bool(diff.new))
+
+    def test_values_with_the_same_repr_are_compared(self):
+        old = {'a': Record({'b': 1}), 'c': [Record({'b': 1})]}
+        new = {'a': Record({'b': 'x'}), 'c': [Record({'b': 'y'})]}
+
+        diff = validate_diff({'a': {'b': int}, 'c': [{'b': int}]}, old, new, strict=False)
+
+        self.assertEqual(
+            [
+                {'path': 'a.b', 'expected': int, 'actual': str},
+                {'path': 'b', 'expected': int, 'actual': str}
+            ],
+            diff.new_errors.type_errors
+        )
+
+    def test_deep_payloads(self):
+        node = {'next': types.Optional[types.Ref('Node')], 'value': int}
+        schema = compile_schema(node, definitions={'Node': node})
+
+        for depth in (400, 5000):
+            with self.subTest(depth=depth):
+                diff = validate_diff(schema, make_chain(depth, 1), make_chain(depth, 'x'))
+
+                self.assertEqual(
+                    [{'path': '.'.join(['next'] * depth + ['value']), 'expected': int, 'actual': str}],
+                    diff.new_errors.type_errors
+                )
+                self.assertEqual([], diff.fixed_errors.type_errors)
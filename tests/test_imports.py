@@ -0,0 +1,50 @@
+import subprocess
+import sys
+
+from unittest import TestCase
+
+import simple_schema_validator
+
+
+class ImportTests(TestCase):
+    def test_optional_subsystems_are_not_imported_eagerly(self):
+        code = '\n'.join([
+            'import sys',
+            'import simple_schema_validator',
+            'print(" ".join(sys.modules))'
+        ])
+
+        imported = subprocess.run(
+            [sys.executable, '-c', code],
+            check=True,
+            capture_output=True,
+            text=True
+        ).stdout.split()
+
+        for module in (
+            'dataclasses',
+            'pickle',
+            'random',
+            'uuid',
+            'simple_schema_validator.analyzer',
+            'simple_schema_validator.coercions',
+            'simple_schema_validator.columnar',
+            'simple_schema_validator.diff',
+            'simple_schema_validator.inference',
+            'simple_schema_validator.json_schema',
+            'simple_schema_validator.parser',
+            'simple_schema_validator.stats',
+            'simple_schema_validator.streaming'
+        ):
+            with self.subTest(module=module):
+                self.assertNotIn(module, imported)
+
+    def test_optional_subsystems_are_imported_on_first_use(self):
+        from simple_schema_validator import parse
+        from simple_schema_validator.parser import parse as parser_parse
+
+        self.assertIs(parser_parse, parse)
+        self.assertIn('to_json_schema', dir(simple_schema_validator))
+
+        with self.assertRaises(AttributeError):
+            simple_schema_validator.missing
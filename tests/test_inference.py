@@ -0,0 +1,143 @@
+import random
+
+from typing import Any
+from unittest import TestCase
+
+from simple_schema_validator import infer_schema, schema_validator, types
+from simple_schema_validator.inference import Shape, infer_shape
+
+
+def generate_samples(count, seed=0):
+    generator = random.Random(seed)
+
+    for index in range(count):
+        sample = {
+            'id': index,
+            'name': generator.choice(['a', 'b', None]),
+            'score': generator.choice([1, 1.5]),
+            'tags': [generator.choice(['x', 'y']) for _ in range(generator.randrange(3))],
+            'address': {'city': 'Sofia'}
+        }
+
+        if index % 3 == 0:
+            sample['address']['zip'] = '1000'
+
+        if index % 5 == 0:
+            sample['note'] = 'n'
+
+        yield sample
+
+
+def generate_nested_value(generator, depth=0):
+    kind = generator.random()
+
+    if depth > 3 or kind < 0.3:
+        return generator.choice([1, 1.5, 'a', True, None])
+
+    if kind < 0.5:
+        return [generate_nested_value(generator, depth + 1) for _ in range(generator.randrange(3))]
+
+    keys = [generator.choice('abcdef') for _ in range(generator.randrange(5))]
+
+    return {key: generate_nested_value(generator, depth + 1) for key in keys}
+
+
+class InferSchemaTests(TestCase):
+    def test_scalars_optionals_and_unions(self):
+        schema = infer_schema([
+            {'a': 1, 'b': 'x', 'c': None, 'd': 1},
+            {'a': 2, 'b': None, 'c': None, 'd': 'x'}
+        ])
+
+        self.assertEqual(['a', 'b', 'c', 'd'], list(schema))
+        self.assertIs(int, schema['a'])
+        self.assertIs(str, schema['b'].T)
+        self.assertIsNone(schema['c'])
+        self.assertEqual((int, str), schema['d'].Ts)
+
+    def test_lists_and_nested_dicts(self):
+        schema = infer_schema([
+            {'tags': [], 'items': [{'id': 1}, {'id': 2, 'name': 'a'}], 'matrix': [[1], [2.0]]},
+            {'tags': [], 'items': [], 'matrix': []}
+        ])
+
+        self.assertEqual([Any], schema['tags'])
+        self.assertEqual('ignore', schema['items'][0].extra)
+        self.assertEqual({'id': int}, schema['items'][0].schema)
+        self.assertEqual((float, int), schema['matrix'][0][0].Ts)
+
+    def test_keys_missing_from_some_samples_are_left_out(self):
+        schema = infer_schema([{'a': 1, 'b': {'c': 1}}, {'a': 2, 'b': {'c': 2}, 'd': 1}])
+
+        self.assertEqual('ignore', schema.extra)
+        self.assertEqual(['a', 'b'], list(schema.schema))
+
+        with self.subTest('nested dictionaries still forbid extra keys'):
+            self.assertEqual('forbid', schema.schema['b'].extra)
+            self.assertFalse(schema_validator(schema, {'a': 1, 'b': {'c': 1, 'e': 1}}))
+
+    def test_dictionaries_with_many_keys(self):
+        samples = [{'counts': {f'key-{index}': index}} for index in range(10)]
+
+        schema = infer_schema(samples, max_keys=5)
+
+        self.assertEqual('types.Dict[str, int]', repr(schema['counts']))
+
+        with self.subTest('merging collapsed and plain shapes'):
+            collapsed = infer_shape(samples, max_keys=5)
+            plain = infer_shape([{'counts': {'other': 'x'}}], max_keys=5)
+
+            plain.merge(collapsed, max_keys=5)
+
+            self.assertEqual('types.Dict[str, types.Union[int, str]]', repr(plain.to_schema()['counts']))
+
+    def test_one_sample_with_many_keys(self):
+        schema = infer_schema([{index: index for index in range(100)}])
+
+        self.assertEqual('types.Dict[int, int]', repr(schema))
+
+    def test_nested_samples_are_valid_against_the_inferred_schema(self):
+        for seed in range(300):
+            generator = random.Random(seed)
+            samples = [generate_nested_value(generator) for _ in range(generator.randrange(1, 6))]
+            max_keys = generator.choice([1, 2, 3])
+
+            merged = Shape()
+
+            for sample in samples:
+                merged.merge(infer_shape([sample], max_keys), max_keys)
+
+            with self.subTest(seed=seed):
+                for schema in (infer_schema(samples, max_keys=max_keys), merged.to_schema()):
+                    for sample in samples:
+                        validation = schema_validator(schema, sample)
+
+                        self.assertTrue(validation, (sample, validation.type_errors))
+
+    def test_samples_are_valid_against_the_inferred_schema(self):
+        schema = infer_schema(generate_samples(500))
+
+        for sample in generate_samples(500):
+            validation = schema_validator(schema, sample)
+
+            self.assertTrue(validation, validation.type_errors)
+
+    def test_merged_shapes_equal_one_shape(self):
+        samples = list(generate_samples(300))
+
+        merged = Shape()
+
+        for start in range(0, len(samples), 70):
+            merged.merge(infer_shape(samples[start:start + 70]))
+
+        self.assertEqual(repr(infer_shape(samples).to_schema()), repr(merged.to_schema()))
+        self.assertEqual(len(samples), merged.count)
+
+    def test_parallel(self):
+        schema = infer_schema(generate_samples(200), workers=2, chunk_size=30)
+
+        self.assertEqual(repr(infer_schema(generate_samples(200))), repr(schema))
+
+    def test_empty(self):
+        self.assertIs(Any, infer_schema([]))
+        self.assertEqual(types.Optional[int].T, infer_schema([None, 1]).T)
@@ -0,0 +1,154 @@
+import json
+
+from typing import Any
+
+from unittest import TestCase
+
+from simple_schema_validator import (
+    compile_schema,
+    from_json_schema,
+    schema_validator,
+    to_json_schema,
+    types,
+    CompiledSchema,
+    SchemaError
+)
+
+
+class CompiledSchemaDumpTests(TestCase):
+    def test_loaded_schema_validates_like_the_compiled_one(self):
+        schema = {
+            'id': types.Int(min=1),
+            'name': types.Str(pattern='^[a-z]+$'),
+            'value': types.Union[int, str, None],
+            'child': types.Optional[types.Ref('Node')],
+            'rest': Any
+        }
+
+        compiled = compile_schema(schema, definitions={'Node': schema})
+        loaded = CompiledSchema.loads(compiled.dumps())
+
+        valid = {'id': 1, 'name': 'a', 'value': None, 'child': None, 'rest': [1]}
+        invalid = {
+            'id': 0,
+            'name': 'A',
+            'value': 1.5,
+            'child': {**valid, 'child': {'id': 1}},
+            'extra': 1
+        }
+
+        for data in (valid, invalid):
+            with self.subTest(data=data):
+                expected = compiled.validate(data)
+                actual = loaded.validate(data)
+
+                self.assertEqual(bool(expected), bool(actual))
+                self.assertEqual(expected.missing_keys, actual.missing_keys)
+                self.assertEqual(expected.additional_keys, actual.additional_keys)
+                self.assertEqual(
+                    [(error['path'], error['actual']) for error in expected.type_errors],
+                    [(error['path'], error['actual']) for error in actual.type_errors]
+                )
+
+    def test_dumps_from_another_format_are_not_loaded(self):
+        import pickle
+
+        with self.assertRaises(SchemaError):
+            CompiledSchema.loads(pickle.dumps((0, compile_schema({'a': int}))))
+
+
+class JSONSchemaTests(TestCase):
+    def test_export(self):
+        schema = {
+            'id': int,
+            'name': types.Optional[str],
+            'tags': [str],
+            'address': {'city': str}
+        }
+
+        self.assertEqual(
+            {
+                '$schema': 'https://json-schema.org/draft/2020-12/schema',
+                'type': 'object',
+                'properties': {
+                    'id': {'type': 'integer'},
+                    'name': {'anyOf': [{'type': 'string'}, {'type': 'null'}]},
+                    'tags': {'type': 'array', 'items': {'type': 'string'}},
+                    'address': {
+                        'type': 'object',
+                        'properties': {'city': {'type': 'string'}},
+                        'required': ['city'],
+                        'additionalProperties': False
+                    }
+                },
+                'required': ['id', 'name', 'tags', 'address'],
+                'additionalProperties': False
+            },
+            to_json_schema(schema)
+        )
+
+    def test_round_trip(self):
+        schema = {
+            'id': types.Int(min=1),
+            'name': types.Optional[str],
+            'scores': types.List[float, 1, 3],
+            'meta': types.Extra({'source': types.Enum('web', 'api'), 'nested': {'a': bool}}, 'ignore'),
+            'counts': types.Dict[str, int],
+            'value': types.Union[int, str],
+            'anything': Any,
+            'tree': types.Ref('Tree')
+        }
+        definitions = {'Tree': {'children': [types.Ref('Tree')]}}
+
+        document = json.loads(json.dumps(to_json_schema(schema, definitions)))
+        imported, imported_definitions = from_json_schema(document)
+
+        self.assertEqual(['Tree'], list(imported_definitions))
+
+        valid = {
+            'id': 1,
+            'name': None,
+            'scores': [1.5],
+            'meta': {'source': 'web', 'nested': {'a': True, 'b': 1}, 'other': 1},
+            'counts': {'a': 1},
+            'value': 'a',
+            'anything': [1],
+            'tree': {'children': [{'children': []}]}
+        }
+        invalid = {
+            'id': 0,
+            'name': 1,
+            'scores': [],
+            'meta': {'source': 'cli', 'nested': {'a': 1}},
+            'counts': {'a': 'b'},
+            'value': 1.5,
+            'anything': None,
+            'tree': {'children': [{}]},
+            'other': 1
+        }
+
+        for data in (valid, invalid):
+            with self.subTest(data=data):
+                expected = schema_validator(schema, data, definitions)
+                actual = schema_validator(imported, data, imported_definitions)
+
+                self.assertEqual(bool(expected), bool(actual))
+                self.assertEqual(expected.missing_keys, actual.missing_keys)
+                self.assertEqual(expected.additional_keys, actual.additional_keys)
+                self.assertEqual(
+                    [error['path'] for error in expected.type_errors],
+                    [error['path'] for error in actual.type_errors]
+                )
+
+    def test_unsupported_schemas(self):
+        with self.subTest('export'):
+            with self.assertRaises(SchemaError):
+                to_json_schema({'a': types.Tagged('type', {'a': {}})})
+
+        with self.subTest('properties, which are not required'):
+            with self.assertRaises(SchemaError):
+                from_json_schema({'type': 'object', 'properties': {'a': {'type': 'string'}}})
+
+        with self.subTest('external references'):
+            with self.assertRaises(SchemaError):
+                from_json_schema({'$ref': 'https://example.com/schema.json'})
@@ -0,0 +1,139 @@
+from datetime import datetime
+
+from unittest import TestCase
+
+from simple_schema_validator import compile_schema, parse, types
+
+
+class ParseTests(TestCase):
+    def test_values_are_converted(self):
+        schema = {
+            'id': int,
+            'price': float,
+            'created_at': datetime,
+            'tags': [str],
+            'scores': [types.Int(min=0)]
+        }
+
+        data = {
+            'id': '1',
+            'price': '9.99',
+            'created_at': '2020-01-02T03:04:05',
+            'tags': ['a', 'b'],
+            'scores': ['1', 2]
+        }
+
+        output, validation = parse(schema, data)
+
+        self.assertTrue(bool(validation))
+        self.assertEqual(
+            {
+                'id': 1,
+                'price': 9.99,
+                'created_at': datetime(2020, 1, 2, 3, 4, 5),
+                'tags': ['a', 'b'],
+                'scores': [1, 2]
+            },
+            output
+        )
+
+        with self.subTest('data is not changed'):
+            self.assertEqual('1', data['id'])
+            self.assertEqual(['1', 2], data['scores'])
+
+        with self.subTest('untouched parts are reused'):
+            self.assertIs(data['tags'], output['tags'])
+
+    def test_invalid_values_are_reported(self):
+        schema = {'id': int, 'score': types.Int(min=0), 'created_at': datetime}
+
+        output, validation = parse(schema, {'id': 'one', 'score': '-1', 'created_at': '2020-13-01'})
+
+        self.assertFalse(bool(validation))
+        self.assertEqual(
+            [
+                {'path': 'created_at', 'expected': datetime, 'actual': str},
+                {'path': 'id', 'expected': int, 'actual': str},
+                {'path': 'score', 'expected': schema['score'], 'actual': int}
+            ],
+            validation.type_errors
+        )
+        self.assertEqual({'id': 'one', 'score': -1, 'created_at': '2020-13-01'}, output)
+
+    def test_union_values_are_converted(self):
+        schema = {
+            'a': types.Optional[int],
+            'b': types.Union[int, None],
+            'c': types.Union[int, float],
+            'd': types.Union[str, int],
+            'e': types.Union[int, float]
+        }
+
+        output, validation = parse(schema, {'a': '1', 'b': '2', 'c': '1.5', 'd': '3', 'e': 'x'})
+
+        self.assertEqual({'a': 1, 'b': 2, 'c': 1.5, 'd': '3', 'e': 'x'}, output)
+        self.assertEqual([{'path': 'e', 'expected': schema['e'], 'actual': str}], validation.type_errors)
+
+    def test_nested_values(self):
+        schema = {
+            'user': {'id': int, 'address': types.Optional[{'zip': int}]},
+            'orders': [{'id': int, 'items': types.Tuple[str, int]}],
+            'stats': types.Dict[str, int],
+            'other': {'a': [int]}
+        }
+
+        data = {
+            'user': {'id': 1, 'address': {'zip': '1000'}},
+            'orders': [
+                {'id': 1, 'items': ('a', 1)},
+                {'id': '2', 'items': ('b', '2')}
+            ],
+            'stats': {'1': '1'},
+            'other': {'a': [1, 2]}
+        }
+
+        output, validation = parse(schema, data)
+
+        self.assertTrue(bool(validation))
+        self.assertEqual(
+            {
+                'user': {'id': 1, 'address': {'zip': 1000}},
+                'orders': [
+                    {'id': 1, 'items': ('a', 1)},
+                    {'id': 2, 'items': ('b', 2)}
+                ],
+                'stats': {'1': 1},
+                'other': {'a': [1, 2]}
+            },
+            output
+        )
+
+        self.assertIs(data['orders'][0], output['orders'][0])
+        self.assertIs(data['other'], output['other'])
+        self.assertIsNot(data['user'], output['user'])
+
+    def test_nothing_to_convert(self):
+        data = {'id': 1}
+
+        output, validation = parse({'id': int}, data)
+
+        self.assertTrue(bool(validation))
+        self.assertIs(data, output)
+
+    def test_compiled_schemas(self):
+        compiled = compile_schema({'id': int}, coerce=True)
+
+        with self.subTest('parse'):
+            output, validation = parse(compiled, {'id': '1'})
+
+            self.assertTrue(bool(validation))
+            self.assertEqual({'id': 1}, output)
+
+        with self.subTest('validate accepts values, which can be converted'):
+            self.assertTrue(bool(compiled.validate({'id': '1'})))
+
+        with self.subTest('schemas compiled without coerce are not converted'):
+            output, validation = parse(compile_schema({'id': int}), {'id': '1'})
+
+            self.assertFalse(bool(validation))
+            self.assertEqual({'id': '1'}, output)
@@ -1,8 +1,37 @@
 import unittest
 
+from array import array
+
+from collections import OrderedDict
+
+from dataclasses import dataclass, field
+
+from types import MappingProxyType
+
 from typing import Any
 
-from simple_schema_validator import schema_validator, types
+from simple_schema_validator import schema_validator, types, Sampling
+
+
+@dataclass
+class Profile:
+    email: str
+    age: int
+
+
+@dataclass
+class User:
+    id: int
+    profile: Profile
+    tags: list = field(default_factory=list)
+
+
+class Point:
+    __slots__ = ('x', 'y')
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
 
 
 class SchemaValidatorTests(unittest.TestCase):
@@ -1235,5 +1264,832 @@ class SchemaValidatorTests(unittest.TestCase):
                 validation.type_errors
             )
 
+    def test_self_referential_schema(self):
+        definitions = {
+            'Comment': {
+                'text': str,
+                'replies': [types.Ref('Comment')]
+            }
+        }
+
+        schema = {'comment': types.Ref('Comment')}
+
+        with self.subTest('valid'):
+            data = {
+                'comment': {
+                    'text': 'a',
+                    'replies': [
+                        {'text': 'b', 'replies': []},
+                        {'text': 'c', 'replies': [{'text': 'd', 'replies': []}]}
+                    ]
+                }
+            }
+
+            validation = schema_validator(schema, data, definitions=definitions)
+
+            self.assert_valid(validation)
+
+        with self.subTest('invalid'):
+            data = {
+                'comment': {
+                    'text': 1,
+                    'replies': [
+                        {'text': 'b', 'replies': [{'text': None, 'replies': []}]}
+                    ]
+                },
+                'extra': 1
+            }
+
+            validation = schema_validator(schema, data, definitions=definitions)
+
+            self.assertEqual(False, bool(validation))
+            self.assertEqual([], validation.missing_keys)
+            self.assertEqual(['extra'], validation.additional_keys)
+            self.assertEqual(
+                [
+                    {'path': 'comment.text', 'expected': str, 'actual': int},
+                    {'path': 'text', 'expected': str, 'actual': None}
+                ],
+                validation.type_errors
+            )
+
+    def test_self_referential_optional_schema(self):
+        definitions = {
+            'Category': {
+                'name': str,
+                'parent': types.Optional[types.Ref('Category')]
+            }
+        }
+
+        schema = types.Ref('Category')
+
+        with self.subTest('valid'):
+            data = {'name': 'a', 'parent': {'name': 'b', 'parent': None}}
+
+            validation = schema_validator(schema, data, definitions=definitions)
+
+            self.assert_valid(validation)
+
+        with self.subTest('invalid'):
+            data = {'name': 'a', 'parent': {'name': 'b', 'parent': {'parent': 1}}}
+
+            validation = schema_validator(schema, data, definitions=definitions)
+
+            self.assertEqual(False, bool(validation))
+            self.assertEqual(
+                ['parent.parent.name', 'parent.parent.parent.name', 'parent.parent.parent.parent'],
+                validation.missing_keys
+            )
+            self.assertEqual([], validation.additional_keys)
+            self.assertEqual(
+                [
+                    {
+                        'path': 'parent.parent.parent',
+                        'expected': definitions['Category'],
+                        'actual': int
+                    }
+                ],
+                validation.type_errors
+            )
+
+        with self.subTest('validation is bounded by the depth of the data'):
+            data = {'name': 'leaf', 'parent': None}
+
+            for _ in range(5000):
+                data = {'name': 'node', 'parent': data}
+
+            validation = schema_validator(schema, data, definitions=definitions)
+
+            self.assert_valid(validation)
+
+        with self.subTest('missing reference is reported without expanding it'):
+            data = {'name': 'a'}
+
+            validation = schema_validator(schema, data, definitions=definitions)
+
+            self.assertEqual(['parent'], validation.missing_keys)
+
+    def test_validating_mappings_and_sequences_when_not_strict(self):
+        schema = {
+            'a': {
+                'b': int
+            },
+            'c': [int],
+            'd': [{'e': str}]
+        }
+
+        with self.subTest('Strict validation requires dict and list'):
+            data = {
+                'a': OrderedDict([('b', 1)]),
+                'c': (1, 2),
+                'd': [{'e': 'f'}]
+            }
+
+            validation = schema_validator(schema, data)
+
+            self.assertEqual(False, bool(validation))
+            self.assertEqual(['a.b'], validation.missing_keys)
+            self.assertEqual(
+                [
+                    {'path': 'a', 'expected': dict, 'actual': OrderedDict},
+                    {'path': 'c', 'expected': list, 'actual': tuple}
+                ],
+                validation.type_errors
+            )
+
+        with self.subTest('Mappings and sequences are valid'):
+            data = MappingProxyType({
+                'a': OrderedDict([('b', 1)]),
+                'c': (1, 2),
+                'd': (MappingProxyType({'e': 'f'}),)
+            })
+
+            validation = schema_validator(schema, data, strict=False)
+
+            self.assert_valid(validation)
+
+        with self.subTest('Arrays and memoryviews are valid'):
+            for c in [array('i', [1, 2]), memoryview(b'abc')]:
+                data = {
+                    'a': {'b': 1},
+                    'c': c,
+                    'd': []
+                }
+
+                validation = schema_validator(schema, data, strict=False)
+
+                self.assert_valid(validation)
+
+        with self.subTest('Arrays of other types are invalid'):
+            data = {
+                'a': {'b': 1},
+                'c': array('d', [1.0, 2.0]),
+                'd': []
+            }
+
+            validation = schema_validator(schema, data, strict=False)
+
+            self.assertEqual(False, bool(validation))
+            self.assertEqual(
+                [
+                    {'path': 'c[0]', 'expected': int, 'actual': float},
+                    {'path': 'c[1]', 'expected': int, 'actual': float}
+                ],
+                validation.type_errors
+            )
+
+        with self.subTest('Strings are not sequences'):
+            data = {
+                'a': MappingProxyType({'b': 1, 'f': {'g': 1}}),
+                'c': 'some_string',
+                'd': []
+            }
+
+            validation = schema_validator(schema, data, strict=False)
+
+            self.assertEqual(False, bool(validation))
+            self.assertEqual(['a.f', 'a.f.g'], validation.additional_keys)
+            self.assertEqual(
+                [{'path': 'c', 'expected': list, 'actual': str}],
+                validation.type_errors
+            )
+
+    def test_validating_objects(self):
+        schema = {
+            'id': int,
+            'profile': {
+                'email': str,
+                'age': int
+            },
+            'tags': [str]
+        }
+
+        with self.subTest('Objects are invalid by default'):
+            validation = schema_validator(schema, User(1, Profile('a@b.c', 20)))
+
+            self.assertEqual(False, bool(validation))
+
+        with self.subTest('Dataclasses are valid'):
+            data = User(1, Profile('a@b.c', 20), ['a'])
+
+            validation = schema_validator(schema, data, objects=True)
+
+            self.assert_valid(validation)
+
+        with self.subTest('Dataclasses are type checked'):
+            data = User('1', Profile('a@b.c', '20'), ['a', 1])
+
+            validation = schema_validator(schema, data, objects=True)
+
+            self.assertEqual(False, bool(validation))
+            self.assertEqual([], validation.missing_keys)
+            self.assertEqual([], validation.additional_keys)
+            self.assertEqual(
+                [
+                    {'path': 'id', 'expected': int, 'actual': str},
+                    {'path': 'profile.age', 'expected': int, 'actual': str},
+                    {'path': 'tags[1]', 'expected': str, 'actual': int}
+                ],
+                validation.type_errors
+            )
+
+        with self.subTest('Dictionaries can be mixed with objects'):
+            data = {'id': 1, 'profile': Profile('a@b.c', 20), 'tags': []}
+
+            validation = schema_validator(schema, data, objects=True)
+
+            self.assert_valid(validation)
+
+        with self.subTest('Missing and additional attributes'):
+            data = User(1, Profile('a@b.c', 20))
+
+            validation = schema_validator({'id': int, 'profile': {'email': str, 'name': str}}, data, objects=True)
+
+            self.assertEqual(False, bool(validation))
+            self.assertEqual(['profile.name'], validation.missing_keys)
+            self.assertEqual(['profile.age', 'tags'], validation.additional_keys)
+            self.assertEqual([], validation.type_errors)
+
+    def test_validating_objects_with_slots(self):
+        schema = {
+            'points': [{'x': int, 'y': int}]
+        }
+
+        with self.subTest('valid'):
+            data = {'points': [Point(1, 2), Point(3, 4)]}
+
+            validation = schema_validator(schema, data, objects=True)
+
+            self.assert_valid(validation)
+
+        with self.subTest('invalid'):
+            data = {'points': [Point(1, 2), Point(3, 'a'), 5]}
+
+            validation = schema_validator(schema, data, objects=True)
+
+            self.assertEqual(False, bool(validation))
+            self.assertEqual(
+                [
+                    {'path': 'points[2]', 'expected': {'x': int, 'y': int}, 'actual': int},
+                    {'path': 'y', 'expected': int, 'actual': str}
+                ],
+                validation.type_errors
+            )
+
+        with self.subTest('Unset slots are missing'):
+            point = Point.__new__(Point)
+            point.x = 1
+
+            validation = schema_validator({'point': {'x': int, 'y': int}}, {'point': point}, objects=True)
+
+            self.assertEqual(False, bool(validation))
+            self.assertEqual(['point.y'], validation.missing_keys)
+            self.assertEqual([], validation.type_errors)
+
+        with self.subTest('Unset dataclass fields are missing'):
+            @dataclass
+            class Order:
+                id: int
+                total: float = field(init=False)
+
+            validation = schema_validator({'id': int, 'total': float}, Order(1), objects=True)
+
+            self.assertEqual(False, bool(validation))
+            self.assertEqual(['total'], validation.missing_keys)
+            self.assertEqual([], validation.additional_keys)
+
+    def test_validating_union_types(self):
+        schema = {
+            'a': types.Union[int, float],
+            'b': types.Union[str, [str], None],
+            'c': types.Union[{'id': int}, {'email': str}]
+        }
+
+        with self.subTest('valid'):
+            for a, b, c in [
+                (1, 'x', {'id': 1}),
+                (1.5, ['x', 'y'], {'email': 'a@b.c'}),
+                (2, None, {'id': 2})
+            ]:
+                validation = schema_validator(schema, {'a': a, 'b': b, 'c': c})
+
+                self.assert_valid(validation)
+
+        with self.subTest('invalid'):
+            data = {
+                'a': '1',
+                'b': ['x', 1],
+                'c': {'email': 1}
+            }
+
+            validation = schema_validator(schema, data)
+
+            self.assertEqual(False, bool(validation))
+            self.assertEqual([], validation.missing_keys)
+            self.assertEqual([], validation.additional_keys)
+            self.assertEqual(
+                [
+                    {'path': 'a', 'expected': schema['a'], 'actual': str},
+                    {'path': 'b[1]', 'expected': str, 'actual': int},
+                    {'path': 'c.email', 'expected': str, 'actual': int}
+                ],
+                validation.type_errors
+            )
+
+        with self.subTest('dictionary without a known key'):
+            data = {
+                'a': 1,
+                'b': None,
+                'c': {'name': 'a'}
+            }
+
+            validation = schema_validator(schema, data)
+
+            self.assertEqual(False, bool(validation))
+            self.assertEqual(
+                [{'path': 'c', 'expected': schema['c'], 'actual': dict}],
+                validation.type_errors
+            )
+
+        with self.subTest('Optional branches accept None'):
+            validation = schema_validator({'a': types.Union[types.Optional[{'b': int}], str]}, {'a': None})
+
+            self.assert_valid(validation)
+
+    def test_validating_tagged_schemas(self):
+        schema = types.Tagged('type', {
+            'chat': {
+                'message': str
+            },
+            'data': {
+                'type': str,
+                'data': {
+                    'foo': int
+                }
+            }
+        })
+
+        with self.subTest('valid'):
+            for data in [
+                {'type': 'chat', 'message': 'Hello'},
+                {'type': 'data', 'data': {'foo': 1}}
+            ]:
+                validation = schema_validator(schema, data)
+
+                self.assert_valid(validation)
+
+        with self.subTest('invalid branch'):
+            data = {'type': 'data', 'message': 'Hello', 'data': {'foo': '1'}}
+
+            validation = schema_validator(schema, data)
+
+            self.assertEqual(False, bool(validation))
+            self.assertEqual([], validation.missing_keys)
+            self.assertEqual(['message'], validation.additional_keys)
+            self.assertEqual(
+                [{'path': 'data.foo', 'expected': int, 'actual': str}],
+                validation.type_errors
+            )
+
+        with self.subTest('unknown tag'):
+            validation = schema_validator(schema, {'type': 'info'})
+
+            self.assertEqual(False, bool(validation))
+            self.assertEqual(
+                [{'path': 'type', 'expected': schema, 'actual': str}],
+                validation.type_errors
+            )
+
+        with self.subTest('missing tag'):
+            validation = schema_validator(schema, {'message': 'Hello'})
+
+            self.assertEqual(False, bool(validation))
+            self.assertEqual(['type'], validation.missing_keys)
+
+        with self.subTest('nested in lists'):
+            validation = schema_validator(
+                {'events': [schema]},
+                {'events': [{'type': 'chat', 'message': 'Hello'}, {'type': 'chat', 'message': 1}, 1]}
+            )
+
+            self.assertEqual(False, bool(validation))
+            self.assertEqual(
+                [
+                    {'path': 'events[2]', 'expected': schema, 'actual': int},
+                    {'path': 'message', 'expected': str, 'actual': int}
+                ],
+                validation.type_errors
+            )
+
+    def test_validating_value_constraints(self):
+        schema = {
+            'age': types.Int(min=0, max=150),
+            'score': types.Float(min=0.0),
+            'username': types.Str(min_len=3, max_len=8, pattern=r'^[a-z]+$'),
+            'role': types.Enum('admin', 'user'),
+            'tags': [types.Str(max_len=3)]
+        }
+
+        with self.subTest('valid'):
+            data = {
+                'age': 29,
+                'score': 0.5,
+                'username': 'radorado',
+                'role': 'admin',
+                'tags': ['a', 'abc']
+            }
+
+            validation = schema_validator(schema, data)
+
+            self.assert_valid(validation)
+
+        with self.subTest('constraints are checked'):
+            data = {
+                'age': -1,
+                'score': -0.5,
+                'username': 'RadoRado',
+                'role': 'guest',
+                'tags': ['a', 'abcd']
+            }
+
+            validation = schema_validator(schema, data)
+
+            self.assertEqual(False, bool(validation))
+            self.assertEqual([], validation.missing_keys)
+            self.assertEqual([], validation.additional_keys)
+            self.assertEqual(
+                [
+                    {'path': 'age', 'expected': schema['age'], 'actual': int},
+                    {'path': 'role', 'expected': schema['role'], 'actual': str},
+                    {'path': 'score', 'expected': schema['score'], 'actual': float},
+                    {'path': 'tags[1]', 'expected': schema['tags'][0], 'actual': str},
+                    {'path': 'username', 'expected': schema['username'], 'actual': str}
+                ],
+                validation.type_errors
+            )
+
+        with self.subTest('types are checked'):
+            data = {
+                'age': True,
+                'score': 1,
+                'username': None,
+                'role': 1,
+                'tags': [1]
+            }
+
+            validation = schema_validator(schema, data)
+
+            self.assertEqual(False, bool(validation))
+            self.assertEqual(
+                [
+                    {'path': 'age', 'expected': schema['age'], 'actual': bool},
+                    {'path': 'role', 'expected': schema['role'], 'actual': int},
+                    {'path': 'score', 'expected': schema['score'], 'actual': int},
+                    {'path': 'tags[0]', 'expected': schema['tags'][0], 'actual': int},
+                    {'path': 'username', 'expected': schema['username'], 'actual': None}
+                ],
+                validation.type_errors
+            )
+
+        with self.subTest('enums compare types'):
+            validation = schema_validator({'a': types.Enum(1, 2)}, {'a': True})
+
+            self.assertEqual(False, bool(validation))
+
+        with self.subTest('equal values of other types'):
+            self.assertEqual(True, bool(schema_validator({'a': types.Enum(1, True)}, {'a': True})))
+            self.assertEqual(True, bool(schema_validator({'a': types.Enum(1, True)}, {'a': 1})))
+            self.assertEqual(False, bool(schema_validator({'a': types.Enum(1, 2.0)}, {'a': 2})))
+            self.assertEqual(True, bool(schema_validator({'a': types.Enum(1, 2.0)}, {'a': 2.0})))
+
+    def test_validating_list_lengths(self):
+        schema = {'foo': types.List[int, 1, 3]}
+
+        with self.subTest('valid'):
+            for data in [{'foo': [1]}, {'foo': [1, 2, 3]}]:
+                validation = schema_validator(schema, data)
+
+                self.assert_valid(validation)
+
+        with self.subTest('invalid'):
+            for data in [{'foo': []}, {'foo': [1, 2, 3, 4]}]:
+                validation = schema_validator(schema, data)
+
+                self.assertEqual(False, bool(validation))
+                self.assertEqual(
+                    [{'path': 'foo', 'expected': schema['foo'], 'actual': list}],
+                    validation.type_errors
+                )
+
+        with self.subTest('only max_len'):
+            validation = schema_validator({'foo': types.List[int, None, 1]}, {'foo': []})
+
+            self.assert_valid(validation)
+
+    def test_validating_sampled_lists(self):
+        schema = {'foo': [int], 'bar': [{'baz': int}]}
+        sampling = Sampling(head=2, tail=2, random=2, seed=1)
+
+        with self.subTest('short lists are fully checked'):
+            data = {'foo': [1, 2, 3, 4, 5, 'a'], 'bar': []}
+
+            validation = schema_validator(schema, data, sampling=sampling)
+
+            self.assertEqual(False, bool(validation))
+            self.assertEqual(False, validation.sampled)
+            self.assertEqual([{'path': 'foo[5]', 'expected': int, 'actual': str}], validation.type_errors)
+
+        with self.subTest('long lists are sampled'):
+            data = {'foo': ['a'] * 100, 'bar': [{'baz': 'a'}] * 100}
+
+            validation = schema_validator(schema, data, sampling=sampling)
+
+            self.assertEqual(False, bool(validation))
+            self.assertEqual(True, validation.sampled)
+            self.assertEqual(['bar', 'foo'], validation.sampled_paths)
+            self.assertEqual(12, len(validation.type_errors))
+
+            paths = [error['path'] for error in validation.type_errors if error['path'].startswith('foo')]
+
+            self.assertEqual(6, len(paths))
+            self.assertIn('foo[0]', paths)
+            self.assertIn('foo[1]', paths)
+            self.assertIn('foo[98]', paths)
+            self.assertIn('foo[99]', paths)
+
+        with self.subTest('sampling is repeatable with a seed'):
+            data = {'foo': list(range(100)), 'bar': []}
+            data['foo'][50] = 'a'
+
+            results = [
+                schema_validator(schema, data, sampling=Sampling(head=2, tail=2, random=10, seed=seed)).type_errors
+                for seed in [1, 1, 2, 2]
+            ]
+
+            self.assertEqual(results[0], results[1])
+            self.assertEqual(results[2], results[3])
+
+    def test_validating_tuples(self):
+        schema = {'point': types.Tuple[int, str, types.Optional[float]]}
+
+        with self.subTest('valid'):
+            for point in [(1, 'a', 1.5), [1, 'a', None]]:
+                validation = schema_validator(schema, {'point': point})
+
+                self.assert_valid(validation)
+
+        with self.subTest('invalid items'):
+            validation = schema_validator(schema, {'point': ('a', 'a', 1)})
+
+            self.assertEqual(False, bool(validation))
+            self.assertEqual(
+                [
+                    {'path': 'point[0]', 'expected': int, 'actual': str},
+                    {'path': 'point[2]', 'expected': float, 'actual': int}
+                ],
+                validation.type_errors
+            )
+
+        with self.subTest('invalid length'):
+            validation = schema_validator(schema, {'point': (1, 'a')})
+
+            self.assertEqual(False, bool(validation))
+            self.assertEqual(
+                [{'path': 'point', 'expected': schema['point'], 'actual': tuple}],
+                validation.type_errors
+            )
+
+        with self.subTest('not a sequence'):
+            validation = schema_validator(schema, {'point': 'abc'})
+
+            self.assertEqual(
+                [{'path': 'point', 'expected': schema['point'], 'actual': str}],
+                validation.type_errors
+            )
+
+    def test_validating_dicts_with_dynamic_keys(self):
+        schema = {
+            'stats': types.Dict[str, {'visits': int}],
+            'translations': types.Dict[types.Enum('en', 'bg'), str]
+        }
+
+        with self.subTest('valid'):
+            data = {
+                'stats': {
+                    'user-1': {'visits': 1},
+                    'user-2': {'visits': 2}
+                },
+                'translations': {'en': 'Hello', 'bg': 'Здравей'}
+            }
+
+            validation = schema_validator(schema, data)
+
+            self.assert_valid(validation)
+
+        with self.subTest('empty'):
+            validation = schema_validator(schema, {'stats': {}, 'translations': {}})
+
+            self.assert_valid(validation)
+
+        with self.subTest('invalid'):
+            data = {
+                'stats': {
+                    'user-1': {'visits': '1'},
+                    'user-2': {},
+                    3: {'visits': 3}
+                },
+                'translations': {'de': 'Hallo', 'en': 1}
+            }
+
+            validation = schema_validator(schema, data)
+
+            self.assertEqual(False, bool(validation))
+            self.assertEqual(['stats.user-2.visits'], validation.missing_keys)
+            self.assertEqual([], validation.additional_keys)
+            self.assertEqual(
+                [
+                    {'path': 'stats.3[key]', 'expected': str, 'actual': int},
+                    {'path': 'stats.user-1.visits', 'expected': int, 'actual': str},
+                    {'path': 'translations.de[key]', 'expected': schema['translations'].K, 'actual': str},
+                    {'path': 'translations.en', 'expected': str, 'actual': int}
+                ],
+                validation.type_errors
+            )
+
+        with self.subTest('errors of a key and its value'):
+            validation = schema_validator({'a': types.Dict[str, int]}, {'a': {1: 'x'}})
+
+            self.assertEqual(
+                [
+                    {'path': 'a.1', 'expected': int, 'actual': str},
+                    {'path': 'a.1[key]', 'expected': str, 'actual': int}
+                ],
+                validation.type_errors
+            )
+
+        with self.subTest('not a dict'):
+            validation = schema_validator(schema, {'stats': [], 'translations': {}})
+
+            self.assertEqual(
+                [{'path': 'stats', 'expected': schema['stats'], 'actual': list}],
+                validation.type_errors
+            )
+
+    def test_validating_with_extra_keys_ignored(self):
+        schema = {
+            'id': int,
+            'user': {
+                'name': str,
+                'address': types.Optional[{'city': str}]
+            },
+            'meta': types.Optional[int]
+        }
+
+        data = {
+            'id': 1,
+            'user': {
+                'name': 'Ivan',
+                'address': {'city': 'Sofia', 'zip': '1000'},
+                'age': 30
+            },
+            'meta': {'a': 1},
+            'debug': {'trace': [1, 2, 3]}
+        }
+
+        with self.subTest('extra keys are forbidden by default'):
+            validation = schema_validator(schema, data)
+
+            self.assertEqual(False, bool(validation))
+            self.assertEqual(
+                ['debug', 'debug.trace', 'meta.a', 'user.address.zip', 'user.age'],
+                validation.additional_keys
+            )
+
+        with self.subTest('extra keys are ignored globally'):
+            validation = schema_validator(schema, data, extra='ignore')
+
+            self.assert_valid(validation)
+
+        with self.subTest('missing keys and type errors are still reported'):
+            validation = schema_validator(schema, {'user': {'name': 1, 'age': 30}, 'debug': 1}, extra='ignore')
+
+            self.assertEqual(False, bool(validation))
+            self.assertEqual(['id', 'meta', 'user.address'], validation.missing_keys)
+            self.assertEqual([], validation.additional_keys)
+            self.assertEqual(
+                [{'path': 'user.name', 'expected': str, 'actual': int}],
+                validation.type_errors
+            )
+
+        with self.subTest('extra keys are ignored for a part of the schema'):
+            partial_schema = {**schema, 'user': types.Extra(schema['user'], 'ignore')}
+
+            validation = schema_validator(partial_schema, data)
+
+            self.assertEqual(['debug', 'debug.trace', 'meta.a'], validation.additional_keys)
+
+        with self.subTest('extra keys are forbidden for a part of the schema'):
+            partial_schema = {**schema, 'user': types.Extra(schema['user'], 'forbid')}
+
+            validation = schema_validator(partial_schema, data, extra='ignore')
+
+            self.assertEqual(['user.address.zip', 'user.age'], validation.additional_keys)
+
+        with self.subTest('dictionaries under schemas of other types'):
+            for value_schema in (
+                int,
+                None,
+                types.Int(min=0),
+                types.Str(min_len=1),
+                [int],
+                types.List[int, 1, 2],
+                types.Tuple[int, int]
+            ):
+                with self.subTest(schema=value_schema):
+                    value = {'x': {'y': 1}}
+
+                    validation = schema_validator({'a': value_schema}, {'a': value})
+
+                    self.assertEqual(['a.x', 'a.x.y'], validation.additional_keys)
+
+                    validation = schema_validator({'a': types.Extra(value_schema, 'ignore')}, {'a': value})
+
+                    self.assertEqual([], validation.additional_keys)
+                    self.assertEqual(1, len(validation.type_errors))
+
+        with self.subTest('objects'):
+            user = User(id=1, profile=Profile(email='ivan@example.com', age=30))
+
+            validation = schema_validator({'profile': {'email': str}}, user, objects=True, extra='ignore')
+
+            self.assert_valid(validation)
+
+            validation = schema_validator({'profile': {'name': str}}, user, objects=True, extra='ignore')
+
+            self.assertEqual(['profile.name'], validation.missing_keys)
+            self.assertEqual([], validation.additional_keys)
+
+    def test_validating_with_item_error_policies(self):
+        item = {'id': int, 'address': {'city': str}, 'tags': [str]}
+        data = {
+            'users': [
+                {'id': 1, 'address': {'city': 'Sofia'}, 'tags': []},
+                {'id': '2', 'address': {'city': 2}, 'tags': ['a']},
+                {'id': 3, 'address': {'city': 3}, 'tags': [1, 2]},
+                None,
+                {'id': '5', 'address': {'city': 'Varna'}, 'tags': []}
+            ]
+        }
+
+        with self.subTest('all errors are reported by default'):
+            validation = schema_validator({'users': [item]}, data)
+
+            self.assertEqual(7, len(validation.type_errors))
+            self.assertEqual([], validation.sampled_paths)
+
+        with self.subTest('items are not checked after the limit'):
+            validation = schema_validator({'users': types.ItemErrors([item], limit=2)}, data)
+
+            self.assertEqual(
+                [
+                    {'path': 'address.city', 'expected': str, 'actual': int},
+                    {'path': 'address.city', 'expected': str, 'actual': int},
+                    {'path': 'id', 'expected': int, 'actual': str},
+                    {'path': 'tags[0]', 'expected': str, 'actual': int},
+                    {'path': 'tags[1]', 'expected': str, 'actual': int}
+                ],
+                validation.type_errors
+            )
+            self.assertEqual(['users'], validation.sampled_paths)
+
+        with self.subTest('the first error at every path'):
+            validation = schema_validator({'users': types.ItemErrors([item], per_path=True)}, data)
+
+            self.assertEqual(
+                ['address.city', 'id', 'tags[0]', 'tags[1]', 'users[3]'],
+                [error['path'] for error in validation.type_errors]
+            )
+            self.assertEqual([], validation.sampled_paths)
+
+        with self.subTest('lists of plain types'):
+            schema = {'ids': types.ItemErrors([int], limit=2)}
+
+            validation = schema_validator(schema, {'ids': [1, 'a', 2, None, 'b']})
+
+            self.assertEqual(['ids[1]', 'ids[3]'], [error['path'] for error in validation.type_errors])
+
+            schema = {'ids': types.ItemErrors([types.Int(min=0)], per_path=True)}
+
+            validation = schema_validator(schema, {'ids': [1, -1, -2, 'a']})
+
+            self.assertEqual(['ids[1]'], [error['path'] for error in validation.type_errors])
+
+        with self.subTest('a limit is not reached'):
+            validation = schema_validator({'users': types.ItemErrors([item], limit=10)}, data)
+
+            self.assertEqual(7, len(validation.type_errors))
+            self.assertEqual([], validation.sampled_paths)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,131 @@
+import json
+import pickle
+
+from unittest import TestCase
+
+from simple_schema_validator import ErrorStats, Sampling, compile_schema, types
+
+
+class ErrorStatsTests(TestCase):
+    schema = compile_schema({
+        'id': int,
+        'address': {'city': str},
+        'orders': [{'id': int}],
+        'scores': [types.Int(min=0)],
+        'matrix': [[int]]
+    })
+
+    payloads = [
+        {'id': 1, 'address': {'city': 'Sofia'}, 'orders': [], 'scores': [], 'matrix': []},
+        {'id': '2', 'address': {}, 'orders': [{'id': '1'}, {'id': None}], 'scores': [1, -1], 'matrix': [[1, 'a']]},
+        {'id': 3.0, 'address': {'city': 1, 'zip': 1}, 'orders': [], 'scores': [-2], 'matrix': [[], ['b']], 'x': 1}
+    ]
+
+    def test_counts_by_path(self):
+        stats = ErrorStats()
+
+        self.assertEqual([True, False, False], [stats.validate(self.schema, payload) for payload in self.payloads])
+
+        self.assertEqual(3, stats.validations)
+        self.assertEqual(2, stats.invalid)
+        self.assertEqual(12, stats.errors)
+
+        self.assertEqual({'address.city': 1}, stats.missing_keys)
+        self.assertEqual({'address.zip': 1, 'x': 1}, stats.additional_keys)
+        self.assertEqual(
+            {'id': 2, 'address.city': 1, 'orders[].id': 2, 'scores[]': 2, 'matrix[][]': 2},
+            stats.type_errors
+        )
+
+        self.assertEqual({'int': 2}, stats.expected_types['id'])
+        self.assertEqual({'str': 1, 'float': 1}, stats.actual_types['id'])
+        self.assertEqual({'str': 1, 'None': 1}, stats.actual_types['orders[].id'])
+        self.assertEqual({'types.Int(min=0)': 2}, stats.expected_types['scores[]'])
+
+    def test_results_are_counted_like_validations(self):
+        schema = compile_schema({'id': int, 'address': {'city': str}, 'scores': [types.Int(min=0)], 'matrix': [[int]]})
+
+        validated = ErrorStats()
+        added = ErrorStats()
+
+        for payload in self.payloads:
+            payload = {key: value for key, value in payload.items() if key != 'orders'}
+
+            validated.validate(schema, payload)
+            added.add(schema.validate(payload))
+
+        self.assertEqual(validated.to_dict(), added.to_dict())
+
+    def test_nested_lists_of_dictionaries(self):
+        schema = compile_schema({'a': [{'b': [{'c': int}], 'd': types.ItemErrors([{'e': int}], per_path=True)}]})
+        data = {'a': [{'b': [{'c': '1'}, {'c': 2}], 'd': [{'e': 'x'}, {'e': 'y'}]}, {'b': [{'c': None}], 'd': []}]}
+
+        stats = ErrorStats()
+        stats.validate(schema, data)
+
+        self.assertEqual({'a[].b[].c': 2, 'a[].d[].e': 1}, stats.type_errors)
+
+    def test_per_path_errors_are_counted_like_results(self):
+        cases = [
+            (
+                {'rows': types.ItemErrors([[{'b': int}]], per_path=True)},
+                {'rows': [[{'b': 'x'}, {'b': 'x'}], [{'b': 'x'}]]}
+            ),
+            ({'rows': types.ItemErrors([[int]], per_path=True)}, {'rows': [['x', 'y'], ['z']]}),
+            (
+                {'rows': types.ItemErrors([{'a': [{'b': int}], 'b': int}], per_path=True)},
+                {'rows': [{'a': [{'b': 'x'}, {'b': 'y'}], 'b': 1}, {'a': [], 'b': 'z'}]}
+            )
+        ]
+
+        for schema, data in cases:
+            with self.subTest(schema=schema):
+                schema = compile_schema(schema)
+                validation = schema.validate(data)
+
+                stats = ErrorStats()
+                stats.validate(schema, data)
+
+                self.assertEqual(len(validation.type_errors), stats.errors)
+
+    def test_merge(self):
+        merged = ErrorStats()
+
+        for payload in self.payloads:
+            stats = ErrorStats()
+            stats.validate(self.schema, payload)
+
+            merged.merge(stats)
+
+        whole = ErrorStats()
+
+        for payload in self.payloads:
+            whole.validate(self.schema, payload)
+
+        self.assertEqual(whole.to_dict(), merged.to_dict())
+
+    def test_stats_can_be_sent_to_other_processes(self):
+        stats = ErrorStats()
+
+        for payload in self.payloads:
+            stats.validate(self.schema, payload)
+
+        with self.subTest('pickle'):
+            self.assertEqual(stats.to_dict(), pickle.loads(pickle.dumps(stats)).to_dict())
+
+        with self.subTest('JSON'):
+            self.assertEqual(stats.to_dict(), ErrorStats.from_dict(json.loads(json.dumps(stats.to_dict()))).to_dict())
+
+    def test_sampled_lists(self):
+        stats = ErrorStats()
+
+        stats.validate(
+            compile_schema({'a': [int]}), {'a': list(range(100))}, sampling=Sampling(head=2, tail=2, random=2, seed=1)
+        )
+
+        self.assertEqual({'a': 1}, stats.sampled_paths)
+        self.assertEqual(0, stats.invalid)
+
+    def test_schemas_must_be_compiled(self):
+        with self.assertRaises(TypeError):
+            ErrorStats().validate({'a': int}, {'a': 1})
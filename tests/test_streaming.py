@@ -0,0 +1,159 @@
+from collections import Counter
+from collections.abc import Mapping
+from itertools import islice
+from unittest import TestCase
+
+from simple_schema_validator import Sampling, compile_schema, iter_errors, types
+from simple_schema_validator.streaming import ErrorEvent
+
+
+class CountedMapping(Mapping):
+    """
+    Counts the keys, which were iterated.
+    """
+    def __init__(self, data):
+        self.data = data
+        self.iterated = 0
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+    def __iter__(self):
+        for key in self.data:
+            self.iterated += 1
+            yield key
+
+    def __len__(self):
+        return len(self.data)
+
+
+class IterErrorsTests(TestCase):
+    schema = compile_schema({
+        'id': int,
+        'address': {'city': str, 'zip': str},
+        'orders': [{'id': int, 'items': [{'sku': str}]}],
+        'scores': [int],
+        'tags': types.Optional[[str]]
+    })
+
+    data = {
+        'id': '1',
+        'address': {'city': 1},
+        'orders': [
+            {'id': '1', 'items': [{'sku': 1}, {'sku': 'a'}]},
+            {'id': 2, 'items': []},
+            {'id': '3', 'items': [{'sku': 2}], 'note': 'x'}
+        ],
+        'scores': [1, 'a', 2, 'b'],
+        'tags': None,
+        'debug': {'trace': 1}
+    }
+
+    def test_events_are_the_errors_of_validate(self):
+        validation = self.schema.validate(self.data)
+
+        events = list(iter_errors(self.schema, self.data))
+
+        self.assertEqual(
+            Counter(validation.missing_keys),
+            Counter(event.path for event in events if event.kind == 'missing')
+        )
+        self.assertEqual(
+            Counter(validation.additional_keys),
+            Counter(event.path for event in events if event.kind == 'additional')
+        )
+        self.assertEqual(
+            Counter((error['path'], error['expected'], error['actual']) for error in validation.type_errors),
+            Counter((event.path, event.expected, event.actual) for event in events if event.kind == 'type_error')
+        )
+
+    def test_dictionaries_with_dynamic_keys(self):
+        data = {'m': {'k': {'x': 1}, 'l': 1, 'n': 'a', 'o': {'x': {'y': 2}}}}
+
+        for schema in (
+            {'m': types.Dict[str, int]},
+            {'m': types.Dict[str, types.Int()]},
+            {'m': types.Dict[types.Str(min_len=2), types.Optional[str]]}
+        ):
+            with self.subTest(schema=schema):
+                validation = compile_schema(schema).validate(data)
+                events = list(iter_errors(schema, data))
+
+                self.assertEqual(
+                    Counter(validation.additional_keys),
+                    Counter(event.path for event in events if event.kind == 'additional')
+                )
+                self.assertEqual(
+                    Counter(error['path'] for error in validation.type_errors),
+                    Counter(event.path for event in events if event.kind == 'type_error')
+                )
+
+    def test_events_are_yielded_in_traversal_order(self):
+        events = iter_errors({'a': [int], 'b': int}, {'a': ['x', 1, 'y'], 'b': 'z'})
+
+        self.assertEqual(ErrorEvent('type_error', 'a[0]', int, str), next(events))
+        self.assertEqual(
+            [ErrorEvent('type_error', 'b', int, str), ErrorEvent('type_error', 'a[2]', int, str)],
+            list(events)
+        )
+
+    def test_iteration_can_stop_early(self):
+        data = {**self.data, 'scores': ['a'] * 100000}
+
+        first = list(islice(iter_errors(self.schema, data), 3))
+
+        self.assertEqual(3, len(first))
+
+    def test_valid_data_has_no_events(self):
+        data = {'id': 1, 'address': {'city': 'a', 'zip': 'b'}, 'orders': [], 'scores': [], 'tags': ['a']}
+
+        self.assertEqual([], list(iter_errors(self.schema, data)))
+
+    def test_not_a_dictionary(self):
+        self.assertEqual(
+            [ErrorEvent('type_error', '', {'a': int}, list), ErrorEvent('missing', 'a')],
+            list(iter_errors({'a': int}, []))
+        )
+
+    def test_sampled_lists(self):
+        data = {**self.data, 'scores': [1] * 100}
+
+        events = list(iter_errors(self.schema, data, sampling=Sampling(head=2, tail=2, random=2, seed=1)))
+
+        self.assertIn(ErrorEvent('sampled', 'scores'), events)
+
+    def test_item_error_limits(self):
+        schema = {'orders': types.ItemErrors([{'id': int}], limit=1)}
+
+        events = list(iter_errors(schema, {'orders': [{'id': 'a'}, {'id': 'b'}]}))
+
+        self.assertEqual([ErrorEvent('type_error', 'id', int, str), ErrorEvent('sampled', 'orders')], events)
+
+    def test_wide_dictionaries_are_yielded_key_by_key(self):
+        wide = CountedMapping({str(i): {'a': i} for i in range(10000)})
+
+        with self.subTest('additional keys'):
+            events = iter_errors({'id': int}, CountedMapping({'id': 1, 'x': wide}), strict=False)
+
+            self.assertEqual(ErrorEvent('additional', 'x'), next(events))
+            self.assertEqual(ErrorEvent('additional', 'x.0'), next(events))
+            self.assertEqual(ErrorEvent('additional', 'x.0.a'), next(events))
+            self.assertLess(wide.iterated, 3)
+
+        wide.iterated = 0
+
+        with self.subTest('types.Dict'):
+            events = iter_errors({'x': types.Dict[str, {'a': str}]}, {'x': wide}, strict=False)
+
+            self.assertEqual(ErrorEvent('type_error', 'x.0.a', str, int), next(events))
+            self.assertLess(wide.iterated, 3)
+
+            self.assertEqual(10000, sum(1 for _ in events) + 1)
+
+    def test_events_are_hashable(self):
+        events = set(iter_errors({'a': [int]}, {'a': ['x', 'x']}))
+
+        self.assertEqual(
+            {ErrorEvent('type_error', 'a[0]', int, str), ErrorEvent('type_error', 'a[1]', int, str)},
+            events
+        )
@@ -0,0 +1,101 @@
+from dataclasses import dataclass
+
+from threading import Barrier, Thread
+
+from unittest import TestCase
+
+from simple_schema_validator import compile_schema, parse, types, Sampling
+
+
+@dataclass
+class Item:
+    id: int
+    name: str
+
+
+class ThreadSafetyTests(TestCase):
+    threads = 8
+    iterations = 200
+
+    def run_in_threads(self, function):
+        barrier = Barrier(self.threads)
+        results = [None] * self.threads
+        errors = []
+
+        def run(index):
+            barrier.wait()
+
+            try:
+                results[index] = [function() for _ in range(self.iterations)]
+            except Exception as e:
+                errors.append(e)
+
+        threads = [Thread(target=run, args=(index,)) for index in range(self.threads)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([], errors)
+
+        return [result for thread_results in results for result in thread_results]
+
+    def test_shared_compiled_schema(self):
+        schema = compile_schema(
+            {
+                'id': types.Int(min=0),
+                'value': types.Union[int, str, None],
+                'tree': types.Ref('Tree'),
+                'items': [{'id': int, 'name': str}]
+            },
+            definitions={'Tree': {'children': [types.Ref('Tree')]}}
+        )
+
+        datasets = [
+            {'id': 1, 'value': 'a', 'tree': {'children': [{'children': []}]}, 'items': [{'id': 1, 'name': 'a'}]},
+            {'id': -1, 'value': 1.5, 'tree': {'children': [{}]}, 'items': [{'id': 'a'}, 1], 'other': {'a': 1}}
+        ]
+
+        def summarize(validation):
+            return (
+                bool(validation),
+                validation.missing_keys,
+                validation.additional_keys,
+                [(error['path'], error['actual']) for error in validation.type_errors]
+            )
+
+        expected = [summarize(schema.validate(data)) for data in datasets]
+
+        results = self.run_in_threads(lambda: [summarize(schema.validate(data)) for data in datasets])
+
+        for result in results:
+            self.assertEqual(expected, result)
+
+    def test_shared_object_schema_with_a_cold_cache(self):
+        @dataclass
+        class Fresh:
+            id: int
+            items: list
+
+        schema = compile_schema({'id': int, 'items': [{'id': int, 'name': str}]}, objects=True)
+
+        data = Fresh(id=1, items=[Item(id=1, name='a'), Item(id=2, name=2)])
+
+        results = self.run_in_threads(lambda: [error['path'] for error in schema.validate(data).type_errors])
+
+        for result in results:
+            self.assertEqual(['name'], result)
+
+    def test_shared_schema_with_sampling_and_parsing(self):
+        schema = compile_schema({'values': [int]}, coerce=True)
+        sampling = Sampling(head=2, tail=2, random=2, seed=1)
+        data = {'values': ['1', 2, *range(100), 'a']}
+
+        expected = (schema.validate(data, sampling).type_errors, parse(schema, data)[0])
+
+        results = self.run_in_threads(lambda: (schema.validate(data, sampling).type_errors, parse(schema, data)[0]))
+
+        for result in results:
+            self.assertEqual(expected, result)
@@ -1,40 +1,9 @@
 from unittest import TestCase
 
-from simple_schema_validator.utils import get_paths, set_nested
+from simple_schema_validator.utils import set_nested
 
 
 class UtilsTests(TestCase):
-    def test_get_paths(self):
-        data = {
-            'a': 1,
-            'b': {
-                'c': 2,
-                'd': {
-                    'f': 3
-                }
-            }
-        }
-
-        paths = get_paths(data)
-
-        self.assertEqual(
-            {
-                'a': 1,
-                'b': {
-                    'c': 2,
-                    'd': {
-                        'f': 3
-                    }
-                },
-                'b.c': 2,
-                'b.d': {
-                    'f': 3
-                },
-                'b.d.f': 3
-            },
-            paths
-        )
-
     def test_set_nested(self):
         value = 'foo'
 
@@ -0,0 +1,62 @@
+from unittest import TestCase
+
+from simple_schema_validator import Sampling, Validator, compile_schema, types
+from simple_schema_validator.result import SchemaValidationResult
+
+
+class ValidatorTests(TestCase):
+    schema = compile_schema({
+        'id': int,
+        'name': types.Optional[str],
+        'orders': [{'id': int, 'total': float}],
+        'scores': [int]
+    })
+
+    valid = {'id': 1, 'name': None, 'orders': [{'id': 1, 'total': 1.5}], 'scores': [1, 2]}
+
+    invalid = {'id': '1', 'orders': [{'id': 1, 'total': 1}, {'id': '2', 'total': 1.5}], 'scores': [1, 'a'], 'x': 1}
+
+    def assertSameResult(self, expected, actual):
+        self.assertEqual(bool(expected), bool(actual))
+        self.assertEqual(expected.missing_keys, actual.missing_keys)
+        self.assertEqual(expected.additional_keys, actual.additional_keys)
+        self.assertEqual(expected.type_errors, actual.type_errors)
+        self.assertEqual(expected.sampled_paths, actual.sampled_paths)
+
+    def test_results_are_the_same_as_validate(self):
+        validator = Validator(self.schema)
+
+        for data in (self.valid, self.invalid, self.valid, 1):
+            with self.subTest(data=data):
+                self.assertSameResult(self.schema.validate(data), validator.validate(data))
+
+    def test_validate_into_refills_the_result(self):
+        validator = Validator(self.schema)
+        result = SchemaValidationResult.empty()
+        type_errors = result.type_errors
+
+        self.assertIs(result, validator.validate_into(self.invalid, result))
+        self.assertSameResult(self.schema.validate(self.invalid), result)
+
+        validator.validate_into(self.valid, result)
+
+        self.assertSameResult(self.schema.validate(self.valid), result)
+        self.assertIs(type_errors, result.type_errors)
+
+    def test_results_are_independent(self):
+        validator = Validator(self.schema)
+
+        first = validator.validate_into(self.invalid, SchemaValidationResult.empty())
+        validator.validate_into(self.valid, SchemaValidationResult.empty())
+
+        self.assertSameResult(self.schema.validate(self.invalid), first)
+
+    def test_sampling_is_repeatable(self):
+        sampling = Sampling(head=2, tail=2, random=2, seed=1)
+        validator = Validator(self.schema, sampling)
+        data = {**self.valid, 'scores': [str(index) for index in range(100)]}
+
+        expected = self.schema.validate(data, sampling)
+
+        for _ in range(3):
+            self.assertSameResult(expected, validator.validate(data))